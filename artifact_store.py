@@ -0,0 +1,294 @@
+"""Content-addressed store for generated artifacts.
+
+Usage:
+    python artifact_store.py stats [--store DIR]
+    python artifact_store.py gc    [--store DIR] [--dry-run]
+
+Each artifact is stored once under objects/<sha256[:2]>/<sha256> and made
+read-only. Output folders get it through `materialise`:
+
+- reflink (the default): a copy-on-write clone (FICLONE on Btrfs/XFS). It
+  shares blocks with the blob until written, yet is a private, writable
+  file, so it suits forms people edit; where cloning is not supported it
+  falls back to a plain copy;
+- hardlink (opt-in): the same inode; it stays read-only, so an in-place
+  edit fails instead of silently changing every other copy (`unshare`
+  first). Only for artifacts meant to stay read-only;
+- copy: always a full private copy;
+- auto: reflink, then hardlink, then copy.
+
+Every materialised path is recorded in refs.json. `gc` drops refs whose
+path is gone or has since been edited, then deletes blobs nothing refers to.
+"""
+import argparse
+import errno
+import hashlib
+import json
+import os
+import shutil
+import stat
+import sys
+import tempfile
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+# ---------- CONFIG ----------
+BASE_DIR = r"C:\Users\victo\kickoff_project"
+STORE_DIR = os.path.join(BASE_DIR, ".artifact_store")
+
+LINK_MODES = ("auto", "reflink", "hardlink", "copy")
+FICLONE = 0x40049409  # _IOW(0x94, 9, int) from linux/fs.h
+CHUNK_BYTES = 1024 * 1024
+READ_ONLY = stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH
+
+
+# ---------- LINK HELPERS ----------
+
+def _reflink(src, dest):
+    if fcntl is None or not sys.platform.startswith("linux"):
+        raise OSError(errno.EOPNOTSUPP, "reflink not supported on this platform")
+    with open(src, "rb") as fin, open(dest, "wb") as fout:
+        fcntl.ioctl(fout.fileno(), FICLONE, fin.fileno())
+
+
+def _hardlink(src, dest):
+    os.link(src, dest)
+
+
+def _copy(src, dest):
+    shutil.copyfile(src, dest)
+
+
+_LINKERS = {"reflink": _reflink, "hardlink": _hardlink, "copy": _copy}
+
+
+def _remove(path):
+    # Read-only files cannot be removed on Windows. Elsewhere leave the mode
+    # alone: a hardlinked path shares it with its blob.
+    if os.name == "nt":
+        os.chmod(path, stat.S_IRUSR | stat.S_IWUSR)
+    os.remove(path)
+
+
+def _replace(src, dest):
+    try:
+        os.replace(src, dest)
+    except PermissionError:
+        # Windows refuses to rename over a read-only file.
+        _remove(dest)
+        os.replace(src, dest)
+
+
+# ---------- STORE ----------
+
+class ArtifactStore:
+    def __init__(self, root=STORE_DIR):
+        self.root = root
+        self.objects_dir = os.path.join(root, "objects")
+        self.tmp_dir = os.path.join(root, "tmp")
+        self.refs_path = os.path.join(root, "refs.json")
+        self._refs = None
+
+    # --- blobs ---
+
+    def blob_path(self, digest):
+        return os.path.join(self.objects_dir, digest[:2], digest)
+
+    def has(self, digest):
+        return os.path.exists(self.blob_path(digest))
+
+    def _adopt(self, tmp_path, digest):
+        """Move a fully written temp file into place as blob `digest`."""
+        path = self.blob_path(digest)
+        if os.path.exists(path):
+            _remove(tmp_path)
+            return digest
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        os.chmod(tmp_path, READ_ONLY)
+        try:
+            os.replace(tmp_path, path)
+        except OSError:
+            # Another process stored the same content first.
+            if not os.path.exists(path):
+                raise
+            _remove(tmp_path)
+        return digest
+
+    def put_with(self, write):
+        """Store whatever `write(path)` writes to a temp path; return its digest.
+
+        Safe to call from several processes at once: blobs are immutable and
+        named by content, so concurrent writers of the same bytes converge.
+        """
+        os.makedirs(self.tmp_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.tmp_dir)
+        os.close(fd)
+        try:
+            write(tmp_path)
+            h = hashlib.sha256()
+            with open(tmp_path, "rb") as f:
+                for chunk in iter(lambda: f.read(CHUNK_BYTES), b""):
+                    h.update(chunk)
+        except BaseException:
+            _remove(tmp_path)
+            raise
+        return self._adopt(tmp_path, h.hexdigest())
+
+    def put_file(self, path):
+        return self.put_with(lambda tmp_path: shutil.copyfile(path, tmp_path))
+
+    def put_bytes(self, data):
+        def write(tmp_path):
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+        return self.put_with(write)
+
+    # --- refs ---
+
+    @property
+    def refs(self):
+        if self._refs is None:
+            if os.path.exists(self.refs_path):
+                with open(self.refs_path, encoding="utf-8") as f:
+                    self._refs = json.load(f)
+            else:
+                self._refs = {}
+        return self._refs
+
+    def save_refs(self):
+        os.makedirs(self.root, exist_ok=True)
+        tmp_path = self.refs_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.refs, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.refs_path)
+
+    def _ref_is_live(self, dest, ref):
+        try:
+            st = os.stat(dest)
+        except FileNotFoundError:
+            return False
+        return st.st_size == ref["size"] and st.st_mtime_ns == ref["mtime_ns"]
+
+    # --- materialise ---
+
+    def materialise(self, digest, dest, mode="reflink"):
+        """Place blob `digest` at `dest`; return the link mode that was used.
+
+        The file is built next to `dest` and renamed over it, so readers
+        never see a half-written file. Refs are updated in memory; call
+        `save_refs` once a batch is done.
+        """
+        if mode not in LINK_MODES:
+            raise ValueError(f"Unknown link mode {mode!r}; choose from {', '.join(LINK_MODES)}")
+        src = self.blob_path(digest)
+        if not os.path.exists(src):
+            raise FileNotFoundError(f"No blob {digest} in {self.root}")
+        dest = os.path.abspath(dest)
+
+        ref = self.refs.get(dest)
+        if ref and ref["digest"] == digest and self._ref_is_live(dest, ref):
+            return ref["mode"]
+
+        os.makedirs(os.path.dirname(dest), exist_ok=True)
+        candidates = {
+            "auto": ("reflink", "hardlink", "copy"),
+            "reflink": ("reflink", "copy"),
+        }.get(mode, (mode,))
+        tmp_path = f"{dest}.{os.getpid()}.tmp"
+        for used in candidates:
+            try:
+                _LINKERS[used](src, tmp_path)
+                break
+            except OSError:
+                if os.path.exists(tmp_path):
+                    _remove(tmp_path)
+                if used == candidates[-1]:
+                    raise
+        _replace(tmp_path, dest)
+
+        st = os.stat(dest)
+        self.refs[dest] = {
+            "digest": digest, "mode": used, "size": st.st_size, "mtime_ns": st.st_mtime_ns,
+        }
+        return used
+
+    def unshare(self, dest):
+        """Turn a materialised file into a private writable copy before editing."""
+        dest = os.path.abspath(dest)
+        tmp_path = f"{dest}.{os.getpid()}.tmp"
+        shutil.copyfile(dest, tmp_path)
+        _replace(tmp_path, dest)
+        self.refs.pop(dest, None)
+
+    # --- maintenance ---
+
+    def iter_blobs(self):
+        if not os.path.isdir(self.objects_dir):
+            return
+        for prefix in sorted(os.listdir(self.objects_dir)):
+            folder = os.path.join(self.objects_dir, prefix)
+            for digest in sorted(os.listdir(folder)):
+                yield digest, os.path.join(folder, digest)
+
+    def stats(self):
+        blobs = list(self.iter_blobs())
+        modes = {}
+        for ref in self.refs.values():
+            modes[ref["mode"]] = modes.get(ref["mode"], 0) + 1
+        return {
+            "blobs": len(blobs),
+            "blob_bytes": sum(os.path.getsize(p) for _, p in blobs),
+            "refs": len(self.refs),
+            "modes": modes,
+        }
+
+    def gc(self, dry_run=False):
+        """Drop stale refs and delete unreferenced blobs; return (blobs, bytes)."""
+        live = {}
+        for dest, ref in self.refs.items():
+            if self._ref_is_live(dest, ref):
+                live[dest] = ref
+        wanted = {ref["digest"] for ref in live.values()}
+
+        removed = freed = 0
+        for digest, path in self.iter_blobs():
+            if digest not in wanted:
+                removed += 1
+                freed += os.path.getsize(path)
+                if not dry_run:
+                    _remove(path)
+        if not dry_run:
+            self._refs = live
+            self.save_refs()
+            if os.path.isdir(self.tmp_dir):
+                shutil.rmtree(self.tmp_dir, ignore_errors=True)
+        return removed, freed
+
+
+# ---------- MAIN ----------
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Inspect or garbage-collect the artifact store.")
+    parser.add_argument("command", choices=("stats", "gc"))
+    parser.add_argument("--store", default=STORE_DIR)
+    parser.add_argument("--dry-run", action="store_true", help="gc: report only")
+    args = parser.parse_args(argv)
+
+    store = ArtifactStore(args.store)
+    if args.command == "stats":
+        s = store.stats()
+        modes = ", ".join(f"{k}: {v}" for k, v in sorted(s["modes"].items())) or "-"
+        print(f"{s['blobs']} blobs ({s['blob_bytes'] / 1024:.1f} KB), "
+              f"{s['refs']} materialised paths ({modes})")
+    else:
+        removed, freed = store.gc(dry_run=args.dry_run)
+        verb = "Would remove" if args.dry_run else "Removed"
+        print(f"{verb} {removed} unreferenced blobs ({freed / 1024:.1f} KB)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
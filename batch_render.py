@@ -0,0 +1,77 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+
+# ---------- HELPERS ----------
+
+def chunked(items, size):
+    """Split `items` into lists of at most `size` elements."""
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+
+def _run_chunk(render_job, chunk):
+    """Render every job in `chunk` inside one worker; return per-job timings."""
+    pid = os.getpid()
+    results = []
+    for job in chunk:
+        start = time.perf_counter()
+        output = render_job(job)
+        results.append((pid, time.perf_counter() - start, output))
+    return results
+
+
+def run_batch(render_job, jobs, workers=None, chunksize=None, initializer=None,
+              initargs=()):
+    """Render `jobs` across a process pool and return a timing report.
+
+    `render_job` must be a module-level function (so it can be pickled) that
+    takes one job and returns the output path it wrote. `initializer` runs
+    once per worker and is the place to pay heavy imports (python-docx,
+    python-pptx) a single time instead of once per document.
+    """
+    jobs = list(jobs)
+    workers = workers or os.cpu_count() or 1
+    if chunksize is None:
+        # Small enough to keep every worker busy, large enough to amortise IPC.
+        chunksize = max(1, min(50, len(jobs) // (workers * 4) or 1))
+
+    start = time.perf_counter()
+    per_worker = {}
+    outputs = []
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=initializer, initargs=initargs
+    ) as pool:
+        futures = [
+            pool.submit(_run_chunk, render_job, chunk)
+            for chunk in chunked(jobs, chunksize)
+        ]
+        for future in futures:
+            for pid, seconds, output in future.result():
+                stats = per_worker.setdefault(pid, {"docs": 0, "busy": 0.0})
+                stats["docs"] += 1
+                stats["busy"] += seconds
+                outputs.append(output)
+    wall = time.perf_counter() - start
+
+    return {
+        "docs": len(outputs),
+        "wall": wall,
+        "docs_per_sec": len(outputs) / wall if wall else 0.0,
+        "workers": per_worker,
+        "outputs": outputs,
+    }
+
+
+def print_report(report, noun="doc"):
+    print(
+        f"Rendered {report['docs']} {noun}s in {report['wall']:.2f}s "
+        f"({report['docs_per_sec']:.1f} {noun}s/sec) "
+        f"on {len(report['workers'])} worker(s)"
+    )
+    for pid, stats in sorted(report["workers"].items()):
+        mean_ms = stats["busy"] / stats["docs"] * 1000 if stats["docs"] else 0.0
+        print(
+            f"  worker {pid}: {stats['docs']} {noun}s, "
+            f"busy {stats['busy']:.2f}s, {mean_ms:.1f} ms/{noun}"
+        )
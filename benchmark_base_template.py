@@ -0,0 +1,84 @@
+"""Benchmark the trimmed base template against python-docx's default one.
+
+Usage:
+    python benchmark_base_template.py [--repeat 20]
+
+For a bare document and each SPEC-based deliverable, builds the document
+on `Document()` (the previous starting point: Normal set to Calibri 10 pt
+and the header / footer added) and on `docx_base.new_document()`, then
+prints the bytes save_package writes and the median template load + save
+time per document. Content rendering is excluded from the timing; it is the
+same on both templates.
+"""
+import argparse
+import importlib
+import os
+import statistics
+import tempfile
+import time
+
+from docx import Document
+from docx.oxml.ns import qn
+from docx.shared import Pt
+
+import docx_base
+from package_writer import save_package
+from render_plan import PLAN_SOURCES, render_spec
+
+
+def legacy_document(module=None):
+    """The previous new_document(): python-docx's default template plus Normal."""
+    doc = Document()
+    style = doc.styles["Normal"]
+    style.font.name = "Calibri"
+    style._element.rPr.rFonts.set(qn("w:eastAsia"), "Calibri")
+    style.font.size = Pt(10)
+    if module is not None:
+        module.set_header_footer(doc.sections[0])
+    return doc
+
+
+def trimmed_document(module=None):
+    if module is not None:
+        return module.new_document()
+    return docx_base.new_document()
+
+
+def measure(new_doc, module, path, repeat):
+    """(bytes written, median load + save seconds) for one document."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        doc = new_doc(module)
+        load = time.perf_counter() - start
+        if module is not None:
+            render_spec(doc, module.SPEC, module.HELPERS)
+        start = time.perf_counter()
+        save_package(doc, path)
+        timings.append(load + time.perf_counter() - start)
+    return os.path.getsize(path), statistics.median(timings)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    docx_base.base_template()  # built once per process; not part of the per-document cost
+    cases = [("bare document", None)]
+    cases += [(name, importlib.import_module(source)) for name, source in PLAN_SOURCES.items()]
+
+    print(f"{'document':<26} {'default KB':>10} {'trimmed KB':>10} {'saved':>6}"
+          f" {'default ms':>10} {'trimmed ms':>10} {'speed-up':>8}")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for name, module in cases:
+            path = os.path.join(tmp_dir, "bench.docx")
+            old_bytes, old_s = measure(legacy_document, module, path, args.repeat)
+            new_bytes, new_s = measure(trimmed_document, module, path, args.repeat)
+            print(f"{name:<26} {old_bytes / 1024:>10.1f} {new_bytes / 1024:>10.1f}"
+                  f" {1 - new_bytes / old_bytes:>6.0%} {old_s * 1000:>10.1f}"
+                  f" {new_s * 1000:>10.1f} {old_s / new_s:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
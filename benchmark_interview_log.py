@@ -0,0 +1,91 @@
+"""Benchmark the streaming Discovery Interview Log writer.
+
+Usage:
+    python benchmark_interview_log.py [--rows 10000 100000 1000000]
+
+Each size runs in a fresh process: synthetic records are written to a JSONL
+file, streamed through `write_interview_log`, and the run reports rows/sec
+and peak memory (RSS; traced Python heap on Windows). Flat peak memory
+across sizes is the point of the write-only path.
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+from create_discovery_interview_log import iter_interview_records, rows, write_interview_log
+
+
+def write_synthetic_jsonl(path, n):
+    keys = [
+        "Interview ID", "Stakeholder Type", "Organisation / School", "Interviewee Name",
+        "Country", "Sector", "Date", "Key Themes", "Pain Points", "Opportunities",
+        "Follow-ups", "Satisfaction (1-5)", "Priority Level", "Linked File",
+    ]
+    with open(path, "w", encoding="utf-8") as f:
+        for i in range(n):
+            sample = rows[i % len(rows)]
+            record = dict(zip(keys, sample))
+            record["Interview ID"] = f"INT-{i + 1:07d}"
+            f.write(json.dumps(record) + "\n")
+
+
+def peak_memory_mb():
+    """Peak RSS of this process; traced Python heap where RSS is unavailable."""
+    if resource is None:
+        return tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+    # ru_maxrss is KiB on Linux, bytes on macOS.
+    scale = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / scale
+
+
+def _run_one(n, workdir, queue):
+    src = os.path.join(workdir, f"interviews_{n}.jsonl")
+    out = os.path.join(workdir, f"log_{n}.xlsx")
+    write_synthetic_jsonl(src, n)
+
+    if resource is None:
+        tracemalloc.start()
+    start = time.perf_counter()
+    count = write_interview_log(out, iter_interview_records(src))
+    elapsed = time.perf_counter() - start
+
+    queue.put({
+        "rows": count,
+        "seconds": elapsed,
+        "rows_per_sec": count / elapsed,
+        "peak_mb": peak_memory_mb(),
+        "output_mb": os.path.getsize(out) / (1024 * 1024),
+    })
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 100_000])
+    args = parser.parse_args(argv)
+
+    print(f"{'rows':>10} {'seconds':>9} {'rows/sec':>10} {'peak MB':>8} {'xlsx MB':>8}")
+    with tempfile.TemporaryDirectory() as workdir:
+        for n in args.rows:
+            queue = multiprocessing.Queue()
+            proc = multiprocessing.Process(target=_run_one, args=(n, workdir, queue))
+            proc.start()
+            r = queue.get()
+            proc.join()
+            print(
+                f"{r['rows']:>10} {r['seconds']:>9.2f} {r['rows_per_sec']:>10.0f} "
+                f"{r['peak_mb']:>8.1f} {r['output_mb']:>8.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
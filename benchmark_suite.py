@@ -0,0 +1,353 @@
+"""Benchmark every generator at scaled synthetic input sizes.
+
+Usage:
+    python benchmark_suite.py [--scale small|full] [--case NAME ...]
+                              [--save-baseline] [--tolerance 0.25]
+                              [--skip-startup]
+
+Cases (input that is scaled):
+    userstories         stories in the Word + Excel backlog
+    interview_log       rows in Discovery_Interview_Log.xlsx
+    discovery_template  questions per stakeholder section
+    governance_matrix   rows in an add_matrix_table RBAC/RLS matrix
+    matrix_streaming    the same matrix streamed through StreamingDocxWriter
+    brd_plan            tenant BRDs written from the compiled render plan
+
+Each (case, size) runs in a fresh process and records wall time, peak RSS
+and output bytes. Results are compared with benchmark_baseline.json when it
+exists; a metric that exceeds its baseline by more than the tolerance is a
+regression and the run exits with status 1. --save-baseline records the
+current results as the new baseline.
+
+The CLI cold start (`ue_cli.py list` and `build --dry-run`) is also timed
+against ue_cli.COLD_START_BUDGET_S, with an -X importtime breakdown of the
+slowest imports; exceeding the budget, or importing python-docx,
+openpyxl, python-pptx or lxml on those paths, also fails the run.
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from queue import Empty
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+from package_writer import save_package
+
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+BASELINE_PATH = os.path.join(REPO_DIR, "benchmark_baseline.json")
+
+SIZES = {
+    "small": {
+        "userstories": [10, 1_000, 10_000],
+        "interview_log": [10, 1_000, 10_000],
+        "discovery_template": [10, 100, 500],
+        "governance_matrix": [10, 1_000, 10_000],
+        "matrix_streaming": [10, 1_000, 10_000],
+        "brd_plan": [10, 100, 1_000],
+    },
+    "full": {
+        "userstories": [10, 1_000, 10_000, 100_000],
+        "interview_log": [10, 1_000, 10_000, 100_000],
+        "discovery_template": [10, 100, 1_000, 5_000],
+        "governance_matrix": [10, 1_000, 10_000, 100_000],
+        "matrix_streaming": [10, 1_000, 10_000, 100_000],
+        "brd_plan": [10, 100, 1_000, 10_000],
+    },
+}
+
+# Output size is deterministic for a given input, so allow only small drift.
+BYTES_TOLERANCE = 0.05
+# Ignore differences below these floors; small cases are dominated by jitter.
+MIN_DELTA = {"wall_s": 0.25, "peak_rss_mb": 5.0, "output_bytes": 1024}
+# How often run_case checks that a case process is still alive.
+POLL_S = 1.0
+
+
+# ---------- CASES ----------
+
+def case_userstories(n, outdir):
+    from generate_userstories_docs import (
+        Backlog, build_userstories_xlsx, epics, write_userstories_docx,
+    )
+
+    stories = [
+        (f"US-{i:06d}", "Org Admin", f"perform backlog action {i}",
+         "keep the programme on track", f"Acceptance criterion for story {i}.", "High",
+         epics[i % len(epics)][0])
+        for i in range(1, n + 1)
+    ]
+    backlog = Backlog(epics, stories)
+    docx_path = os.path.join(outdir, "userstories.docx")
+    xlsx_path = os.path.join(outdir, "userstories.xlsx")
+    write_userstories_docx(backlog, docx_path)
+    save_package(build_userstories_xlsx(backlog), xlsx_path)
+    return [docx_path, xlsx_path]
+
+
+def case_interview_log(n, outdir):
+    from create_discovery_interview_log import rows, write_interview_log
+
+    def records():
+        for i in range(n):
+            row = list(rows[i % len(rows)])
+            row[0] = f"INT-{i + 1:07d}"
+            yield row
+
+    path = os.path.join(outdir, "interview_log.xlsx")
+    write_interview_log(path, records())
+    return [path]
+
+
+def case_discovery_template(n, outdir):
+    from generate_discovery_template import SECTIONS, build_discovery_template
+
+    sections = [
+        (title, [f"{questions[i % len(questions)]} ({i})" for i in range(n)])
+        for title, questions in SECTIONS
+    ]
+    path = os.path.join(outdir, "discovery_template.docx")
+    save_package(build_discovery_template(sections), path)
+    return [path]
+
+
+def case_governance_matrix(n, outdir):
+    from docx import Document
+    from generate_phase3_data_governance_doc import add_matrix_table
+
+    doc = Document()
+    add_matrix_table(
+        doc,
+        "2. RBAC Implementation Matrix",
+        ["Role", "System Capabilities (Examples)", "Technical Notes"],
+        [[f"Role {i}", f"Capability {i} within org scope.", f"Filter by org_id {i}."]
+         for i in range(n)],
+    )
+    path = os.path.join(outdir, "governance_matrix.docx")
+    save_package(doc, path)
+    return [path]
+
+
+def case_matrix_streaming(n, outdir):
+    from docx import Document
+    from generate_phase3_data_governance_doc import BODY_RPR, FIRST_COL_RPR, HEADER_RPR
+    from streaming_docx import StreamingDocxWriter
+
+    path = os.path.join(outdir, "matrix_streaming.docx")
+    with StreamingDocxWriter(Document(), path) as out:
+        out.paragraph("2. RBAC Implementation Matrix", HEADER_RPR)
+        out.table(
+            ["Role", "System Capabilities (Examples)", "Technical Notes"],
+            ([f"Role {i}", f"Capability {i} within org scope.", f"Filter by org_id {i}."]
+             for i in range(n)),
+            header_rpr=HEADER_RPR,
+            body_rprs=(FIRST_COL_RPR, BODY_RPR),
+        )
+    return [path]
+
+
+def case_brd_plan(n, outdir):
+    from render_plan import load_render_plan
+
+    plan = load_render_plan("brd", os.path.join(outdir, ".render_plans"))
+    paths = []
+    for i in range(n):
+        path = os.path.join(outdir, f"brd_{i:06d}.docx")
+        paths.append(plan.write(path, {"org_name": f"Tenant Co-operative {i}"}))
+    return paths
+
+
+CASES = {
+    "userstories": case_userstories,
+    "interview_log": case_interview_log,
+    "discovery_template": case_discovery_template,
+    "governance_matrix": case_governance_matrix,
+    "matrix_streaming": case_matrix_streaming,
+    "brd_plan": case_brd_plan,
+}
+
+
+# ---------- CLI COLD START ----------
+
+STARTUP_COMMANDS = {"list": ["list"], "dry_run": ["build", "--dry-run"]}
+HEAVY_MODULES = ("docx", "openpyxl", "pptx", "lxml")
+STARTUP_RUNS = 3
+
+
+def parse_importtime(stderr):
+    """(module, self us, cumulative us, depth) rows from -X importtime output."""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        rows.append((name.strip(), int(self_us), int(cumulative_us), depth))
+    return rows
+
+
+def measure_cold_start(args):
+    """Best-of-N wall time of `ue_cli.py ARGS`, plus one -X importtime run."""
+    cmd = [sys.executable, os.path.join(REPO_DIR, "ue_cli.py"), *args]
+    walls = []
+    with tempfile.TemporaryDirectory() as cwd:
+        for _ in range(STARTUP_RUNS):
+            start = time.perf_counter()
+            subprocess.run(cmd, cwd=cwd, capture_output=True, check=True)
+            walls.append(time.perf_counter() - start)
+        traced = subprocess.run(cmd[:1] + ["-X", "importtime"] + cmd[1:], cwd=cwd,
+                                capture_output=True, text=True, check=True)
+    imports = parse_importtime(traced.stderr)
+    heavy = sorted({name.split(".")[0] for name, _, _, _ in imports
+                    if name.split(".")[0] in HEAVY_MODULES})
+    top = sorted(imports, key=lambda r: r[1], reverse=True)
+    return {"wall_s": min(walls), "heavy": heavy, "top_imports": top[:5]}
+
+
+# ---------- RUNNER ----------
+
+def peak_rss_mb():
+    if resource is None:
+        return None
+    # ru_maxrss is KiB on Linux, bytes on macOS.
+    scale = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / scale
+
+
+def _run_case(name, n, queue):
+    try:
+        with tempfile.TemporaryDirectory() as outdir:
+            start = time.perf_counter()
+            outputs = CASES[name](n, outdir)
+            wall = time.perf_counter() - start
+            queue.put({
+                "wall_s": wall,
+                "peak_rss_mb": peak_rss_mb(),
+                "output_bytes": sum(os.path.getsize(p) for p in outputs),
+            })
+    except BaseException as exc:
+        queue.put({"error": f"{type(exc).__name__}: {exc}"})
+        raise
+
+
+def run_case(name, n):
+    """Run one case in a fresh process so peak RSS belongs to that case alone.
+
+    Returns {"error": ...} instead of waiting forever when the case raises
+    or its process dies without reporting.
+    """
+    queue = multiprocessing.Queue()
+    proc = multiprocessing.Process(target=_run_case, args=(name, n, queue))
+    proc.start()
+    while True:
+        try:
+            result = queue.get(timeout=POLL_S)
+            break
+        except Empty:
+            if not proc.is_alive():
+                # The child may have reported just before exiting.
+                try:
+                    result = queue.get(timeout=POLL_S)
+                except Empty:
+                    result = {"error": f"process exited with code {proc.exitcode} without a result"}
+                break
+    proc.join()
+    return result
+
+
+def compare(results, baseline, tolerance):
+    """Return human-readable regressions of `results` against `baseline`."""
+    regressions = []
+    for key, current in results.items():
+        previous = baseline.get(key)
+        if not previous:
+            continue
+        for metric, allowed in (("wall_s", tolerance), ("peak_rss_mb", tolerance),
+                                ("output_bytes", BYTES_TOLERANCE)):
+            old, new = previous.get(metric), current.get(metric)
+            if (old and new is not None and new > old * (1 + allowed)
+                    and new - old > MIN_DELTA[metric]):
+                regressions.append(
+                    f"{key} {metric}: {new:.4g} vs baseline {old:.4g} "
+                    f"(+{(new / old - 1) * 100:.0f}%, allowed +{allowed * 100:.0f}%)"
+                )
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scale", choices=sorted(SIZES), default="small")
+    parser.add_argument("--case", nargs="+", choices=sorted(CASES), default=sorted(CASES))
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="allowed fractional increase in wall time / RSS")
+    parser.add_argument("--skip-startup", action="store_true", help="don't time the CLI cold start")
+    args = parser.parse_args(argv)
+
+    results = {}
+    case_failures = []
+    print(f"{'case':<20} {'size':>8} {'wall s':>9} {'peak RSS MB':>12} {'output KB':>10}")
+    for name in args.case:
+        for n in SIZES[args.scale][name]:
+            r = run_case(name, n)
+            if "error" in r:
+                print(f"{name:<20} {n:>8} FAILED: {r['error']}")
+                case_failures.append(f"{name}/{n} failed: {r['error']}")
+                continue
+            results[f"{name}/{n}"] = r
+            rss = f"{r['peak_rss_mb']:.1f}" if r["peak_rss_mb"] is not None else "n/a"
+            print(f"{name:<20} {n:>8} {r['wall_s']:>9.3f} {rss:>12} {r['output_bytes'] / 1024:>10.1f}")
+
+    budget_failures = []
+    if not args.skip_startup:
+        from ue_cli import COLD_START_BUDGET_S
+
+        print(f"\n{'cli startup':<20} {'command':>8} {'wall s':>9} {'budget s':>9}  heavy imports")
+        for label, cli_args in STARTUP_COMMANDS.items():
+            r = measure_cold_start(cli_args)
+            results[f"cli_startup/{label}"] = {"wall_s": r["wall_s"]}
+            print(f"{'ue_cli.py':<20} {label:>8} {r['wall_s']:>9.3f} {COLD_START_BUDGET_S:>9.2f}  "
+                  f"{', '.join(r['heavy']) or 'none'}")
+            print("    slowest imports (self): " + ", ".join(
+                f"{name} {self_us / 1000:.1f} ms" for name, self_us, _, _ in r["top_imports"]))
+            if r["wall_s"] > COLD_START_BUDGET_S:
+                budget_failures.append(
+                    f"cli_startup/{label} wall_s: {r['wall_s']:.3f} over budget {COLD_START_BUDGET_S:.2f}")
+            if r["heavy"]:
+                budget_failures.append(f"cli_startup/{label} imports {', '.join(r['heavy'])}")
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+
+    if args.save_baseline:
+        baseline.update(results)
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+        print(f"\nBaseline saved to {args.baseline}")
+    elif not baseline:
+        print("\nNo baseline found; run with --save-baseline to record one.")
+
+    regressions = case_failures + budget_failures
+    if baseline and not args.save_baseline:
+        regressions = regressions + compare(results, baseline, args.tolerance)
+    if regressions:
+        print("\nRegressions:")
+        for line in regressions:
+            print(f"  ✖ {line}")
+        return 1
+    print("\n✅ No regressions.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,113 @@
+"""Benchmark bulk table emission against the per-cell python-docx path.
+
+Usage:
+    python benchmark_table_builder.py [--max-rows 100000] [--legacy-max 5000]
+
+Prints build time and microseconds per row for each size. The bulk builder
+should stay flat per row (linear total cost); the legacy
+`add_row().cells` + `shade_cell` path is far more expensive per row, and on
+python-docx < 1.2 its per-row cost also grows with table size.
+"""
+import argparse
+import time
+
+from docx import Document
+from docx.oxml import OxmlElement
+from docx.oxml.ns import qn
+from docx.shared import Pt, RGBColor
+
+from docx_table_builder import add_bulk_table, run_props
+
+BLUE_GREY = RGBColor(30, 55, 90)
+LIGHT_GREY = "F0F0F0"
+HEADERS = ["Role", "System Capabilities (Examples)", "Technical Notes"]
+
+HEADER_RPR = run_props(bold=True, color=BLUE_GREY, size_pt=10)
+FIRST_COL_RPR = run_props(bold=True, color=BLUE_GREY, size_pt=10)
+BODY_RPR = run_props(color=RGBColor(120, 120, 120), size_pt=10)
+
+
+def synthetic_rows(n):
+    return [
+        [f"Role {i}", f"Capability text for row {i} & friends", f"Note <{i}>"]
+        for i in range(n)
+    ]
+
+
+def shade_cell(cell, fill_hex=LIGHT_GREY):
+    tcPr = cell._tc.get_or_add_tcPr()
+    shd = OxmlElement("w:shd")
+    shd.set(qn("w:val"), "clear")
+    shd.set(qn("w:color"), "auto")
+    shd.set(qn("w:fill"), fill_hex)
+    tcPr.append(shd)
+
+
+def legacy_matrix_table(doc, headers, rows):
+    """The per-cell implementation previously used by add_matrix_table."""
+    table = doc.add_table(rows=1, cols=len(headers))
+    for i, h in enumerate(headers):
+        run = table.rows[0].cells[i].paragraphs[0].add_run(h)
+        run.font.bold = True
+        run.font.size = Pt(10)
+        run.font.color.rgb = BLUE_GREY
+    for row in rows:
+        row_cells = table.add_row().cells
+        for i, value in enumerate(row):
+            run = row_cells[i].paragraphs[0].add_run(value)
+            run.font.size = Pt(10)
+            if i == 0:
+                run.font.bold = True
+                run.font.color.rgb = BLUE_GREY
+            else:
+                run.font.color.rgb = RGBColor(120, 120, 120)
+            shade_cell(row_cells[i])
+
+
+def bulk_matrix_table(doc, headers, rows):
+    add_bulk_table(doc, headers, rows, HEADER_RPR, (FIRST_COL_RPR, BODY_RPR))
+
+
+def time_build(build, n):
+    rows = synthetic_rows(n)
+    doc = Document()
+    start = time.perf_counter()
+    build(doc, HEADERS, rows)
+    return time.perf_counter() - start
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--max-rows", type=int, default=100_000)
+    parser.add_argument("--legacy-max", type=int, default=5_000,
+                        help="largest size to run the quadratic legacy path at")
+    args = parser.parse_args(argv)
+
+    if args.max_rows < 1:
+        parser.error("--max-rows must be at least 1")
+
+    # --max-rows itself is always measured, so any value gives at least one size.
+    sizes = sorted(
+        {n for n in (100, 1_000, 5_000, 10_000, 50_000, 100_000) if n <= args.max_rows}
+        | {args.max_rows}
+    )
+
+    print(f"{'rows':>8} {'bulk s':>9} {'bulk us/row':>12} {'legacy s':>9} {'legacy us/row':>14}")
+    per_row = []
+    for n in sizes:
+        bulk = time_build(bulk_matrix_table, n)
+        per_row.append(bulk / n)
+        line = f"{n:>8} {bulk:>9.3f} {bulk / n * 1e6:>12.1f}"
+        if n <= args.legacy_max:
+            legacy = time_build(legacy_matrix_table, n)
+            line += f" {legacy:>9.3f} {legacy / n * 1e6:>14.1f}"
+        print(line)
+
+    # Linear scaling means per-row cost stays roughly constant across sizes.
+    growth = per_row[-1] / min(per_row)
+    print(f"\nBulk per-row cost at {sizes[-1]} rows is {growth:.2f}x the cheapest size "
+          f"({'linear' if growth < 2.0 else 'NOT linear'}).")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,342 @@
+"""Incremental build driver for the generator scripts.
+
+Usage:
+    python build.py [TARGET ...] [--force] [--jobs N] [--dry-run] [--list]
+                    [--manifest tenants.csv] [--clients clients.csv]
+                    [--compression stored|fast|default|max]
+
+Each target is one generator script with the files it reads and writes.
+A target is fingerprinted from its script source, the source of every
+repo-local module it imports (recursively), its input files and its
+arguments. Targets whose fingerprint is unchanged and whose outputs still
+exist are skipped; for a folder output that includes every file the last
+build left in it, so deleting one generated file rebuilds the target. The
+rest run as subprocesses, independent targets in parallel, dependants only
+after their dependencies finish. --compression sets UE_PACKAGE_COMPRESSION
+for every generator (see package_writer.py).
+
+The tenant BRD batch is incremental inside the target as well: a changed
+manifest re-renders only the tenants whose rows changed (see
+generate_brd_batch.py).
+"""
+import argparse
+import ast
+import hashlib
+import json
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from package_writer import COMPRESSION_ENV, COMPRESSION_LEVELS
+
+# ---------- CONFIG ----------
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+BASE_DIR = r"C:\Users\victo\kickoff_project"
+PHASE1_DIR = os.path.join(BASE_DIR, "01_Phase1_Discovery_and_Scoping")
+PHASE2_DIR = r"C:\Users\victo\kickoff_project\02_Phase2_Requirements_and_Governance"
+STATE_PATH = os.path.join(BASE_DIR, ".build_state.json")
+
+TEMPLATE_PATH = os.path.join(BASE_DIR, "UniqueEntrepreneur_Discovery_Interview_Template.docx")
+LOG_PATH = os.path.join(PHASE1_DIR, "Discovery_Interview_Log.xlsx")
+
+# generate_discovery_template.py writes to its working directory, so it runs
+# in BASE_DIR where create_interview_copies.py looks for the template.
+# generate_kickoff.py is interactive; its decks build from a client manifest
+# through generate_kickoff_batch.py instead (--clients).
+TARGETS = {
+    "folders": {
+        "script": "create_discovery_folders.py",
+        "outputs": [
+            os.path.join(PHASE1_DIR, "Stakeholder_Interview_Notes"),
+            os.path.join(PHASE1_DIR, "Personas_and_UserJourneys"),
+        ],
+    },
+    "discovery_template": {
+        "script": "generate_discovery_template.py",
+        "cwd": BASE_DIR,
+        "outputs": [TEMPLATE_PATH],
+    },
+    "interview_log": {
+        "script": "create_discovery_interview_log.py",
+        "outputs": [LOG_PATH],
+    },
+    # Reruns (e.g. after ingest_interview_forms.py rewrites the log) only add
+    # packs for new log rows; existing, possibly filled-in forms are never
+    # overwritten, so this target deliberately has no force_args.
+    "interview_copies": {
+        "script": "create_interview_copies.py",
+        "inputs": [TEMPLATE_PATH, LOG_PATH],
+        "outputs": [os.path.join(PHASE1_DIR, "Stakeholder_Interview_Notes")],
+        "deps": ["folders", "discovery_template", "interview_log"],
+    },
+    "brd": {
+        "script": "generate_brd_template.py",
+        "outputs": [os.path.join(PHASE1_DIR, "UniqueEntrepreneur_BRD_Template.docx")],
+    },
+    "governance_framework": {
+        "script": "generate_data_governance_framework.py",
+        "outputs": [os.path.join(PHASE2_DIR, "UniqueEntrepreneur_Data_Governance_Framework.docx")],
+    },
+    "architecture": {
+        "script": "generate_phase3_architecture_design_doc.py",
+        "outputs": [os.path.join(PHASE2_DIR, "UniqueEntrepreneur_phase3_Architecture_and_ERD.docx")],
+    },
+    "governance_implementation": {
+        "script": "generate_phase3_data_governance_doc.py",
+        "outputs": [os.path.join(PHASE2_DIR, "UniqueEntrepreneur_Phase3_Data_Governance_Implementation.docx")],
+    },
+    "userstories": {
+        "script": "generate_userstories_docs.py",
+        "outputs": [
+            os.path.join(PHASE2_DIR, "UniqueEntrepreneur_UserStories_and_Epics.docx"),
+            os.path.join(PHASE2_DIR, "UniqueEntrepreneur_UserStories_and_Epics.xlsx"),
+            os.path.join(PHASE2_DIR, "UniqueEntrepreneur_UserStories_and_Epics_Import.csv"),
+            os.path.join(PHASE2_DIR, "UniqueEntrepreneur_UserStories_and_Epics.json"),
+        ],
+    },
+}
+
+TENANT_BRD_DIR = os.path.join(PHASE2_DIR, "Tenant_BRDs")
+KICKOFF_DECK_DIR = os.path.join(BASE_DIR, "00_Kickoff_Decks")
+
+
+def tenant_brd_target(manifest):
+    """Per-tenant BRD batch; only part of the build when a manifest is given."""
+    manifest = os.path.abspath(manifest)
+    return {
+        "script": "generate_brd_batch.py",
+        "args": [manifest, "--out-dir", TENANT_BRD_DIR],
+        "inputs": [manifest],
+        "outputs": [TENANT_BRD_DIR],
+        # The batch skips unchanged tenants on its own; --force re-renders them all.
+        "force_args": ["--force"],
+    }
+
+
+def kickoff_decks_target(manifest):
+    """Per-client kickoff decks; only part of the build when a manifest is given."""
+    manifest = os.path.abspath(manifest)
+    return {
+        "script": "generate_kickoff_batch.py",
+        "args": [manifest, "--out-dir", KICKOFF_DECK_DIR],
+        "inputs": [manifest],
+        "outputs": [KICKOFF_DECK_DIR],
+    }
+
+
+# ---------- FINGERPRINTS ----------
+
+def local_imports(script, _seen=None):
+    """Repo-local modules imported by `script`, followed recursively."""
+    seen = _seen if _seen is not None else set()
+    path = os.path.join(REPO_DIR, script)
+    with open(path, encoding="utf-8") as f:
+        tree = ast.parse(f.read(), filename=path)
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names = [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            names = [node.module]
+        else:
+            continue
+        for name in names:
+            module_file = name.split(".")[0] + ".py"
+            if module_file not in seen and os.path.exists(os.path.join(REPO_DIR, module_file)):
+                seen.add(module_file)
+                local_imports(module_file, seen)
+    return seen
+
+
+def _hash_file(h, path):
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            h.update(chunk)
+
+
+def fingerprint(target):
+    h = hashlib.sha256()
+    script = target["script"]
+    for source in [script] + sorted(local_imports(script) - {script}):
+        h.update(source.encode())
+        _hash_file(h, os.path.join(REPO_DIR, source))
+    for path in target.get("inputs", []):
+        h.update(path.encode())
+        if os.path.isfile(path):
+            _hash_file(h, path)
+        else:
+            h.update(b"<missing>")
+    h.update(json.dumps(target.get("args", [])).encode())
+    h.update(os.environ.get(COMPRESSION_ENV, "").encode())
+    return h.hexdigest()
+
+
+def output_files(target):
+    """{folder output: sorted relative paths of the files inside it}."""
+    files = {}
+    for path in target["outputs"]:
+        if os.path.isdir(path):
+            files[path] = sorted(
+                os.path.relpath(os.path.join(root, name), path)
+                for root, _, names in os.walk(path)
+                for name in names
+            )
+    return files
+
+
+def outputs_present(target, entry):
+    """Every output exists, and so does every file recorded in folder outputs."""
+    if not all(os.path.exists(p) for p in target["outputs"]):
+        return False
+    return all(
+        os.path.exists(os.path.join(folder, name))
+        for folder, names in entry.get("files", {}).items()
+        for name in names
+    )
+
+
+def load_state():
+    if os.path.exists(STATE_PATH):
+        with open(STATE_PATH, encoding="utf-8") as f:
+            return json.load(f)
+    return {}
+
+
+def save_state(state):
+    os.makedirs(os.path.dirname(STATE_PATH), exist_ok=True)
+    tmp_path = STATE_PATH + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(state, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, STATE_PATH)
+
+
+# ---------- SCHEDULER ----------
+
+def select(targets, names):
+    """`names` plus everything they depend on."""
+    selected = set()
+    stack = list(names or targets)
+    while stack:
+        name = stack.pop()
+        if name not in targets:
+            raise SystemExit(f"Unknown target: {name} (see --list)")
+        if name not in selected:
+            selected.add(name)
+            stack.extend(targets[name].get("deps", []))
+    return selected
+
+
+def run_target(name, target, force=False):
+    cmd = [sys.executable, os.path.join(REPO_DIR, target["script"])] + target.get("args", [])
+    if force:
+        cmd += target.get("force_args", [])
+    start = time.perf_counter()
+    proc = subprocess.run(cmd, cwd=target.get("cwd"), capture_output=True, text=True)
+    return name, proc, time.perf_counter() - start
+
+
+def build(targets, names=None, force=False, jobs=None, dry_run=False):
+    """Build the selected targets; return {name: 'built'|'skipped'|'failed'}."""
+    selected = select(targets, names)
+    state = load_state()
+    results = {}
+    pending = set(selected)
+    running = {}
+    os.makedirs(BASE_DIR, exist_ok=True)
+
+    def ready(name):
+        return all(results.get(dep) in ("built", "skipped") for dep in targets[name].get("deps", []))
+
+    def blocked(name):
+        return any(results.get(dep) == "failed" for dep in targets[name].get("deps", []))
+
+    with ThreadPoolExecutor(max_workers=jobs or os.cpu_count() or 1) as pool:
+        while pending or running:
+            for name in sorted(pending):
+                if blocked(name):
+                    pending.discard(name)
+                    results[name] = "failed"
+                    print(f"  ✖ {name}: dependency failed")
+                    continue
+                if not ready(name):
+                    continue
+                pending.discard(name)
+                target = targets[name]
+                digest = fingerprint(target)
+                entry = state.get(name)
+                up_to_date = (
+                    isinstance(entry, dict)
+                    and entry.get("fingerprint") == digest
+                    and outputs_present(target, entry)
+                )
+                if up_to_date and not force:
+                    results[name] = "skipped"
+                    print(f"  · {name}: up to date")
+                elif dry_run:
+                    results[name] = "built"
+                    print(f"  → {name}: would run {target['script']}")
+                else:
+                    running[pool.submit(run_target, name, target, force)] = digest
+
+            if not running:
+                continue
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                digest = running.pop(future)
+                name, proc, seconds = future.result()
+                if proc.returncode == 0:
+                    results[name] = "built"
+                    state[name] = {"fingerprint": digest, "files": output_files(targets[name])}
+                    save_state(state)
+                    print(f"  ✔ {name}: built in {seconds:.2f}s")
+                else:
+                    results[name] = "failed"
+                    state.pop(name, None)
+                    print(f"  ✖ {name}: exit {proc.returncode}\n{proc.stderr.strip()}")
+    return results
+
+
+# ---------- MAIN ----------
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Incrementally build generator outputs.")
+    parser.add_argument("targets", nargs="*", help="targets to build (default: all)")
+    parser.add_argument("--force", action="store_true", help="rebuild even if up to date")
+    parser.add_argument("--jobs", "-j", type=int, default=None)
+    parser.add_argument("--dry-run", action="store_true")
+    parser.add_argument("--list", action="store_true", help="list targets and exit")
+    parser.add_argument("--manifest", help="tenant manifest; adds the tenant_brds target")
+    parser.add_argument("--clients", help="client manifest; adds the kickoff_decks target")
+    parser.add_argument("--compression", choices=sorted(COMPRESSION_LEVELS),
+                        help="zip compression for generated packages")
+    args = parser.parse_args(argv)
+
+    targets = dict(TARGETS)
+    if args.manifest:
+        targets["tenant_brds"] = tenant_brd_target(args.manifest)
+    if args.clients:
+        targets["kickoff_decks"] = kickoff_decks_target(args.clients)
+
+    if args.compression:
+        # Inherited by the generator subprocesses and part of every fingerprint.
+        os.environ[COMPRESSION_ENV] = args.compression
+
+    if args.list:
+        for name, target in targets.items():
+            deps = ", ".join(target.get("deps", [])) or "-"
+            print(f"{name:<28} {target['script']:<45} deps: {deps}")
+        return 0
+
+    start = time.perf_counter()
+    results = build(targets, args.targets, args.force, args.jobs, args.dry_run)
+    counts = {k: list(results.values()).count(k) for k in ("built", "skipped", "failed")}
+    print(
+        f"Build finished in {time.perf_counter() - start:.2f}s: "
+        f"{counts['built']} built, {counts['skipped']} up to date, {counts['failed']} failed"
+    )
+    return 1 if counts["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -8,9 +8,15 @@ folders = [
     "01_Phase1_Discovery_and_Scoping/Personas_and_UserJourneys",
 ]
 
-for folder in folders:
-    path = os.path.join(base, folder)
-    os.makedirs(path, exist_ok=True)
 
-print("✅ Folder structure created successfully under kickoff_project/")
+def main():
+    for folder in folders:
+        path = os.path.join(base, folder)
+        os.makedirs(path, exist_ok=True)
+
+    print("✅ Folder structure created successfully under kickoff_project/")
+
+
+if __name__ == "__main__":
+    main()
 
@@ -1,18 +1,21 @@
+import argparse
+import csv
+import json
 import os
+
 from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import Font, PatternFill, Alignment
 
+from package_writer import save_package
+
 # Base path
 BASE_DIR = r"C:\Users\victo\kickoff_project"
 TARGET_DIR = os.path.join(BASE_DIR, "01_Phase1_Discovery_and_Scoping")
-os.makedirs(TARGET_DIR, exist_ok=True)
 
 FILE_PATH = os.path.join(TARGET_DIR, "Discovery_Interview_Log.xlsx")
-
-# Create workbook and sheet
-wb = Workbook()
-ws = wb.active
-ws.title = "Discovery Interviews"
+SHEET_TITLE = "Discovery Interviews"
+RESPONSES_SHEET_TITLE = "Interview Responses"
 
 # Columns
 columns = [
@@ -32,18 +35,15 @@ columns = [
     "Linked File"
 ]
 
+# Per-question answers ingested from completed forms (ingest_interview_forms.py)
+response_columns = ["Interview ID", "Section", "Question No.", "Question", "Response"]
+RESPONSE_COLUMN_WIDTHS = [14, 10, 12, 50, 80]
+
 # Header style
 header_font = Font(bold=True, color="FFFFFF")
 header_fill = PatternFill(start_color="1E375A", end_color="1E375A", fill_type="solid")
 center_align = Alignment(horizontal="center", vertical="center", wrap_text=True)
 
-# Write header row
-for col_idx, col_name in enumerate(columns, start=1):
-    cell = ws.cell(row=1, column=col_idx, value=col_name)
-    cell.font = header_font
-    cell.fill = header_fill
-    cell.alignment = center_align
-
 # Sample realistic rows
 rows = [
     [
@@ -144,30 +144,154 @@ rows = [
     ],
 ]
 
-# Write data rows
-for row_idx, row_data in enumerate(rows, start=2):
-    for col_idx, value in enumerate(row_data, start=1):
-        cell = ws.cell(row=row_idx, column=col_idx, value=value)
-        if col_idx in (12,):  # Satisfaction numeric
-            cell.alignment = Alignment(horizontal="center", vertical="center")
-        elif col_idx in (1, 2, 5, 6, 13):
-            cell.alignment = Alignment(horizontal="center", vertical="center")
-        else:
-            cell.alignment = Alignment(wrap_text=True, vertical="top")
-
-# Auto column width (simple)
-for col in ws.columns:
-    max_length = 0
-    col_letter = col[0].column_letter
-    for cell in col:
-        try:
-            if cell.value:
-                max_length = max(max_length, len(str(cell.value)))
-        except:
-            pass
-    ws.column_dimensions[col_letter].width = min(max_length + 2, 50)
-
-wb.save(FILE_PATH)
-
-print(f"✅ Discovery Interview Log created at:\n{FILE_PATH}")
+# Body alignment: short categorical / numeric columns centred, text wrapped
+centered_columns = {1, 2, 5, 6, 12, 13}  # ID, Type, Country, Sector, Satisfaction, Priority
+body_center_align = Alignment(horizontal="center", vertical="center")
+body_wrap_align = Alignment(wrap_text=True, vertical="top")
+MAX_COLUMN_WIDTH = 50
+
+
+# ---------- INPUT ----------
+
+def _coerce_record(record):
+    """Return a record (dict or sequence) as a list in `columns` order."""
+    if isinstance(record, dict):
+        values = [record.get(name) for name in columns]
+    else:
+        values = list(record) + [None] * (len(columns) - len(record))
+    score = values[11]
+    if isinstance(score, str) and score.strip().isdigit():
+        values[11] = int(score)
+    return values
+
+
+def iter_interview_records(path):
+    """Stream interview records from a CSV (with header) or JSONL file."""
+    if path.lower().endswith((".jsonl", ".ndjson")):
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+    else:
+        with open(path, newline="", encoding="utf-8-sig") as f:
+            yield from csv.DictReader(f)
+
+
+# ---------- STREAMING WRITER ----------
+
+def _cols_patch(widths):
+    """Head patch adding a <cols> element ahead of <sheetData>.
+
+    Write-only worksheets emit <cols> before the first row, so widths known
+    only after the single pass are spliced in while the package is being
+    normalised; the rest of the sheet streams through untouched.
+    """
+    cols_xml = ("<cols>" + "".join(
+        f'<col min="{i}" max="{i}" width="{w}" customWidth="1"/>'
+        for i, w in enumerate(widths, start=1)
+    ) + "</cols>").encode()
+    return lambda head: head.replace(b"<sheetData", cols_xml + b"<sheetData", 1)
+
+
+def _header_row(ws, names):
+    header = []
+    for col_name in names:
+        cell = WriteOnlyCell(ws, value=col_name)
+        cell.font = header_font
+        cell.fill = header_fill
+        cell.alignment = center_align
+        header.append(cell)
+    return header
+
+
+def _write_responses(wb, responses):
+    """Add the Interview Responses sheet; return its head patch."""
+    ws = wb.create_sheet(RESPONSES_SHEET_TITLE)
+    probe = WriteOnlyCell(ws)
+    probe.alignment = body_wrap_align
+    wrap_style = probe._style
+
+    ws.append(_header_row(ws, response_columns))
+    for response in responses:
+        out = []
+        for value in response:
+            if value in (None, ""):
+                out.append(None)
+                continue
+            cell = WriteOnlyCell(ws, value=value)
+            cell._style = wrap_style
+            out.append(cell)
+        ws.append(out)
+
+    sheet_part = f"xl/worksheets/sheet{wb.worksheets.index(ws) + 1}.xml"
+    return sheet_part, _cols_patch(RESPONSE_COLUMN_WIDTHS)
+
+
+def write_interview_log(path, records=None, responses=None):
+    """Write the interview log in one streaming pass; return the row count.
+
+    Uses openpyxl's write-only worksheet, so rows are serialised as they are
+    appended. Column widths are tracked as running maxima of the values'
+    string lengths instead of a second walk over the sheet. `responses`,
+    if given, are rows of `response_columns` for a second sheet.
+    """
+    records = rows if records is None else records
+
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet(SHEET_TITLE)
+
+    max_lengths = [len(name) for name in columns]
+
+    # Resolve each column's body style once; assigning Alignment objects per
+    # cell would re-hash them against the workbook's style tables every time.
+    body_styles = []
+    for col_idx in range(1, len(columns) + 1):
+        probe = WriteOnlyCell(ws)
+        probe.alignment = body_center_align if col_idx in centered_columns else body_wrap_align
+        body_styles.append(probe._style)
+
+    ws.append(_header_row(ws, columns))
+
+    count = 0
+    for record in records:
+        out = []
+        for col_idx, value in enumerate(_coerce_record(record), start=1):
+            if value in (None, ""):
+                out.append(None)
+                continue
+            length = len(str(value))
+            if length > max_lengths[col_idx - 1]:
+                max_lengths[col_idx - 1] = length
+            cell = WriteOnlyCell(ws, value=value)
+            cell._style = body_styles[col_idx - 1]
+            out.append(cell)
+        ws.append(out)
+        count += 1
+
+    widths = [min(length + 2, MAX_COLUMN_WIDTH) for length in max_lengths]
+    # openpyxl numbers worksheet parts by position at save time.
+    sheet_part = f"xl/worksheets/sheet{wb.worksheets.index(ws) + 1}.xml"
+    patches = {sheet_part: _cols_patch(widths)}
+    if responses is not None:
+        patches.update([_write_responses(wb, responses)])
+    save_package(wb, path, patch_head=patches)
+    return count
+
+
+# ---------- MAIN ----------
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Write the Discovery Interview Log workbook.")
+    parser.add_argument("--input", help="CSV or JSONL interview records (default: sample rows)")
+    parser.add_argument("--output", default=FILE_PATH)
+    args = parser.parse_args(argv)
+
+    os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+    records = iter_interview_records(args.input) if args.input else rows
+    count = write_interview_log(args.output, records)
+
+    print(f"✅ Discovery Interview Log created at:\n{args.output} ({count} interviews)")
+
 
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,13 @@
+import argparse
 import os
-import shutil
+
+from artifact_store import LINK_MODES, ArtifactStore
+from batch_render import print_report
+from discovery_template_cache import build_interview_packs, iter_log_records
 
 BASE_DIR = r"C:\Users\victo\kickoff_project"
 TEMPLATE_NAME = "UniqueEntrepreneur_Discovery_Interview_Template.docx"
+STORE_DIR = os.path.join(BASE_DIR, ".artifact_store")
 
 template_path = os.path.join(BASE_DIR, TEMPLATE_NAME)
 target_dir = os.path.join(
@@ -10,15 +15,13 @@ target_dir = os.path.join(
     "01_Phase1_Discovery_and_Scoping",
     "Stakeholder_Interview_Notes"
 )
+log_path = os.path.join(
+    BASE_DIR,
+    "01_Phase1_Discovery_and_Scoping",
+    "Discovery_Interview_Log.xlsx"
+)
 
-if not os.path.exists(template_path):
-    raise FileNotFoundError(
-        f"Template not found at {template_path}. "
-        f"Run generate_discovery_template.py first."
-    )
-
-os.makedirs(target_dir, exist_ok=True)
-
+# Used when there is no interview log yet: blank copies of the template.
 files_to_create = [
     "OrgAdmin_Interview_01.docx",
     "Instructor_Interview_02.docx",
@@ -28,10 +31,52 @@ files_to_create = [
     "TechLead_Interview_06.docx",
 ]
 
-for fname in files_to_create:
-    dest = os.path.join(target_dir, fname)
-    shutil.copyfile(template_path, dest)
 
-print("✅ Created stakeholder interview files in:")
-print(target_dir)
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Create prefilled stakeholder interview files from the interview log."
+    )
+    parser.add_argument("--template", default=template_path)
+    parser.add_argument("--log", default=log_path,
+                        help="Discovery_Interview_Log .xlsx/.csv/.jsonl")
+    parser.add_argument("--out-dir", default=target_dir)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--store", default=STORE_DIR,
+                        help="content-addressed artifact store ('' to write plain files)")
+    parser.add_argument("--link-mode", choices=LINK_MODES, default="reflink",
+                        help="how files are placed from the store: reflink clones (copy where "
+                             "unsupported) stay writable; only use hardlink / auto for "
+                             "read-only copies")
+    parser.add_argument("--force", action="store_true",
+                        help="overwrite interview files that already exist, discarding any answers")
+    args = parser.parse_args(argv)
+
+    if not os.path.exists(args.template):
+        raise FileNotFoundError(
+            f"Template not found at {args.template}. "
+            f"Run generate_discovery_template.py first."
+        )
+
+    if os.path.exists(args.log):
+        records = iter_log_records(args.log)
+    else:
+        records = [{"Linked File": fname} for fname in files_to_create]
+
+    store = ArtifactStore(args.store) if args.store else None
+    report = build_interview_packs(
+        args.template, records, args.out_dir, workers=args.workers,
+        store=store, link_mode=args.link_mode, overwrite=args.force,
+    )
+    print_report(report, noun="file")
+    if report["skipped"]:
+        print(f"Kept {report['skipped']} existing file(s); --force overwrites them")
+    if store is not None:
+        modes = ", ".join(f"{n} {m}" for m, n in sorted(report["link_modes"].items())) or "-"
+        print(f"Stored {report['blobs']} distinct file(s) in {args.store} ({modes})")
+    print("✅ Created stakeholder interview files in:")
+    print(args.out_dir)
+    return report
+
 
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,268 @@
+"""Compiled discovery-template cache with per-interviewee field substitution.
+
+`generate_discovery_template.py` produces one blank interview form. Rather
+than copying it byte-for-byte and leaving every "Click to type" in place,
+the template is compiled once into:
+
+- a base package: every part except `word/document.xml`, already deflated;
+- `word/document.xml` split into literal segments around the Interview
+  Details value cells (Interview ID, Interviewee Name, ...).
+
+Each interview pack is then written by copying the base package and
+appending one document part built by joining the segments with the escaped
+field values -- no python-docx load and no XML parse per pack. Compiled
+templates are cached on disk keyed by the template's SHA-256.
+
+Packs that already exist are left alone: they are the forms people fill
+in. Only `overwrite=True` (create_interview_copies.py --force) replaces them.
+"""
+import csv
+import hashlib
+import io
+import json
+import os
+import pickle
+import zipfile
+from xml.sax.saxutils import escape
+
+from lxml import etree
+
+from artifact_store import ArtifactStore
+from batch_render import run_batch
+
+# ---------- CONFIG ----------
+DOCUMENT_PART = "word/document.xml"
+CACHE_DIR_NAME = ".template_cache"
+COMPILER_VERSION = 1
+
+W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+XML_SPACE = "{http://www.w3.org/XML/1998/namespace}space"
+
+# Interview Details label (create_generic_header_block) -> log column
+FIELD_COLUMNS = {
+    "Interview ID:": "Interview ID",
+    "Date / Time:": "Date",
+    "Interviewee Name:": "Interviewee Name",
+    "Organisation / School:": "Organisation / School",
+    "Role / Title:": "Stakeholder Type",
+    "Summary Tags (e.g., Payments, UX, Governance):": "Key Themes",
+}
+
+# Private-use code point; never produced by the template generator.
+_SLOT = "\ue000"
+
+
+# ---------- COMPILED TEMPLATE ----------
+
+class CompiledTemplate:
+    def __init__(self, base_package, document_info, segments, slots):
+        self.base_package = base_package      # zip bytes without document.xml
+        self.document_info = document_info    # ZipInfo for document.xml
+        self.segments = segments              # literal XML around the slots
+        self.slots = slots                    # [(log column, default text)]
+
+    def render_document(self, record):
+        """Return `word/document.xml` bytes with `record` values filled in."""
+        out = [self.segments[0]]
+        for (column, default), segment in zip(self.slots, self.segments[1:]):
+            value = record.get(column)
+            out.append(escape(str(value)) if value not in (None, "") else default)
+            out.append(segment)
+        return "".join(out).encode("utf-8")
+
+    def write(self, dest, record):
+        """Write a prefilled interview pack for `record` to `dest`."""
+        with open(dest, "w+b") as fh:
+            fh.write(self.base_package)
+            fh.seek(0)
+            with zipfile.ZipFile(fh, "a") as zf:
+                zf.writestr(self.document_info, self.render_document(record))
+        return dest
+
+
+def compile_template(template_path):
+    """Compile a discovery template .docx into a CompiledTemplate."""
+    with zipfile.ZipFile(template_path) as zf:
+        infos = zf.infolist()
+        parts = {info.filename: zf.read(info) for info in infos}
+
+    root = etree.fromstring(parts[DOCUMENT_PART])
+    slots = []
+    for tr in root.iter(f"{W}tr"):
+        tcs = tr.findall(f"{W}tc")
+        if len(tcs) != 2:
+            continue
+        label = "".join(t.text or "" for t in tcs[0].iter(f"{W}t")).strip()
+        column = FIELD_COLUMNS.get(label)
+        value_ts = list(tcs[1].iter(f"{W}t"))
+        if column is None or not value_ts:
+            continue
+        default = "".join(t.text or "" for t in value_ts)
+        value_ts[0].text = f"{_SLOT}{len(slots)}{_SLOT}"
+        value_ts[0].set(XML_SPACE, "preserve")
+        for t in value_ts[1:]:
+            t.getparent().remove(t)
+        slots.append((column, escape(default)))
+
+    xml = etree.tostring(
+        root, xml_declaration=True, encoding="UTF-8", standalone=True
+    ).decode("utf-8")
+    pieces = xml.split(_SLOT)
+    segments = pieces[0::2]
+    # Slots come back in document order, which is the order they were numbered.
+    assert [int(i) for i in pieces[1::2]] == list(range(len(slots)))
+
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w") as zf:
+        for info in infos:
+            if info.filename != DOCUMENT_PART:
+                info.compress_type = zipfile.ZIP_DEFLATED
+                zf.writestr(info, parts[info.filename])
+    document_info = next(i for i in infos if i.filename == DOCUMENT_PART)
+    document_info.compress_type = zipfile.ZIP_DEFLATED
+
+    return CompiledTemplate(buf.getvalue(), document_info, segments, slots)
+
+
+def load_compiled_template(template_path, cache_dir=None):
+    """Return the compiled template, compiling and caching it on first use."""
+    with open(template_path, "rb") as f:
+        digest = hashlib.sha256(f.read()).hexdigest()
+
+    cache_dir = cache_dir or os.path.join(
+        os.path.dirname(os.path.abspath(template_path)), CACHE_DIR_NAME
+    )
+    cache_path = os.path.join(
+        cache_dir, f"discovery_{digest[:16]}_v{COMPILER_VERSION}.pickle"
+    )
+    if os.path.exists(cache_path):
+        with open(cache_path, "rb") as f:
+            return pickle.load(f)
+
+    compiled = compile_template(template_path)
+    os.makedirs(cache_dir, exist_ok=True)
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        pickle.dump(compiled, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, cache_path)
+    return compiled
+
+
+# ---------- LOG INPUT ----------
+
+def iter_log_records(path):
+    """Yield Discovery_Interview_Log rows (.xlsx, .csv or .jsonl) as dicts."""
+    lower = path.lower()
+    if lower.endswith(".xlsx"):
+        from openpyxl import load_workbook
+
+        wb = load_workbook(path, read_only=True)
+        ws = wb["Discovery Interviews"] if "Discovery Interviews" in wb.sheetnames else wb.active
+        rows = ws.iter_rows(values_only=True)
+        header = next(rows, None) or ()
+        for row in rows:
+            if any(v not in (None, "") for v in row):
+                yield dict(zip(header, row))
+        wb.close()
+    elif lower.endswith(".jsonl"):
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+    else:
+        with open(path, newline="", encoding="utf-8-sig") as f:
+            yield from csv.DictReader(f)
+
+
+def pack_filename(record):
+    """Output filename for a record: the log's Linked File, else the ID."""
+    linked = str(record.get("Linked File") or "").replace("\\", "/")
+    name = os.path.basename(linked)
+    if not name:
+        name = f"{record.get('Interview ID') or 'Interview'}.docx"
+    return name
+
+
+# ---------- BATCH ----------
+
+_TEMPLATE = None
+
+
+def _init_worker(template_path, cache_dir):
+    global _TEMPLATE
+    _TEMPLATE = load_compiled_template(template_path, cache_dir)
+
+
+def render_pack(job):
+    dest, record = job
+    return _TEMPLATE.write(dest, record)
+
+
+def store_pack(job):
+    """Render into the artifact store instead; return (dest, digest)."""
+    dest, record, store_root = job
+    digest = ArtifactStore(store_root).put_with(
+        lambda tmp_path: _TEMPLATE.write(tmp_path, record)
+    )
+    return dest, digest
+
+
+def build_interview_packs(template_path, records, target_dir, workers=None,
+                          cache_dir=None, store=None, link_mode="reflink", overwrite=False):
+    """Write one prefilled pack per record into `target_dir`; return the report.
+
+    A pack whose file already exists may hold answers, so it is skipped
+    (counted in the report's "skipped") unless `overwrite` is set.
+
+    With an `ArtifactStore`, each distinct pack is stored once and placed
+    in `target_dir` as a reflink clone (a plain copy where unsupported).
+    Packs are forms people fill in, so they must stay writable; pass
+    `link_mode` "hardlink" or "auto" only for packs meant to stay read-only.
+    """
+    # Compile (or load) once in the parent so workers only ever read the cache.
+    load_compiled_template(template_path, cache_dir)
+    os.makedirs(target_dir, exist_ok=True)
+    jobs, skipped = [], 0
+    seen = set()
+    for record in records:
+        # Two log rows may map to the same name; the later one gets _2, _3, ...
+        filename = pack_filename(record)
+        stem, ext = os.path.splitext(filename)
+        n = 2
+        while filename.lower() in seen:
+            filename = f"{stem}_{n}{ext}"
+            n += 1
+        seen.add(filename.lower())
+        dest = os.path.join(target_dir, filename)
+        if not overwrite and os.path.exists(dest):
+            skipped += 1
+            continue
+        jobs.append((dest, record))
+    if store is None:
+        report = run_batch(
+            render_pack,
+            jobs,
+            workers=workers,
+            initializer=_init_worker,
+            initargs=(template_path, cache_dir),
+        )
+        report["skipped"] = skipped
+        return report
+
+    report = run_batch(
+        store_pack,
+        [(dest, record, store.root) for dest, record in jobs],
+        workers=workers,
+        initializer=_init_worker,
+        initargs=(template_path, cache_dir),
+    )
+    modes = {}
+    for dest, digest in report["outputs"]:
+        used = store.materialise(digest, dest, link_mode)
+        modes[used] = modes.get(used, 0) + 1
+    store.save_refs()
+    report["blobs"] = len({digest for _, digest in report["outputs"]})
+    report["link_modes"] = modes
+    report["skipped"] = skipped
+    report["outputs"] = [dest for dest, _ in report["outputs"]]
+    return report
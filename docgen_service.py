@@ -0,0 +1,497 @@
+"""Long-lived document generation service with warm workers.
+
+Usage:
+    python docgen_service.py serve [--port 8765] [--workers N] [--max-queue 64]
+    python docgen_service.py demo  [--requests 60] [--tenants 4] [--workers N]
+
+Requests (tenant, kind, fields) wait in a bounded queue that is drained
+round-robin across tenants, so one tenant's burst cannot starve the
+others; a full queue (or a tenant over its share, by default a quarter of
+the queue) is rejected immediately instead of growing without bound.
+Rendering happens in a pool of worker processes that imported python-docx
+/ openpyxl and the generator modules, and loaded the compiled render plans
+(render_plan.py) of the BRD, governance and architecture documents, once
+at start-up. Latency percentiles and queue depth are exposed as metrics.
+Exports are named <kind>_<run id>_<request id>, the run id being the
+service's start time and process id, so a restarted service never
+overwrites an earlier run's files in the same --out-dir.
+
+HTTP (serve):
+    POST /render   {"tenant": "...", "kind": "brd", "fields": {...}}
+                   -> 200 {"id", "path", "latency_ms"} | 400 | 429
+    GET  /metrics  -> queue depth, in-flight, latency p50/p95/p99
+    GET  /healthz
+
+`LocalClient` offers the same calls against an in-process service for
+tests and demos (`demo`).
+"""
+import argparse
+import collections
+import itertools
+import json
+import os
+import random
+import re
+import sys
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# ---------- CONFIG ----------
+BASE_DIR = r"C:\Users\victo\kickoff_project"
+OUT_DIR = os.path.join(BASE_DIR, "Docgen_Exports")
+
+MAX_QUEUE = 64
+# Default per-tenant cap is an equal share of the queue among this many tenants.
+EXPECTED_TENANTS = 4
+LATENCY_WINDOW = 1000
+
+
+# ---------- RENDERERS (run in workers) ----------
+
+_plans = {}
+
+
+def _render_plan(name):
+    """The compiled render plan of a document, kept for the life of the worker."""
+    if name not in _plans:
+        from render_plan import load_render_plan
+        _plans[name] = load_render_plan(name)
+    return _plans[name]
+
+
+def _write_plan(name, path, fields):
+    plan = _render_plan(name)
+    return plan.write(path, {k: str(v) for k, v in fields.items() if k in plan.defaults and v})
+
+
+def _render_brd(path, fields):
+    return _write_plan("brd", path, fields)
+
+
+def _render_governance_framework(path, fields):
+    return _write_plan("governance_framework", path, fields)
+
+
+def _render_governance_implementation(path, fields):
+    return _write_plan("governance_implementation", path, fields)
+
+
+def _render_architecture(path, fields):
+    return _write_plan("architecture", path, fields)
+
+
+def _render_userstories(path, fields):
+    from generate_userstories_docs import build_userstories_docx, load_backlog
+    from package_writer import save_package
+    return save_package(build_userstories_docx(load_backlog()), path)
+
+
+def _render_userstories_xlsx(path, fields):
+    from generate_userstories_docs import build_userstories_xlsx, load_backlog
+    from package_writer import save_package
+    return save_package(build_userstories_xlsx(load_backlog()), path)
+
+
+# kind -> (renderer, module to warm, file extension)
+KINDS = {
+    "brd": (_render_brd, "generate_brd_template", ".docx"),
+    "governance_framework": (_render_governance_framework, "generate_data_governance_framework", ".docx"),
+    "governance_implementation": (_render_governance_implementation, "generate_phase3_data_governance_doc", ".docx"),
+    "architecture": (_render_architecture, "generate_phase3_architecture_design_doc", ".docx"),
+    "userstories": (_render_userstories, "generate_userstories_docs", ".docx"),
+    "userstories_xlsx": (_render_userstories_xlsx, "generate_userstories_docs", ".xlsx"),
+}
+
+
+def _warm_worker():
+    import importlib
+
+    for module in sorted({module for _, module, _ in KINDS.values()}):
+        importlib.import_module(module)
+    from render_plan import PLAN_SOURCES
+    for name in PLAN_SOURCES:
+        _render_plan(name)
+
+
+def _ping(_):
+    return os.getpid()
+
+
+def render_document(job):
+    kind, path, fields = job
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    return KINDS[kind][0](path, fields)
+
+
+# ---------- FAIR QUEUE ----------
+
+class QueueFull(Exception):
+    pass
+
+
+class FairQueue:
+    """Bounded multi-tenant queue; `get` serves tenants round-robin.
+
+    `max_per_tenant` defaults to max(1, max_depth // EXPECTED_TENANTS), so
+    one tenant's burst leaves room in the queue for the others.
+    """
+
+    def __init__(self, max_depth=MAX_QUEUE, max_per_tenant=None):
+        self.max_depth = max_depth
+        self.max_per_tenant = max_per_tenant or max(1, max_depth // EXPECTED_TENANTS)
+        self._queues = {}                     # tenant -> deque of items
+        self._ready = collections.deque()     # tenants with queued items, in turn order
+        self._depth = 0
+        self._closed = False
+        self._cond = threading.Condition()
+
+    def put(self, tenant, item):
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("queue is closed")
+            if self._depth >= self.max_depth:
+                raise QueueFull(f"queue full ({self._depth} waiting)")
+            q = self._queues.setdefault(tenant, collections.deque())
+            if len(q) >= self.max_per_tenant:
+                raise QueueFull(f"tenant {tenant!r} has {len(q)} requests waiting")
+            if not q:
+                self._ready.append(tenant)
+            q.append(item)
+            self._depth += 1
+            self._cond.notify()
+
+    def get(self):
+        """Next item from the tenant whose turn it is; None once closed and empty."""
+        with self._cond:
+            while not self._depth and not self._closed:
+                self._cond.wait()
+            if not self._depth:
+                return None
+            tenant = self._ready.popleft()
+            q = self._queues[tenant]
+            item = q.popleft()
+            if q:
+                self._ready.append(tenant)
+            else:
+                del self._queues[tenant]
+            self._depth -= 1
+            return item
+
+    def close(self):
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+    def depth(self):
+        with self._cond:
+            return self._depth, {t: len(q) for t, q in self._queues.items()}
+
+
+# ---------- SERVICE ----------
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return None
+    rank = max(1, -(-pct * len(sorted_values) // 100))
+    return sorted_values[int(rank) - 1]
+
+
+class DocgenService:
+    def __init__(self, workers=None, max_queue=MAX_QUEUE, max_per_tenant=None, out_dir=OUT_DIR):
+        self.workers = workers or os.cpu_count() or 1
+        self.out_dir = out_dir
+        self.queue = FairQueue(max_queue, max_per_tenant)
+        self._pool = self._start_pool()
+        # Only hand the pool as many jobs as it has workers, so waiting work
+        # stays in the fair queue rather than in the pool's FIFO.
+        self._slots = threading.BoundedSemaphore(self.workers)
+        self._ids = itertools.count(1)
+        # Request ids restart at 1 in every process; the run id keeps names unique.
+        self.run_id = f"{time.strftime('%Y%m%dT%H%M%S')}-{os.getpid()}"
+        self._lock = threading.Lock()
+        self._latencies = collections.deque(maxlen=LATENCY_WINDOW)
+        self._counts = collections.Counter()
+        self._in_flight = 0
+        self._dispatcher = threading.Thread(target=self._dispatch, name="docgen-dispatch", daemon=True)
+        self._dispatcher.start()
+
+    def _start_pool(self):
+        pool = ProcessPoolExecutor(max_workers=self.workers, initializer=_warm_worker)
+        # Start the workers (and pay their imports) now, not on the first request.
+        list(pool.map(_ping, range(self.workers)))
+        return pool
+
+    def submit(self, tenant, kind, fields=None):
+        """Queue a render; return a Future resolving to the request summary.
+
+        Raises QueueFull when the request cannot be queued (backpressure)
+        and ValueError for an unknown kind or non-object fields.
+        """
+        if not isinstance(kind, str) or kind not in KINDS:
+            raise ValueError(f"Unknown kind {kind!r}; choose from {', '.join(KINDS)}")
+        if fields is not None and not isinstance(fields, dict):
+            raise ValueError(f"fields must be an object, not {type(fields).__name__}")
+        request_id = next(self._ids)
+        safe_tenant = re.sub(r"[^A-Za-z0-9_-]+", "", tenant) or "tenant"
+        path = os.path.join(
+            self.out_dir, safe_tenant, f"{kind}_{self.run_id}_{request_id:06d}{KINDS[kind][2]}"
+        )
+        future = Future()
+        item = (request_id, tenant, kind, path, dict(fields or {}), time.perf_counter(), future)
+        try:
+            self.queue.put(tenant, item)
+        except QueueFull:
+            with self._lock:
+                self._counts["rejected"] += 1
+            raise
+        with self._lock:
+            self._counts["accepted"] += 1
+        return future
+
+    def _dispatch(self):
+        while True:
+            self._slots.acquire()
+            item = self.queue.get()
+            if item is None:
+                self._slots.release()
+                return
+            request_id, tenant, kind, path, fields, queued_at, future = item
+            with self._lock:
+                self._in_flight += 1
+            try:
+                job = self._pool.submit(render_document, (kind, path, fields))
+            except Exception as exc:
+                # Typically BrokenProcessPool after a worker died: fail this
+                # request, not the dispatcher, and carry on with a new pool.
+                self._fail(item, exc)
+                self._restart_pool()
+                continue
+            job.add_done_callback(
+                lambda job, item=item: self._finish(item, job)
+            )
+
+    def _restart_pool(self):
+        """Replace the pool; if that fails too, the next request retries."""
+        try:
+            pool = self._start_pool()
+        except Exception:
+            return
+        old, self._pool = self._pool, pool
+        old.shutdown(wait=False)
+
+    def _fail(self, item, error):
+        future = item[-1]
+        self._slots.release()
+        with self._lock:
+            self._in_flight -= 1
+            self._counts["failed"] += 1
+        future.set_exception(error)
+
+    def _finish(self, item, job):
+        request_id, tenant, kind, path, fields, queued_at, future = item
+        latency = time.perf_counter() - queued_at
+        self._slots.release()
+        with self._lock:
+            self._in_flight -= 1
+            error = job.exception()
+            if error is None:
+                self._latencies.append(latency)
+                self._counts["completed"] += 1
+            else:
+                self._counts["failed"] += 1
+        if error is None:
+            future.set_result({
+                "id": request_id, "tenant": tenant, "kind": kind,
+                "path": job.result(), "latency_ms": round(latency * 1000, 1),
+            })
+        else:
+            future.set_exception(error)
+
+    def render(self, tenant, kind, fields=None, timeout=None):
+        return self.submit(tenant, kind, fields).result(timeout)
+
+    def metrics(self):
+        depth, by_tenant = self.queue.depth()
+        with self._lock:
+            latencies = sorted(self._latencies)
+            counts = dict(self._counts)
+            in_flight = self._in_flight
+
+        def ms(pct):
+            value = percentile(latencies, pct)
+            return None if value is None else round(value * 1000, 1)
+
+        return {
+            "workers": self.workers,
+            "queue_depth": depth,
+            "queue_depth_by_tenant": by_tenant,
+            "max_queue": self.queue.max_depth,
+            "max_per_tenant": self.queue.max_per_tenant,
+            "in_flight": in_flight,
+            "accepted": counts.get("accepted", 0),
+            "rejected": counts.get("rejected", 0),
+            "completed": counts.get("completed", 0),
+            "failed": counts.get("failed", 0),
+            "latency_ms": {"p50": ms(50), "p95": ms(95), "p99": ms(99)},
+        }
+
+    def close(self):
+        self.queue.close()
+        self._dispatcher.join()
+        self._pool.shutdown(wait=True)
+
+
+# ---------- CLIENTS ----------
+
+class LocalClient:
+    """In-process stand-in for the HTTP API (same calls, same payloads)."""
+
+    def __init__(self, service):
+        self.service = service
+
+    def render(self, tenant, kind, fields=None):
+        return self.service.render(tenant, kind, fields)
+
+    def metrics(self):
+        return self.service.metrics()
+
+
+class HttpClient:
+    def __init__(self, base_url="http://127.0.0.1:8765"):
+        self.base_url = base_url.rstrip("/")
+
+    def _call(self, method, path, payload=None):
+        from urllib.request import Request, urlopen
+
+        data = json.dumps(payload).encode() if payload is not None else None
+        req = Request(self.base_url + path, data=data, method=method,
+                      headers={"Content-Type": "application/json"})
+        with urlopen(req) as resp:
+            return json.loads(resp.read())
+
+    def render(self, tenant, kind, fields=None):
+        return self._call("POST", "/render", {"tenant": tenant, "kind": kind, "fields": fields or {}})
+
+    def metrics(self):
+        return self._call("GET", "/metrics")
+
+
+# ---------- HTTP ----------
+
+def make_handler(service):
+    class Handler(BaseHTTPRequestHandler):
+        def _send(self, status, payload):
+            body = json.dumps(payload).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            if self.path == "/metrics":
+                self._send(200, service.metrics())
+            elif self.path == "/healthz":
+                self._send(200, {"ok": True})
+            else:
+                self._send(404, {"error": "not found"})
+
+        def do_POST(self):
+            if self.path != "/render":
+                self._send(404, {"error": "not found"})
+                return
+            try:
+                length = int(self.headers.get("Content-Length") or 0)
+                body = json.loads(self.rfile.read(length) or b"{}")
+                if not isinstance(body, dict):
+                    raise ValueError(f"request body must be an object, not {type(body).__name__}")
+                if not isinstance(body.get("tenant"), (str, int)):
+                    raise ValueError("tenant must be a string or number")
+                future = service.submit(str(body["tenant"]), body.get("kind"), body.get("fields"))
+            except QueueFull as exc:
+                self._send(429, {"error": str(exc)})
+                return
+            except (KeyError, ValueError) as exc:
+                self._send(400, {"error": str(exc)})
+                return
+            try:
+                self._send(200, future.result())
+            except Exception as exc:
+                self._send(500, {"error": f"{type(exc).__name__}: {exc}"})
+
+        def log_message(self, format, *args):
+            pass
+
+    return Handler
+
+
+# ---------- MAIN ----------
+
+def run_demo(service, requests, tenants):
+    """Fire a burst of mixed requests through LocalClient and print metrics."""
+    client = LocalClient(service)
+    rng = random.Random(0)
+    kinds = list(KINDS)
+    results = []
+    rejected = 0
+
+    def one(i):
+        nonlocal rejected
+        tenant = f"tenant{rng.randrange(tenants)}"
+        fields = {"org_name": tenant.upper()} if kinds[i % len(kinds)] == "brd" else {}
+        try:
+            results.append(client.render(tenant, kinds[i % len(kinds)], fields))
+        except QueueFull:
+            rejected += 1
+
+    start = time.perf_counter()
+    threads = [threading.Thread(target=one, args=(i,)) for i in range(requests)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    wall = time.perf_counter() - start
+
+    m = client.metrics()
+    print(f"Rendered {len(results)} docs in {wall:.2f}s ({len(results) / wall:.1f} docs/sec), "
+          f"{rejected} rejected, on {m['workers']} warm worker(s)")
+    lat = m["latency_ms"]
+    print(f"Latency ms: p50 {lat['p50']}  p95 {lat['p95']}  p99 {lat['p99']}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Warm-worker document generation service.")
+    parser.add_argument("command", choices=("serve", "demo"))
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--max-queue", type=int, default=MAX_QUEUE)
+    parser.add_argument("--max-per-tenant", type=int, default=None,
+                        help=f"default: max-queue // {EXPECTED_TENANTS}")
+    parser.add_argument("--out-dir", default=OUT_DIR)
+    parser.add_argument("--requests", type=int, default=60, help="demo: number of requests")
+    parser.add_argument("--tenants", type=int, default=4, help="demo: number of tenants")
+    args = parser.parse_args(argv)
+
+    service = DocgenService(args.workers, args.max_queue, args.max_per_tenant, args.out_dir)
+    try:
+        if args.command == "demo":
+            run_demo(service, args.requests, args.tenants)
+            return 0
+        server = ThreadingHTTPServer((args.host, args.port), make_handler(service))
+        print(f"Serving on http://{args.host}:{args.port} with {service.workers} warm worker(s)")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        server.server_close()
+    finally:
+        service.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
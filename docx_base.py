@@ -0,0 +1,115 @@
+"""Trimmed, project-owned base template for the Word generators.
+
+python-docx's Document() opens its full default template: ~160 styles
+plus latent styles (styles.xml, ~350 KB), a ~440 KB stylesWithEffects.xml,
+a theme, numbering, web settings, custom XML and a thumbnail. Every
+generated document parses and re-saves all of it, which is why even the
+near-empty Architecture/ERD template comes out at ~38 KB.
+
+`base_template` keeps only what the generators use:
+
+- styles.xml with the document defaults and the Normal, Header and Footer
+  styles (plus the default character / table / numbering styles they
+  rely on), Normal set to Calibri 10 pt;
+- settings, font table and the core / app properties.
+
+It is built once per process from python-docx's own template (as
+generate_kickoff.branded_template does for decks), so it follows the
+installed python-docx. `new_document()` opens a copy; generators still add
+their own header / footer text.
+"""
+import io
+from functools import lru_cache
+
+from docx import Document
+from docx.opc.constants import RELATIONSHIP_TYPE as RT
+from docx.oxml.ns import qn
+from docx.shared import Pt
+
+# ---------- CONFIG ----------
+FONT_NAME = "Calibri"
+FONT_SIZE = Pt(10)
+
+# Style ids kept; styles they are based on / linked to are kept as well.
+KEEP_STYLES = ("Normal", "Header", "Footer", "DefaultParagraphFont", "TableNormal", "NoList")
+
+DROP_PART_RELS = (
+    "http://schemas.microsoft.com/office/2007/relationships/stylesWithEffects",
+    RT.THEME,
+    RT.NUMBERING,
+    RT.WEB_SETTINGS,
+    RT.CUSTOM_XML,
+)
+DROP_PACKAGE_RELS = (RT.THUMBNAIL,)
+
+
+# ---------- HELPERS ----------
+
+def _drop_rels(source, reltypes):
+    """Drop `source`'s relationships of `reltypes`; unreachable parts are not saved."""
+    for rId in [rId for rId, rel in source.rels.items() if rel.reltype in reltypes]:
+        source.rels.pop(rId)
+
+
+def _trim_styles(styles):
+    """Keep KEEP_STYLES and their basedOn / link / next styles; drop latent styles."""
+    by_id = {s.get(qn("w:styleId")): s for s in styles.findall(qn("w:style"))}
+    keep, todo = set(), list(KEEP_STYLES)
+    while todo:
+        style_id = todo.pop()
+        if style_id in keep or style_id not in by_id:
+            continue
+        keep.add(style_id)
+        for tag in ("w:basedOn", "w:link", "w:next"):
+            ref = by_id[style_id].find(qn(tag))
+            if ref is not None:
+                todo.append(ref.get(qn("w:val")))
+
+    for style_id, style in by_id.items():
+        if style_id not in keep:
+            styles.remove(style)
+    latent = styles.find(qn("w:latentStyles"))
+    if latent is not None:
+        styles.remove(latent)
+
+
+def _pin_default_fonts(styles):
+    """Name the default fonts outright; the theme they pointed at is dropped."""
+    fonts = styles.find(qn("w:docDefaults")).find(f"{qn('w:rPrDefault')}/{qn('w:rPr')}/{qn('w:rFonts')}")
+    for attr in list(fonts.attrib):
+        del fonts.attrib[attr]
+    for attr in ("w:ascii", "w:eastAsia", "w:hAnsi"):
+        fonts.set(qn(attr), FONT_NAME)
+
+
+# ---------- TEMPLATE ----------
+
+@lru_cache(maxsize=1)
+def base_template():
+    """Package bytes of the trimmed base document, built once per process."""
+    doc = Document()
+    _drop_rels(doc.part, DROP_PART_RELS)
+    _drop_rels(doc.part.package, DROP_PACKAGE_RELS)
+
+    styles = doc.styles.element
+    _trim_styles(styles)
+    _pin_default_fonts(styles)
+
+    style = doc.styles["Normal"]
+    style.font.name = FONT_NAME
+    style._element.rPr.rFonts.set(qn("w:eastAsia"), FONT_NAME)
+    style.font.size = FONT_SIZE
+
+    # The preview picture went with the thumbnail part.
+    settings = doc.settings.element
+    for el in settings.findall(qn("w:savePreviewPicture")):
+        settings.remove(el)
+
+    buf = io.BytesIO()
+    doc.save(buf)
+    return buf.getvalue()
+
+
+def new_document():
+    """Blank Document on the trimmed base template."""
+    return Document(io.BytesIO(base_template()))
@@ -0,0 +1,156 @@
+"""Bulk `w:tbl` emission for python-docx documents.
+
+Growing a table through `table.add_row().cells` creates proxy objects and
+XML nodes one cell at a time (and on python-docx < 1.2 every `.cells` call
+walks the whole grid, so n rows cost O(n^2)). The helpers below build the
+complete table as one XML string from plain row data, reusing precompiled
+`w:tcPr` / `w:shd` / `w:rPr` fragments, and parse it in a single lxml pass.
+The output matches what the per-cell helpers (`add_run` + `shade_cell`)
+produce. `iter_table_xml` yields the same XML row by row for
+streaming_docx.StreamingDocxWriter.
+"""
+from xml.sax.saxutils import escape
+
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls
+from docx.shared import Emu
+from docx.table import Table
+
+LIGHT_GREY = "F0F0F0"
+
+
+# ---------- FRAGMENTS ----------
+
+def run_props(bold=False, color=None, size_pt=None):
+    """Return a precompiled `w:rPr` fragment (elements in schema order)."""
+    parts = []
+    if bold:
+        parts.append("<w:b/>")
+    if color is not None:
+        parts.append(f'<w:color w:val="{color}"/>')
+    if size_pt is not None:
+        parts.append(f'<w:sz w:val="{int(size_pt * 2)}"/>')
+    return f"<w:rPr>{''.join(parts)}</w:rPr>" if parts else ""
+
+
+def cell_props(width_twips, fill_hex=None):
+    """Return a precompiled `w:tcPr` fragment with optional `w:shd` shading."""
+    shd = (
+        f'<w:shd w:val="clear" w:color="auto" w:fill="{fill_hex}"/>'
+        if fill_hex else ""
+    )
+    return f'<w:tcPr><w:tcW w:type="dxa" w:w="{width_twips}"/>{shd}</w:tcPr>'
+
+
+def _run_content(text):
+    # Same translation python-docx applies in `run.text = ...`:
+    # tabs become <w:tab/>, line breaks become <w:br/>.
+    if "\t" not in text and "\n" not in text and "\r" not in text:
+        return _t(text)
+    out = []
+    buf = []
+    for char in text:
+        if char == "\t" or char in "\r\n":
+            if buf:
+                out.append(_t("".join(buf)))
+                buf = []
+            out.append("<w:tab/>" if char == "\t" else "<w:br/>")
+        else:
+            buf.append(char)
+    if buf:
+        out.append(_t("".join(buf)))
+    return "".join(out)
+
+
+def _t(text):
+    if len(text.strip()) < len(text):
+        return f'<w:t xml:space="preserve">{escape(text)}</w:t>'
+    return f"<w:t>{escape(text)}</w:t>"
+
+
+def _row_xml(values, tcprs, rprs):
+    if len(values) < len(tcprs):
+        values = list(values) + [""] * (len(tcprs) - len(values))
+    cells = []
+    for value, tcpr, rpr in zip(values, tcprs, rprs):
+        text = "" if value is None else str(value)
+        if text:
+            cells.append(f"<w:tc>{tcpr}<w:p><w:r>{rpr}{_run_content(text)}</w:r></w:p></w:tc>")
+        else:
+            cells.append(f"<w:tc>{tcpr}<w:p/></w:tc>")
+    return f"<w:tr>{''.join(cells)}</w:tr>"
+
+
+def paragraph_xml(text="", rpr="", align=None):
+    """Return a `w:p` with one run, as `doc.add_paragraph().add_run(text)` builds it.
+
+    `align` is a `w:jc` value such as "left" or "center".
+    """
+    ppr = f'<w:pPr><w:jc w:val="{align}"/></w:pPr>' if align else ""
+    if not text:
+        return f"<w:p>{ppr}</w:p>" if ppr else "<w:p/>"
+    return f"<w:p>{ppr}<w:r>{rpr}{_run_content(text)}</w:r></w:p>"
+
+
+def _per_column(value, col_count):
+    """Expand a single fragment, or a short list whose last item repeats."""
+    if isinstance(value, str):
+        return [value] * col_count
+    value = list(value)
+    return value + [value[-1]] * (col_count - len(value))
+
+
+# ---------- TABLE BUILDER ----------
+
+def table_xml(headers, rows, col_width_twips, header_rpr="", body_rprs=("",),
+              body_fill=LIGHT_GREY):
+    """Return the XML string of a complete `w:tbl`.
+
+    `headers` becomes an unshaded first row styled with `header_rpr`; each
+    item of `rows` becomes a body row whose cells are shaded with
+    `body_fill`. `body_rprs` is one `w:rPr` fragment per column (the last
+    one repeats for any remaining columns).
+    """
+    return "".join(iter_table_xml(
+        headers, rows, col_width_twips, header_rpr, body_rprs, body_fill
+    ))
+
+
+def iter_table_xml(headers, rows, col_width_twips, header_rpr="", body_rprs=("",),
+                   body_fill=LIGHT_GREY, standalone=True):
+    """Yield `table_xml` piece by piece: the table head, one string per row, the close.
+
+    Lets a streaming writer emit a table without holding all of its rows.
+    With `standalone=False` the `w:` namespace is left to the enclosing
+    document instead of being declared on `w:tbl`.
+    """
+    col_count = len(headers)
+    header_tcprs = [cell_props(col_width_twips)] * col_count
+    body_tcprs = [cell_props(col_width_twips, body_fill)] * col_count
+    header_rprs = [header_rpr] * col_count
+    body_rprs = _per_column(body_rprs, col_count)
+
+    grid = f'<w:gridCol w:w="{col_width_twips}"/>' * col_count
+    open_tag = f"<w:tbl {nsdecls('w')}>" if standalone else "<w:tbl>"
+    yield (
+        open_tag
+        + '<w:tblPr><w:tblW w:type="auto" w:w="0"/>'
+        '<w:tblLook w:firstColumn="1" w:firstRow="1" w:lastColumn="0" '
+        'w:lastRow="0" w:noHBand="0" w:noVBand="1" w:val="04A0"/></w:tblPr>'
+        f"<w:tblGrid>{grid}</w:tblGrid>"
+        + _row_xml(headers, header_tcprs, header_rprs)
+    )
+    for row in rows:
+        yield _row_xml(row, body_tcprs, body_rprs)
+    yield "</w:tbl>"
+
+
+def add_bulk_table(doc, headers, rows, header_rpr="", body_rprs=("",),
+                   body_fill=LIGHT_GREY):
+    """Append a header + body table to `doc` in one parse and return it."""
+    col_width = Emu(doc._block_width // len(headers)).twips
+    tbl = parse_xml(
+        table_xml(headers, rows, col_width, header_rpr, body_rprs, body_fill)
+    )
+    doc.element.body._insert_tbl(tbl)
+    return Table(tbl, doc._body)
@@ -0,0 +1,199 @@
+"""Render one BRD per tenant from a CSV or JSON manifest.
+
+Usage:
+    python generate_brd_batch.py tenants.csv [--out-dir DIR] [--workers N] [--force]
+
+Manifest columns / keys (only ``org_name`` is required):
+    org_name, project_name, prepared_by, date, version, filename
+
+The BRD spec is compiled once into a render plan (render_plan.py, cached
+on disk); each tenant document is then written from the plan with the
+tenant's fields filled in, without a python-docx build.
+
+Builds are incremental per tenant: each output is recorded in
+BASE_DIR/.tenant_brd_state.json with a fingerprint of its fields, the
+render plan and the compression level, and a tenant is re-rendered only
+when that fingerprint changes or its file is missing or was modified.
+--force re-renders every tenant.
+"""
+import argparse
+import csv
+import hashlib
+import json
+import os
+import re
+
+import generate_brd_template
+from batch_render import print_report, run_batch
+from generate_brd_template import SPEC
+from package_writer import compression_setting
+from render_plan import load_render_plan, plan_key
+
+# ---------- CONFIG ----------
+BASE_DIR = r"C:\Users\victo\kickoff_project"
+DEFAULT_OUT_DIR = os.path.join(
+    BASE_DIR,
+    "02_Phase2_Requirements_and_Governance",
+    "Tenant_BRDs",
+)
+
+STATE_PATH = os.path.join(BASE_DIR, ".tenant_brd_state.json")
+
+BRD_FIELDS = tuple(SPEC["variables"])
+
+
+# ---------- MANIFEST ----------
+
+def load_tenant_manifest(path):
+    """Read tenants from a .csv or .json manifest as a list of dicts."""
+    if path.lower().endswith(".json"):
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        tenants = data["tenants"] if isinstance(data, dict) else data
+    else:
+        with open(path, newline="", encoding="utf-8-sig") as f:
+            tenants = list(csv.DictReader(f))
+
+    for i, tenant in enumerate(tenants, start=1):
+        if not str(tenant.get("org_name") or "").strip():
+            raise ValueError(f"Tenant #{i} in {path} has no org_name")
+    return tenants
+
+
+def check_filename(filename):
+    """Reject manifest filenames that would land outside the output folder."""
+    # Both separators are refused whatever the OS, as manifests travel.
+    if (filename in (".", "..") or "/" in filename or "\\" in filename
+            or os.path.splitdrive(filename)[0]):
+        raise ValueError(f"Manifest filename {filename!r} must be a plain file name")
+
+
+def build_jobs(tenants, out_dir):
+    """Turn manifest rows into (output_path, fields) jobs with unique filenames."""
+    jobs = []
+    seen = set()
+    for tenant in tenants:
+        # JSON manifests may hold numbers (e.g. "version": 2); coerce like make_config.
+        values = {k: str(tenant.get(k) or "").strip() for k in BRD_FIELDS}
+        fields = {k: v for k, v in values.items() if v}
+        filename = str(tenant.get("filename") or "").strip()
+        if filename:
+            check_filename(filename)
+        else:
+            safe_org = re.sub(r"[^A-Za-z0-9]+", "", fields["org_name"]) or "Tenant"
+            filename = f"UniqueEntrepreneur_BRD_{safe_org}.docx"
+        stem, ext = os.path.splitext(filename)
+        n = 2
+        while filename.lower() in seen:
+            filename = f"{stem}_{n}{ext}"
+            n += 1
+        seen.add(filename.lower())
+        jobs.append((os.path.join(out_dir, filename), fields))
+    return jobs
+
+
+# ---------- INCREMENTAL STATE ----------
+
+def load_state(path=STATE_PATH):
+    if os.path.exists(path):
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    return {}
+
+
+def save_state(state, path=STATE_PATH):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(state, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+def tenant_fingerprint(fields, plan_digest):
+    """Hash of what a tenant's BRD is made from: fields, plan and compression."""
+    payload = json.dumps(
+        {"fields": fields, "plan": plan_digest, "compression": compression_setting()},
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def is_current(entry, path, fingerprint):
+    """True when `path` was written for `fingerprint` and is unchanged since."""
+    if not entry or entry.get("fingerprint") != fingerprint:
+        return False
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return False
+    return st.st_size == entry["size"] and st.st_mtime_ns == entry["mtime_ns"]
+
+
+def record_output(state, path, fingerprint):
+    st = os.stat(path)
+    state[os.path.abspath(path)] = {
+        "fingerprint": fingerprint, "size": st.st_size, "mtime_ns": st.st_mtime_ns,
+    }
+
+
+# ---------- WORKER ----------
+
+_PLAN = None
+
+
+def _warm_worker():
+    # Load the compiled plan once per worker process, not per document.
+    global _PLAN
+    _PLAN = load_render_plan("brd")
+
+
+def render_tenant_brd(job):
+    output_path, fields = job
+    return _PLAN.write(output_path, fields)
+
+
+# ---------- MAIN ----------
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Batch-render tenant BRDs.")
+    parser.add_argument("manifest", help="CSV or JSON tenant manifest")
+    parser.add_argument("--out-dir", default=DEFAULT_OUT_DIR)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--chunksize", type=int, default=None)
+    parser.add_argument("--force", action="store_true", help="re-render every tenant")
+    parser.add_argument("--state", default=STATE_PATH, help="per-tenant build state file")
+    args = parser.parse_args(argv)
+
+    tenants = load_tenant_manifest(args.manifest)
+    os.makedirs(args.out_dir, exist_ok=True)
+    jobs = build_jobs(tenants, args.out_dir)
+    # Compile (or load) once in the parent so workers only ever read the cache.
+    load_render_plan("brd")
+
+    state = load_state(args.state)
+    plan_digest = plan_key(generate_brd_template)
+    fingerprints = {path: tenant_fingerprint(fields, plan_digest) for path, fields in jobs}
+    todo = [
+        (path, fields) for path, fields in jobs
+        if args.force or not is_current(state.get(os.path.abspath(path)), path, fingerprints[path])
+    ]
+
+    report = run_batch(
+        render_tenant_brd,
+        todo,
+        workers=args.workers,
+        chunksize=args.chunksize,
+        initializer=_warm_worker,
+    )
+    for path in report["outputs"]:
+        record_output(state, path, fingerprints[path])
+    save_state(state, args.state)
+
+    print_report(report, noun="doc")
+    print(f"{len(jobs) - len(todo)} of {len(jobs)} tenant BRD(s) already up to date")
+    print(f"✅ Tenant BRDs written to:\n{args.out_dir}")
+    return report
+
+
+if __name__ == "__main__":
+    main()
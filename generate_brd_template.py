@@ -1,10 +1,13 @@
-from docx import Document
 from docx.shared import Pt, RGBColor
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 from docx.oxml import OxmlElement
 from docx.oxml.ns import qn
 import os
 
+import docx_base
+from package_writer import save_package
+from render_plan import render_spec
+
 # ---------- CONFIG ----------
 ORG_NAME = "UNIQUE ENTREPRENEUR SOLUTIONS LIMITED"
 FOOTER_TEXT = (
@@ -14,6 +17,9 @@ FOOTER_TEXT = (
 BLUE_GREY = RGBColor(30, 55, 90)
 LIGHT_GREY_HEX = "F0F0F0"
 
+PROJECT_NAME = "Unique Entrepreneur Literacy Hub"
+PREPARED_BY = "Omole Victoria Oluwatosin"
+
 BASE_DIR = r"C:\Users\victo\kickoff_project"
 OUTPUT_PATH = os.path.join(
     BASE_DIR,
@@ -113,66 +119,114 @@ def add_text_area(doc, label):
 
     doc.add_paragraph()  # spacer
 
-# ---------- DOCUMENT CREATION ----------
-
-doc = Document()
+# ---------- SPEC ----------
+# Content as data; see render_plan for the block kinds.
+
+HELPERS = {
+    "title": add_title,
+    "subtitle": add_subtitle,
+    "field": add_label_input,
+    "section": add_section_heading,
+    "text_area": add_text_area,
+}
+
+SPEC = {
+    "variables": {
+        "project_name": PROJECT_NAME,
+        "org_name": ORG_NAME,
+        "prepared_by": PREPARED_BY,
+        "date": "Click to type",
+        "version": "1.0",
+    },
+    "preamble": [
+        ("title", "Business Requirements Document (BRD)"),
+        ("subtitle", "Phase 2 — Requirements & Governance Alignment"),
+        ("spacer",),
+        ("field", "Project Name:", "{project_name}"),
+        ("field", "Organisation:", "{org_name}"),
+        ("field", "Prepared By:", "{prepared_by}"),
+        ("field", "Date:", "{date}"),
+        ("field", "Version:", "{version}"),
+    ],
+    "sections": [
+        [
+            ("section", "1. Purpose & Background"),
+            ("text_area", "Explain the business context, target users (cooperatives, small agribusinesses, recycling SMEs), and why this platform is needed."),
+        ],
+        [
+            ("section", "2. Scope"),
+            ("text_area", "Define in-scope modules (multi-tenant LMS, course delivery, governance) and out-of-scope items (future AI, mobile apps, etc.)."),
+        ],
+        [
+            ("section", "3. Stakeholders & Roles"),
+            ("text_area", "List Platform Admin, Org Admin, School Admin, Instructor, Learner, DMP, Technical Lead, Support/Moderator, etc., with responsibilities."),
+        ],
+        [
+            ("section", "4. Functional Requirements"),
+            ("text_area", "Capture FR-01, FR-02, etc. For each: feature, description, priority, dependencies."),
+        ],
+        [
+            ("section", "5. Non-Functional Requirements"),
+            ("text_area", "Document performance targets, security (JWT, RLS), availability, localisation, accessibility, scalability, and tech constraints."),
+        ],
+        [
+            ("section", "6. Data Governance & Compliance"),
+            ("text_area", "Define data ownership, GDPR/NDPR alignment, RLS rules, consent, audit logs, retention periods, and breach handling."),
+        ],
+        [
+            ("section", "7. Reporting & Analytics"),
+            ("text_area", "Describe required dashboards: enrolment, completion, payouts, engagement by org, cooperative performance, etc."),
+        ],
+        [
+            ("section", "8. User Stories & Acceptance Criteria"),
+            ("text_area", "Include user stories per role with clear acceptance tests, e.g. 'As an Org Admin...'. Link to JIRA or backlog IDs if applicable."),
+        ],
+        [
+            ("section", "9. Risks & Assumptions"),
+            ("text_area", "List implementation risks (connectivity, adoption, compliance) and assumptions validated from Discovery."),
+        ],
+        [
+            ("section", "10. Next Steps & Sign-off"),
+            ("text_area", "Outline review steps, approvals required, and transition into Phase 3: System Design & Prototyping."),
+        ],
+    ],
+}
 
-# Default font
-style = doc.styles["Normal"]
-style.font.name = "Calibri"
-style._element.rPr.rFonts.set(qn("w:eastAsia"), "Calibri")
-style.font.size = Pt(10)
-
-# Header & footer for first (only) section
-set_header_footer(doc.sections[0])
-
-# Title block
-add_title(doc, "Business Requirements Document (BRD)")
-add_subtitle(doc, "Phase 2 — Requirements & Governance Alignment")
-doc.add_paragraph()
-
-# Metadata
-add_label_input(doc, "Project Name:", "Unique Entrepreneur Literacy Hub")
-add_label_input(doc, "Organisation:", ORG_NAME)
-add_label_input(doc, "Prepared By:", "Omole Victoria Oluwatosin")
-add_label_input(doc, "Date:", "Click to type")
-add_label_input(doc, "Version:", "1.0")
+# ---------- DOCUMENT CREATION ----------
 
-# Sections
-add_section_heading(doc, "1. Purpose & Background")
-add_text_area(doc, "Explain the business context, target users (cooperatives, small agribusinesses, recycling SMEs), and why this platform is needed.")
+def new_document():
+    """Blank document on the shared base template, with the header / footer."""
+    doc = docx_base.new_document()
 
-add_section_heading(doc, "2. Scope")
-add_text_area(doc, "Define in-scope modules (multi-tenant LMS, course delivery, governance) and out-of-scope items (future AI, mobile apps, etc.).")
+    # Header & footer for first (only) section
+    set_header_footer(doc.sections[0])
+    return doc
 
-add_section_heading(doc, "3. Stakeholders & Roles")
-add_text_area(doc, "List Platform Admin, Org Admin, School Admin, Instructor, Learner, DMP, Technical Lead, Support/Moderator, etc., with responsibilities.")
 
-add_section_heading(doc, "4. Functional Requirements")
-add_text_area(doc, "Capture FR-01, FR-02, etc. For each: feature, description, priority, dependencies.")
+def build_brd(cache=None, **fields):
+    """Build the BRD template for one organisation and return the Document.
 
-add_section_heading(doc, "5. Non-Functional Requirements")
-add_text_area(doc, "Document performance targets, security (JWT, RLS), availability, localisation, accessibility, scalability, and tech constraints.")
+    `fields` are the SPEC variables (project_name, org_name, prepared_by,
+    date, version); missing or empty ones keep their defaults.
+    """
+    return render_spec(new_document(), SPEC, HELPERS, fields, cache)
 
-add_section_heading(doc, "6. Data Governance & Compliance")
-add_text_area(doc, "Define data ownership, GDPR/NDPR alignment, RLS rules, consent, audit logs, retention periods, and breach handling.")
 
-add_section_heading(doc, "7. Reporting & Analytics")
-add_text_area(doc, "Describe required dashboards: enrolment, completion, payouts, engagement by org, cooperative performance, etc.")
+def save_brd(output_path=OUTPUT_PATH, **fields):
+    """Build a BRD with the given metadata fields and save it to `output_path`."""
+    doc = build_brd(**fields)
 
-add_section_heading(doc, "8. User Stories & Acceptance Criteria")
-add_text_area(doc, "Include user stories per role with clear acceptance tests, e.g. 'As an Org Admin...'. Link to JIRA or backlog IDs if applicable.")
+    # Ensure output directory exists
+    os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
 
-add_section_heading(doc, "9. Risks & Assumptions")
-add_text_area(doc, "List implementation risks (connectivity, adoption, compliance) and assumptions validated from Discovery.")
+    save_package(doc, output_path)
+    return output_path
 
-add_section_heading(doc, "10. Next Steps & Sign-off")
-add_text_area(doc, "Outline review steps, approvals required, and transition into Phase 3: System Design & Prototyping.")
 
-# Ensure output directory exists
-os.makedirs(os.path.dirname(OUTPUT_PATH), exist_ok=True)
+def main():
+    save_brd(OUTPUT_PATH)
+    print(f"✅ BRD Template created at:\n{OUTPUT_PATH}")
 
-# Save
-doc.save(OUTPUT_PATH)
-print(f"✅ BRD Template created at:\n{OUTPUT_PATH}")
 
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,16 @@
 import os
-from docx import Document
 from docx.shared import Pt, RGBColor
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 from docx.oxml import OxmlElement
 from docx.oxml.ns import qn
 
+import docx_base
+import docx_table_builder
+from docx_table_builder import add_bulk_table, run_props
+from package_writer import save_package
+from render_plan import render_spec
+from section_cache import CACHE_DIR, SectionCache, style_salt
+
 # ---------- CONFIG ----------
 ORG_NAME = "UNIQUE ENTREPRENEUR SOLUTIONS LIMITED"
 FOOTER_TEXT = (
@@ -14,8 +20,11 @@ FOOTER_TEXT = (
 BLUE_GREY = RGBColor(30, 55, 90)
 LIGHT_GREY = "F0F0F0"
 
+HEADER_RPR = run_props(bold=True, color=BLUE_GREY, size_pt=10)
+FIRST_COL_RPR = run_props(bold=True, color=BLUE_GREY, size_pt=10)
+BODY_RPR = run_props(color=RGBColor(120, 120, 120), size_pt=10)
+
 BASE_DIR = r"C:\Users\victo\kickoff_project\02_Phase2_Requirements_and_Governance"
-os.makedirs(BASE_DIR, exist_ok=True)
 
 OUTPUT_PATH = os.path.join(
     BASE_DIR,
@@ -97,182 +106,201 @@ def add_text_area(doc, label):
 
 def add_matrix_table(doc, title, headers, rows_hints):
     add_section_heading(doc, title)
-    table = doc.add_table(rows=1, cols=len(headers))
-    # header row
-    for i, h in enumerate(headers):
-        cell = table.rows[0].cells[i]
-        pr = cell.paragraphs[0].add_run(h)
-        pr.font.bold = True
-        pr.font.size = Pt(10)
-        pr.font.color.rgb = BLUE_GREY
-    # body rows (with hints, editable)
-    for row_hint in rows_hints:
-        row_cells = table.add_row().cells
-        for i, text in enumerate(row_hint):
-            para = row_cells[i].paragraphs[0]
-            run = para.add_run(text)
-            run.font.size = Pt(10)
-            if i == 0:
-                run.font.bold = True
-                run.font.color.rgb = BLUE_GREY
-            else:
-                run.font.color.rgb = RGBColor(120, 120, 120)
-            shade_cell(row_cells[i])
+    # Whole table is emitted in one pass; see docx_table_builder.
+    add_bulk_table(
+        doc,
+        headers,
+        rows_hints,
+        header_rpr=HEADER_RPR,
+        body_rprs=(FIRST_COL_RPR, BODY_RPR),
+        body_fill=LIGHT_GREY,
+    )
+    doc.add_paragraph()
+
+def add_meta_table(doc, rows):
+    table = doc.add_table(rows=len(rows), cols=2)
+    for row, (label, value) in zip(table.rows, rows):
+        c1, c2 = row.cells
+        r1 = c1.paragraphs[0].add_run(label)
+        r1.font.bold = True
+        r1.font.color.rgb = BLUE_GREY
+        r2 = c2.paragraphs[0].add_run(value)
+        r2.font.color.rgb = RGBColor(120,120,120)
+        shade_cell(c2)
     doc.add_paragraph()
 
+# ---------- SPEC ----------
+# Content as data; see render_plan for the block kinds.
+
+HELPERS = {
+    "title": add_title,
+    "subtitle": add_subtitle,
+    "section": add_section_heading,
+    "text_area": add_text_area,
+    "meta": add_meta_table,
+    "matrix": add_matrix_table,
+}
+
+SPEC = {
+    "variables": {
+        "project_name": "Unique Entrepreneur Literacy Hub",
+        "org_name": ORG_NAME,
+        "version": "1.0 (Template)",
+    },
+    "preamble": [
+        ("title", "Data Governance Framework"),
+        ("subtitle", "Phase 2 — Requirements & Governance Alignment"),
+        ("spacer",),
+        ("meta", [
+            ("Project Name:", "{project_name}"),
+            ("Organisation:", "{org_name}"),
+            ("Version:", "{version}"),
+        ]),
+    ],
+    "sections": [
+        [
+            ("section", "1. Purpose & Scope"),
+            ("text_area", "Define the objectives of data governance for the platform, "
+                          "covering multi-tenant co-ops, agribusiness, recycling SMEs in the UK & Nigeria."),
+        ],
+        [
+            ("section", "2. Data Governance Principles"),
+            ("text_area", "Document core principles, e.g. accountability, transparency, security, privacy, data minimisation, "
+                          "and responsible use of learner and financial data."),
+        ],
+        [
+            ("matrix", "3. Roles & Responsibilities",
+             ["Role", "Key Responsibilities", "Notes"],
+             [
+                 ["Platform Admin",
+                  "Global configuration, tenant provisioning, enforcement of policies.",
+                  "Click to refine responsibilities."],
+                 ["Org Admin / Co-operative Lead",
+                  "Manage users, courses, and local compliance within their organisation.",
+                  "Click to specify what they own vs. platform."],
+                 ["Data Management Professional (DMP)",
+                  "Define policies, oversee data quality, approve retention & exports.",
+                  "Click to list named individuals or teams."],
+                 ["Technical Lead",
+                  "Implements security controls, backups, integrations.",
+                  "Click to reference architecture documents."],
+             ]),
+        ],
+        [
+            ("section", "4. Data Inventory & Classification"),
+            ("matrix", "4.1 Key Data Entities",
+             ["Data Entity", "Description", "Classification", "Owner"],
+             [
+                 ["User / Member Profile",
+                  "Names, contact info, role, org/school mapping.",
+                  "Confidential (Personal Data)",
+                  "Org Admin / Platform Admin"],
+                 ["Course & Content",
+                  "Titles, modules, media, metadata.",
+                  "Internal / Public (varies by visibility)",
+                  "Instructor / Org Admin"],
+                 ["Learning Records",
+                  "Enrolments, quiz scores, completions, certificates.",
+                  "Confidential (Educational Data)",
+                  "Platform + Org Admin"],
+                 ["Payments & Payouts",
+                  "Transactions, payouts, invoices.",
+                  "Highly Confidential (Financial Data)",
+                  "Platform Admin / Finance"],
+             ]),
+        ],
+        [
+            ("section", "5. Data Access & Row-Level Security (RLS)"),
+            ("text_area", "Describe how access is restricted:\n"
+                          "- Isolation by org_id and (if applicable) school_id.\n"
+                          "- Platform Admin: cross-tenant read (with controls).\n"
+                          "- Org Admin: access limited to their organisation.\n"
+                          "- Instructors: access only to their courses and enrolled learners.\n"
+                          "- Students: access only to their own records.\n"
+                          "- DMP: governed access for audits and compliance."),
+        ],
+        [
+            ("section", "6. Data Retention & Deletion"),
+            ("matrix", "6.1 Retention Rules (Template)",
+             ["Data Category", "Retention Period", "Notes / Legal Basis"],
+             [
+                 ["User Accounts",
+                  "Active + X years after last activity",
+                  "Configure per org; align with GDPR/NDPR."],
+                 ["Learning Records",
+                  "X years after completion",
+                  "Sufficient for reporting and audits."],
+                 ["Payments & Invoices",
+                  "7+ years",
+                  "Financial regulations."],
+                 ["Audit Logs",
+                  "X years",
+                  "Support investigations and compliance."],
+             ]),
+        ],
+        [
+            ("section", "7. Data Quality Management"),
+            ("text_area", "Define validation rules, duplicate handling, mandatory fields, "
+                          "and responsibilities for correcting inaccurate records."),
+        ],
+        [
+            ("section", "8. Security & Privacy Controls"),
+            ("text_area", "Document controls: HTTPS, encryption at rest, RBAC, RLS, backups, "
+                          "malware scanning for uploads, incident response, DPIA requirements, "
+                          "and how GDPR/NDPR rights (access, rectification, erasure) are supported."),
+        ],
+        [
+            ("section", "9. Audit, Monitoring & Reporting"),
+            ("text_area", "Define which events are logged (logins, role changes, data exports, grade changes), "
+                          "how often logs are reviewed, and who has access."),
+        ],
+        [
+            ("section", "10. Data Lineage & Integrations"),
+            ("text_area", "List integrated systems (SSO, payments, video hosting, analytics) and describe "
+                          "how data flows between them, including ownership and responsibilities."),
+        ],
+        [
+            ("section", "11. Approval & Review"),
+            ("text_area", "Capture approvals (DMP, Platform Admin, Legal) and define review frequency "
+                          "for this framework (e.g. annually or after major platform changes)."),
+        ],
+    ],
+}
+
 # ---------- DOCUMENT CREATION ----------
 
-doc = Document()
-
-# Default font
-style = doc.styles["Normal"]
-style.font.name = "Calibri"
-style._element.rPr.rFonts.set(qn("w:eastAsia"), "Calibri")
-style.font.size = Pt(10)
-
-set_header_footer(doc.sections[0])
-
-# Cover
-add_title(doc, "Data Governance Framework")
-add_subtitle(doc, "Phase 2 — Requirements & Governance Alignment")
-doc.add_paragraph()
-
-# Metadata
-meta_table = doc.add_table(rows=3, cols=2)
-labels = ["Project Name:", "Organisation:", "Version:"]
-values = ["Unique Entrepreneur Literacy Hub", ORG_NAME, "1.0 (Template)"]
-for i in range(3):
-    c1, c2 = meta_table.rows[i].cells
-    r1 = c1.paragraphs[0].add_run(labels[i])
-    r1.font.bold = True
-    r1.font.color.rgb = BLUE_GREY
-    r2 = c2.paragraphs[0].add_run(values[i])
-    r2.font.color.rgb = RGBColor(120,120,120)
-    shade_cell(c2)
-doc.add_paragraph()
-
-# 1. Purpose & Scope
-add_section_heading(doc, "1. Purpose & Scope")
-add_text_area(doc, "Define the objectives of data governance for the platform, "
-                   "covering multi-tenant co-ops, agribusiness, recycling SMEs in the UK & Nigeria.")
-
-# 2. Data Governance Principles
-add_section_heading(doc, "2. Data Governance Principles")
-add_text_area(doc, "Document core principles, e.g. accountability, transparency, security, privacy, data minimisation, "
-                   "and responsible use of learner and financial data.")
-
-# 3. Roles & Responsibilities (RACI-style overview)
-add_matrix_table(
-    doc,
-    "3. Roles & Responsibilities",
-    ["Role", "Key Responsibilities", "Notes"],
-    [
-        ["Platform Admin",
-         "Global configuration, tenant provisioning, enforcement of policies.",
-         "Click to refine responsibilities."],
-        ["Org Admin / Co-operative Lead",
-         "Manage users, courses, and local compliance within their organisation.",
-         "Click to specify what they own vs. platform."],
-        ["Data Management Professional (DMP)",
-         "Define policies, oversee data quality, approve retention & exports.",
-         "Click to list named individuals or teams."],
-        ["Technical Lead",
-         "Implements security controls, backups, integrations.",
-         "Click to reference architecture documents."],
-    ]
-)
+def new_document():
+    """Blank document on the shared base template, with the header / footer."""
+    doc = docx_base.new_document()
 
-# 4. Data Inventory & Classification
-add_section_heading(doc, "4. Data Inventory & Classification")
-add_matrix_table(
-    doc,
-    "4.1 Key Data Entities",
-    ["Data Entity", "Description", "Classification", "Owner"],
-    [
-        ["User / Member Profile",
-         "Names, contact info, role, org/school mapping.",
-         "Confidential (Personal Data)",
-         "Org Admin / Platform Admin"],
-        ["Course & Content",
-         "Titles, modules, media, metadata.",
-         "Internal / Public (varies by visibility)",
-         "Instructor / Org Admin"],
-        ["Learning Records",
-         "Enrolments, quiz scores, completions, certificates.",
-         "Confidential (Educational Data)",
-         "Platform + Org Admin"],
-        ["Payments & Payouts",
-         "Transactions, payouts, invoices.",
-         "Highly Confidential (Financial Data)",
-         "Platform Admin / Finance"],
-    ]
-)
+    set_header_footer(doc.sections[0])
+    return doc
 
-# 5. Data Access & Row-Level Security (RLS)
-add_section_heading(doc, "5. Data Access & Row-Level Security (RLS)")
-add_text_area(doc,
-              "Describe how access is restricted:\n"
-              "- Isolation by org_id and (if applicable) school_id.\n"
-              "- Platform Admin: cross-tenant read (with controls).\n"
-              "- Org Admin: access limited to their organisation.\n"
-              "- Instructors: access only to their courses and enrolled learners.\n"
-              "- Students: access only to their own records.\n"
-              "- DMP: governed access for audits and compliance.")
-
-# 6. Data Retention & Deletion
-add_section_heading(doc, "6. Data Retention & Deletion")
-add_matrix_table(
-    doc,
-    "6.1 Retention Rules (Template)",
-    ["Data Category", "Retention Period", "Notes / Legal Basis"],
-    [
-        ["User Accounts",
-         "Active + X years after last activity",
-         "Configure per org; align with GDPR/NDPR."],
-        ["Learning Records",
-         "X years after completion",
-         "Sufficient for reporting and audits."],
-        ["Payments & Invoices",
-         "7+ years",
-         "Financial regulations."],
-        ["Audit Logs",
-         "X years",
-         "Support investigations and compliance."],
-    ]
-)
 
-# 7. Data Quality Management
-add_section_heading(doc, "7. Data Quality Management")
-add_text_area(doc,
-              "Define validation rules, duplicate handling, mandatory fields, "
-              "and responsibilities for correcting inaccurate records.")
-
-# 8. Security & Privacy Controls
-add_section_heading(doc, "8. Security & Privacy Controls")
-add_text_area(doc,
-              "Document controls: HTTPS, encryption at rest, RBAC, RLS, backups, "
-              "malware scanning for uploads, incident response, DPIA requirements, "
-              "and how GDPR/NDPR rights (access, rectification, erasure) are supported.")
-
-# 9. Audit, Monitoring & Reporting
-add_section_heading(doc, "9. Audit, Monitoring & Reporting")
-add_text_area(doc,
-              "Define which events are logged (logins, role changes, data exports, grade changes), "
-              "how often logs are reviewed, and who has access.")
-
-# 10. Data Lineage & Integrations
-add_section_heading(doc, "10. Data Lineage & Integrations")
-add_text_area(doc,
-              "List integrated systems (SSO, payments, video hosting, analytics) and describe "
-              "how data flows between them, including ownership and responsibilities.")
-
-# 11. Approval & Review
-add_section_heading(doc, "11. Approval & Review")
-add_text_area(doc,
-              "Capture approvals (DMP, Platform Admin, Legal) and define review frequency "
-              "for this framework (e.g. annually or after major platform changes).")
-
-# Save
-doc.save(OUTPUT_PATH)
-print(f"✅ Data Governance Framework template created at:\n{OUTPUT_PATH}")
+def build_governance_framework(cache=None, **variables):
+    """Build the document; `variables` (project_name, org_name, version) override the SPEC defaults."""
+    return render_spec(new_document(), SPEC, HELPERS, variables, cache)
+
+
+def section_cache():
+    """SectionCache for this document, salted with its section helpers."""
+    salt = style_salt(
+        [shade_cell, add_section_heading, add_text_area, add_matrix_table, docx_table_builder],
+        [BLUE_GREY, LIGHT_GREY, HEADER_RPR, FIRST_COL_RPR, BODY_RPR],
+    )
+    return SectionCache(os.path.join(CACHE_DIR, "governance_framework"), salt)
+
+
+def main():
+    os.makedirs(BASE_DIR, exist_ok=True)
+    cache = section_cache()
+    doc = build_governance_framework(cache)
+    cache.prune()
+
+    # Save
+    save_package(doc, OUTPUT_PATH)
+    print(f"✅ Data Governance Framework template created at:\n{OUTPUT_PATH}")
+
 
+if __name__ == "__main__":
+    main()
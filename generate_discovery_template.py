@@ -1,10 +1,20 @@
-from docx import Document
+import argparse
+import json
+from concurrent.futures import ProcessPoolExecutor
+
+from lxml import etree
+
 from docx.shared import Pt, RGBColor
 from docx.enum.text import WD_ALIGN_PARAGRAPH
-from docx.oxml import OxmlElement
+from docx.oxml import OxmlElement, parse_xml
 from docx.oxml.ns import qn
 
+import docx_base
+from package_writer import save_package
+
 # ---------- CONFIG ----------
+filename = "UniqueEntrepreneur_Discovery_Interview_Template.docx"
+
 ORG_NAME = "UNIQUE ENTREPRENEUR SOLUTIONS LIMITED"
 FOOTER_TEXT = ("Omole Victoria Oluwatosin — Business Analyst | Data Analyst | "
                "Data Management Professional | Frontend & Backend Engineer")
@@ -189,116 +199,173 @@ def add_summary_block(doc):
             shade_cell(row_cells[j])
 
 
+# ---------- SECTIONS ----------
+
+# (section title, key questions) for each stakeholder group
+SECTIONS = [
+    (
+        "Section A – Organisation Admin / Owner",
+        [
+            "How is your organisation currently delivering and tracking online learning?",
+            "What challenges do you face managing multiple schools or departments?",
+            "What permissions or controls are most important for your admins?",
+            "How do you handle enrolments, attendance, and reporting today?",
+            "Which integrations (e.g., Microsoft Entra ID, Google Workspace) do you rely on?",
+            "How do you ensure compliance and data privacy currently?",
+            "Which analytics or reports are essential for you?",
+            "What would make you adopt this new platform?",
+        ],
+    ),
+    (
+        "Section B – Instructor / Teacher",
+        [
+            "Describe your typical process for planning and creating a course.",
+            "Which content formats do you use (video, PDF, quizzes, assignments, live sessions)?",
+            "How do you currently manage assessments and feedback?",
+            "What features would simplify your teaching workflow?",
+            "How would you like to track student progress and performance?",
+            "What monetisation or pricing options do you need?",
+            "How should certificates and feedback be managed?",
+            "What frustrates you about existing platforms?",
+        ],
+    ),
+    (
+        "Section C – Student / Learner",
+        [
+            "What motivates you to enrol on an online course?",
+            "Which learning formats do you prefer (video, reading, interactive, live)?",
+            "Describe a recent good or poor experience using an online learning platform.",
+            "What frustrates you about enrolment or navigation?",
+            "Do you need mobile or offline access?",
+            "How should your progress and certificates be displayed or shared?",
+            "Which types of notifications are useful (deadlines, new content, reminders)?",
+            "What does a successful learning experience look like for you?",
+        ],
+    ),
+    (
+        "Section D – Data Management / Compliance",
+        [
+            "Which data protection and privacy regulations apply to your organisation?",
+            "How long should learner and course data be retained?",
+            "Who should own data within the platform for your organisation?",
+            "What are your requirements for consent, audit logs, and data export?",
+            "How do you currently manage subject access and deletion requests?",
+            "Which roles should have access to what categories of data?",
+            "What backup and disaster recovery expectations do you have?",
+            "What controls or reports are needed for audits?",
+        ],
+    ),
+    (
+        "Section E – Executive Sponsor / Product Owner",
+        [
+            "What business outcomes define success for this platform?",
+            "Which problems are we solving that are most urgent?",
+            "What are the top three KPIs you expect to see post-launch?",
+            "What does a realistic, valuable MVP include?",
+            "What are the critical timeline or budget boundaries?",
+            "Are there strategic integrations or partners we must support?",
+            "What risks or failure modes concern you most?",
+        ],
+    ),
+    (
+        "Section F – Technical / Engineering Lead",
+        [
+            "What preferred technologies or platforms should we align with?",
+            "Are there existing systems or APIs we need to integrate with (SSO, LMS, SIS, payments)?",
+            "What security or hosting constraints must be followed?",
+            "How should environments (dev/test/prod) be structured?",
+            "Any specific logging, monitoring, or observability requirements?",
+            "What are the main technical risks you foresee?",
+        ],
+    ),
+]
+
+
 # ---------- DOCUMENT CREATION ----------
 
-doc = Document()
-
-# default font
-style = doc.styles["Normal"]
-style.font.name = "Calibri"
-style._element.rPr.rFonts.set(qn("w:eastAsia"), "Calibri")
-style.font.size = Pt(10)
-
-set_header_footer(doc.sections[0])
-
-# A – Org Admin
-create_generic_header_block(doc, "Section A – Organisation Admin / Owner")
-add_question_block(doc, "Key Questions", [
-    "How is your organisation currently delivering and tracking online learning?",
-    "What challenges do you face managing multiple schools or departments?",
-    "What permissions or controls are most important for your admins?",
-    "How do you handle enrolments, attendance, and reporting today?",
-    "Which integrations (e.g., Microsoft Entra ID, Google Workspace) do you rely on?",
-    "How do you ensure compliance and data privacy currently?",
-    "Which analytics or reports are essential for you?",
-    "What would make you adopt this new platform?",
-])
-add_summary_block(doc)
-
-add_section_break(doc)
-set_header_footer(doc.sections[-1])
-
-# B – Instructor
-create_generic_header_block(doc, "Section B – Instructor / Teacher")
-add_question_block(doc, "Key Questions", [
-    "Describe your typical process for planning and creating a course.",
-    "Which content formats do you use (video, PDF, quizzes, assignments, live sessions)?",
-    "How do you currently manage assessments and feedback?",
-    "What features would simplify your teaching workflow?",
-    "How would you like to track student progress and performance?",
-    "What monetisation or pricing options do you need?",
-    "How should certificates and feedback be managed?",
-    "What frustrates you about existing platforms?",
-])
-add_summary_block(doc)
-
-add_section_break(doc)
-set_header_footer(doc.sections[-1])
-
-# C – Student
-create_generic_header_block(doc, "Section C – Student / Learner")
-add_question_block(doc, "Key Questions", [
-    "What motivates you to enrol on an online course?",
-    "Which learning formats do you prefer (video, reading, interactive, live)?",
-    "Describe a recent good or poor experience using an online learning platform.",
-    "What frustrates you about enrolment or navigation?",
-    "Do you need mobile or offline access?",
-    "How should your progress and certificates be displayed or shared?",
-    "Which types of notifications are useful (deadlines, new content, reminders)?",
-    "What does a successful learning experience look like for you?",
-])
-add_summary_block(doc)
-
-add_section_break(doc)
-set_header_footer(doc.sections[-1])
-
-# D – Data Management / Compliance
-create_generic_header_block(doc, "Section D – Data Management / Compliance")
-add_question_block(doc, "Key Questions", [
-    "Which data protection and privacy regulations apply to your organisation?",
-    "How long should learner and course data be retained?",
-    "Who should own data within the platform for your organisation?",
-    "What are your requirements for consent, audit logs, and data export?",
-    "How do you currently manage subject access and deletion requests?",
-    "Which roles should have access to what categories of data?",
-    "What backup and disaster recovery expectations do you have?",
-    "What controls or reports are needed for audits?",
-])
-add_summary_block(doc)
-
-add_section_break(doc)
-set_header_footer(doc.sections[-1])
-
-# E – Executive Sponsor
-create_generic_header_block(doc, "Section E – Executive Sponsor / Product Owner")
-add_question_block(doc, "Key Questions", [
-    "What business outcomes define success for this platform?",
-    "Which problems are we solving that are most urgent?",
-    "What are the top three KPIs you expect to see post-launch?",
-    "What does a realistic, valuable MVP include?",
-    "What are the critical timeline or budget boundaries?",
-    "Are there strategic integrations or partners we must support?",
-    "What risks or failure modes concern you most?",
-])
-add_summary_block(doc)
-
-add_section_break(doc)
-set_header_footer(doc.sections[-1])
-
-# F – Technical Lead
-create_generic_header_block(doc, "Section F – Technical / Engineering Lead")
-add_question_block(doc, "Key Questions", [
-    "What preferred technologies or platforms should we align with?",
-    "Are there existing systems or APIs we need to integrate with (SSO, LMS, SIS, payments)?",
-    "What security or hosting constraints must be followed?",
-    "How should environments (dev/test/prod) be structured?",
-    "Any specific logging, monitoring, or observability requirements?",
-    "What are the main technical risks you foresee?",
-])
-add_summary_block(doc)
-
-# Save
-filename = "UniqueEntrepreneur_Discovery_Interview_Template.docx"
-doc.save(filename)
-print(f"✅ Created: {filename}")
+def new_document():
+    doc = docx_base.new_document()
+
+    set_header_footer(doc.sections[0])
+    return doc
+
+
+def render_section(doc, title, questions):
+    create_generic_header_block(doc, title)
+    add_question_block(doc, "Key Questions", questions)
+    add_summary_block(doc)
+
+
+def render_section_xml(section):
+    """Render one section in a scratch document and return its `w:body` XML.
+
+    Runs in worker processes; the scratch document has the same default
+    style as the real one so the fragment can be spliced in unchanged.
+    """
+    title, questions = section
+    doc = new_document()
+    render_section(doc, title, questions)
+    return etree.tostring(doc.element.body)
+
+
+def splice_body(doc, body_xml):
+    """Move the block content of a rendered `w:body` into `doc`.
+
+    The fragment's own `w:sectPr` is dropped, so the document keeps its
+    section properties (page setup, header/footer references).
+    """
+    body = doc.element.body
+    sectPr = body.sectPr
+    for child in parse_xml(body_xml):
+        if child.tag != qn("w:sectPr"):
+            sectPr.addprevious(child)
+
+
+def build_discovery_template(sections=SECTIONS, workers=1):
+    """Build the interview template; render sections in `workers` processes."""
+    doc = new_document()
+
+    if workers and workers > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(sections))) as pool:
+            fragments = list(pool.map(render_section_xml, sections))
+    else:
+        fragments = None
+
+    for i, (title, questions) in enumerate(sections):
+        if i:
+            add_section_break(doc)
+            set_header_footer(doc.sections[-1])
+        if fragments is None:
+            render_section(doc, title, questions)
+        else:
+            splice_body(doc, fragments[i])
+
+    return doc
+
+
+def load_question_bank(path):
+    """Read [[title, [questions...]], ...] or {title: [questions...]} from JSON."""
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    items = data.items() if isinstance(data, dict) else data
+    return [(title, list(questions)) for title, questions in items]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build the discovery interview template.")
+    parser.add_argument("--questions", help="JSON question bank (default: built-in sections)")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="render sections in this many processes")
+    parser.add_argument("--output", default=filename)
+    args = parser.parse_args(argv)
+
+    sections = load_question_bank(args.questions) if args.questions else SECTIONS
+    doc = build_discovery_template(sections, workers=args.workers)
+
+    # Save
+    save_package(doc, args.output)
+    print(f"✅ Created: {args.output}")
+
 
+if __name__ == "__main__":
+    main()
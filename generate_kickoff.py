@@ -1,37 +1,67 @@
+import copy
+import io
+import re
+from functools import lru_cache
+
 from pptx import Presentation
 from pptx.util import Inches, Pt
 from pptx.dml.color import RGBColor
 
+from package_writer import save_package
+
+BLUE_GREY = RGBColor(30, 55, 90)
+WHITE = RGBColor(255, 255, 255)
+CONTENT_LAYOUT = 1  # Title + Content
+
+DEFAULTS = {
+    "client": "Client",
+    "project": "Project",
+    "phase": "Phase 1 Kick-off",
+    "ba": "Omole Victoria Oluwatosin",
+    "mvp_month": "Month 7",
+    "pilot_orgs": "3",
+    "completion_rate": "80",
+    "paid_courses": "5",
+}
+
+
+def make_config(**fields):
+    """Deck config from `fields` (keys of DEFAULTS); blanks fall back to defaults."""
+    cfg = {k: (str(fields.get(k) or "").strip() or v) for k, v in DEFAULTS.items()}
+
+    # build output filename; drop whitespace and characters no filename may hold
+    safe_client = re.sub(r'[\s\\/:*?"<>|]+', "", cfg["client"])
+    safe_phase = re.sub(r'[\s\\/:*?"<>|]+', "", cfg["phase"])
+    cfg["output_filename"] = (
+        str(fields.get("output_filename") or "").strip()
+        or f"{safe_phase}_Kickoff_{safe_client}.pptx"
+    )
+    return cfg
+
 
 def get_project_details():
     print("=== Kickoff Deck Generator ===")
-    client_name = input("Client / Organisation Name: ").strip() or "Client"
-    project_name = input("Project Name: ").strip() or "Project"
-    phase_name = input("Phase Name (e.g. 'Phase 1 Kick-off'): ").strip() or "Phase 1 Kick-off"
-    ba_name = input("Your Name (BA / Lead): ").strip() or "Omole Victoria Oluwatosin"
+    client_name = input("Client / Organisation Name: ")
+    project_name = input("Project Name: ")
+    phase_name = input("Phase Name (e.g. 'Phase 1 Kick-off'): ")
+    ba_name = input("Your Name (BA / Lead): ")
 
     # basic targets (you can tune per run)
-    mvp_month = input("MVP Target (e.g. 'Month 7') [press Enter to use 'Month 7']: ").strip() or "Month 7"
-    pilot_orgs = input("Pilot orgs target [default 3]: ").strip() or "3"
-    completion_rate = input("Completion rate target % [default 80]: ").strip() or "80"
-    paid_courses = input("Paid offerings / courses target [default 5]: ").strip() or "5"
-
-    # build output filename
-    safe_client = client_name.replace(" ", "")
-    safe_phase = phase_name.replace(" ", "")
-    output_filename = f"{safe_phase}_Kickoff_{safe_client}.pptx"
-
-    return {
-        "client": client_name,
-        "project": project_name,
-        "phase": phase_name,
-        "ba": ba_name,
-        "mvp_month": mvp_month,
-        "pilot_orgs": pilot_orgs,
-        "completion_rate": completion_rate,
-        "paid_courses": paid_courses,
-        "output_filename": output_filename,
-    }
+    mvp_month = input("MVP Target (e.g. 'Month 7') [press Enter to use 'Month 7']: ")
+    pilot_orgs = input("Pilot orgs target [default 3]: ")
+    completion_rate = input("Completion rate target % [default 80]: ")
+    paid_courses = input("Paid offerings / courses target [default 5]: ")
+
+    return make_config(
+        client=client_name,
+        project=project_name,
+        phase=phase_name,
+        ba=ba_name,
+        mvp_month=mvp_month,
+        pilot_orgs=pilot_orgs,
+        completion_rate=completion_rate,
+        paid_courses=paid_courses,
+    )
 
 
 def build_slides(cfg):
@@ -83,7 +113,7 @@ def build_slides(cfg):
             f"- Business Analysis – {cfg['ba']}\n"
             f"- Data & Reporting – {cfg['ba']}\n"
             f"- Data Governance & Compliance – {cfg['ba']}\n"
-            "- Product / Engineering – To be confirmed with {cfg['client']}"
+            f"- Product / Engineering – To be confirmed with {cfg['client']}"
         ),
         (
             "Discovery Plan (3 Weeks)",
@@ -132,48 +162,66 @@ def build_slides(cfg):
     ]
 
 
-def generate_kickoff_pptx(cfg):
+def footer_text(cfg):
+    return f"{cfg['ba']} — Business Analyst | Data / Reporting | Data Governance"
+
+
+@lru_cache(maxsize=16)
+def branded_template(footer, background=WHITE, footer_color=BLUE_GREY):
+    """Package bytes of a 16:9 deck whose Title + Content layout carries the
+    background and footer, built once per theme (per process).
+    """
     prs = Presentation()
     prs.slide_width = Inches(13.33)
     prs.slide_height = Inches(7.5)
+    layout = prs.slide_layouts[CONTENT_LAYOUT]
 
-    blue_grey = RGBColor(30, 55, 90)
-    white = RGBColor(255, 255, 255)
+    layout.background.fill.solid()
+    layout.background.fill.fore_color.rgb = background
 
-    slides = build_slides(cfg)
+    # Layouts have no add_textbox(); build the footer on a scratch slide,
+    # move its shape into the layout, then drop the slide.
+    scratch = prs.slides.add_slide(layout)
+    textbox = scratch.shapes.add_textbox(Inches(0.5), Inches(6.8), Inches(12), Inches(0.4))
+    p = textbox.text_frame.add_paragraph()
+    p.text = footer
+    p.font.size = Pt(10)
+    p.font.color.rgb = footer_color
+    footer_sp = copy.deepcopy(textbox._element)
+    footer_sp.nvSpPr.cNvPr.id = layout.shapes._next_shape_id
+    layout.shapes._spTree.append(footer_sp)
 
-    for title, body in slides:
-        layout = prs.slide_layouts[1]  # Title + Content
-        slide = prs.slides.add_slide(layout)
+    sld_id = prs.slides._sldIdLst[-1]
+    prs.part.drop_rel(sld_id.rId)
+    prs.slides._sldIdLst.remove(sld_id)
 
-        slide.background.fill.solid()
-        slide.background.fill.fore_color.rgb = white
+    buf = io.BytesIO()
+    prs.save(buf)
+    return buf.getvalue()
 
-        slide.shapes.title.text = title
 
-        body_placeholder = slide.placeholders[1]
-        body_placeholder.text = body
+def generate_kickoff_pptx(cfg, output_path=None):
+    prs = Presentation(io.BytesIO(branded_template(footer_text(cfg))))
+    layout = prs.slide_layouts[CONTENT_LAYOUT]
 
-        # footer
-        left = Inches(0.5)
-        top = Inches(6.8)
-        width = Inches(12)
-        height = Inches(0.4)
-        textbox = slide.shapes.add_textbox(left, top, width, height)
-        p = textbox.text_frame.add_paragraph()
-        p.text = (
-            f"{cfg['ba']} — Business Analyst | Data / Reporting | Data Governance"
-        )
-        p.font.size = Pt(10)
-        p.font.color.rgb = blue_grey
+    for title, body in build_slides(cfg):
+        slide = prs.slides.add_slide(layout)
+        slide.shapes.title.text = title
+        slide.placeholders[1].text = body
 
-    prs.save(cfg["output_filename"])
-    print(f"\n✅ PowerPoint file created: {cfg['output_filename']}")
+    output_path = output_path or cfg["output_filename"]
+    save_package(prs, output_path)
+    return output_path
 
 
-if __name__ == "__main__":
+def main():
     config = get_project_details()
     generate_kickoff_pptx(config)
+    print(f"\n✅ PowerPoint file created: {config['output_filename']}")
+
+
+if __name__ == "__main__":
+    main()
 
 
 
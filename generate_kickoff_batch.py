@@ -0,0 +1,117 @@
+"""Render one kickoff deck per client from a CSV or JSON manifest.
+
+Usage:
+    python generate_kickoff_batch.py clients.csv [--out-dir DIR] [--workers N]
+
+Manifest columns / keys (only ``client`` is required; blanks use the
+defaults in generate_kickoff.DEFAULTS):
+    client, project, phase, ba, mvp_month, pilot_orgs, completion_rate,
+    paid_courses, filename
+"""
+import argparse
+import csv
+import json
+import os
+import sys
+
+from batch_render import print_report, run_batch
+
+# ---------- CONFIG ----------
+BASE_DIR = r"C:\Users\victo\kickoff_project"
+DEFAULT_OUT_DIR = os.path.join(BASE_DIR, "00_Kickoff_Decks")
+
+
+# ---------- MANIFEST ----------
+
+def load_client_manifest(path):
+    """Read clients from a .csv or .json manifest as a list of dicts."""
+    if path.lower().endswith(".json"):
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        clients = data["clients"] if isinstance(data, dict) else data
+    else:
+        with open(path, newline="", encoding="utf-8-sig") as f:
+            clients = list(csv.DictReader(f))
+
+    for i, client in enumerate(clients, start=1):
+        if not str(client.get("client") or "").strip():
+            raise ValueError(f"Client #{i} in {path} has no client name")
+    return clients
+
+
+def build_jobs(clients, out_dir):
+    """Turn manifest rows into (output_path, config) jobs with unique filenames.
+
+    Returns (jobs, failures); a row whose filename would land outside
+    `out_dir` becomes a (client, reason) failure instead of stopping the batch.
+    """
+    from generate_brd_batch import check_filename
+    from generate_kickoff import make_config
+
+    jobs = []
+    failures = []
+    seen = set()
+    for client in clients:
+        cfg = make_config(**dict(client, output_filename=client.get("filename")))
+        filename = cfg["output_filename"]
+        try:
+            check_filename(filename)
+        except ValueError as exc:
+            failures.append((cfg["client"], str(exc)))
+            continue
+        stem, ext = os.path.splitext(filename)
+        n = 2
+        while filename.lower() in seen:
+            filename = f"{stem}_{n}{ext}"
+            n += 1
+        seen.add(filename.lower())
+        cfg["output_filename"] = filename
+        jobs.append((os.path.join(out_dir, filename), cfg))
+    return jobs, failures
+
+
+# ---------- WORKER ----------
+
+def _warm_worker():
+    # Pay the python-pptx import once per worker process, not per deck.
+    import generate_kickoff  # noqa: F401
+
+
+def render_client_deck(job):
+    from generate_kickoff import generate_kickoff_pptx
+
+    output_path, cfg = job
+    return generate_kickoff_pptx(cfg, output_path)
+
+
+# ---------- MAIN ----------
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Batch-render client kickoff decks.")
+    parser.add_argument("manifest", help="CSV or JSON client manifest")
+    parser.add_argument("--out-dir", default=DEFAULT_OUT_DIR)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--chunksize", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    clients = load_client_manifest(args.manifest)
+    os.makedirs(args.out_dir, exist_ok=True)
+    jobs, failures = build_jobs(clients, args.out_dir)
+
+    report = run_batch(
+        render_client_deck,
+        jobs,
+        workers=args.workers,
+        chunksize=args.chunksize,
+        initializer=_warm_worker,
+    )
+    report["failed"] = failures
+    print_report(report, noun="deck")
+    for client, reason in failures:
+        print(f"  ✖ {client}: {reason}")
+    print(f"✅ Kickoff decks written to:\n{args.out_dir}")
+    return report
+
+
+if __name__ == "__main__":
+    sys.exit(1 if main()["failed"] else 0)
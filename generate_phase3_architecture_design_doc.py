@@ -1,10 +1,14 @@
 import os
-from docx import Document
 from docx.shared import Pt, RGBColor
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 from docx.oxml import OxmlElement
 from docx.oxml.ns import qn
 
+import docx_base
+from package_writer import save_package
+from render_plan import render_spec
+from section_cache import CACHE_DIR, SectionCache, style_salt
+
 # ---------- CONFIG ----------
 ORG_NAME = "UNIQUE ENTREPRENEUR SOLUTIONS LIMITED"
 FOOTER_TEXT = (
@@ -15,7 +19,6 @@ BLUE_GREY = RGBColor(30, 55, 90)
 LIGHT_GREY = "F0F0F0"
 
 BASE_DIR = r"C:\Users\victo\kickoff_project\02_Phase2_Requirements_and_Governance"
-os.makedirs(BASE_DIR, exist_ok=True)
 
 OUTPUT_PATH = os.path.join(
     BASE_DIR,
@@ -103,77 +106,116 @@ def add_kv_table(doc, title, rows):
         shade_cell(row[1])
     doc.add_paragraph()
 
+# ---------- SPEC ----------
+# Content as data; see render_plan for the block kinds.
+
+HELPERS = {
+    "title": add_title,
+    "subtitle": add_subtitle,
+    "section": add_section_heading,
+    "text_area": add_text_area,
+    "kv_table": add_kv_table,
+}
+
+SPEC = {
+    "preamble": [
+        ("title", "System Architecture & ERD"),
+        ("subtitle", "Unique Entrepreneur Literacy Hub — Phase 3 Design Baseline"),
+        ("spacer",),
+    ],
+    "sections": [
+        [
+            ("section", "1. Overview"),
+            ("text_area", "Briefly describe the platform purpose, tenants (co-ops, SMEs, schools), "
+                          "and target regions (UK & Nigeria)."),
+        ],
+        [
+            ("section", "2. Architecture Summary"),
+            ("kv_table", "2.1 Technology Stack", [
+                ("Frontend", "Next.js (App Router), React, TypeScript, Tailwind, shadcn/ui"),
+                ("Backend", "Django, Django REST Framework, JWT auth"),
+                ("Database", "PostgreSQL with Row-Level Security"),
+                ("Cache & Queue", "Redis + Celery"),
+                ("Storage/CDN", "AWS S3 + CloudFront"),
+                ("Video", "S3 + transcoding or Vimeo/Wistia"),
+                ("Infra", "Docker, CI/CD (GitHub Actions), AWS/Render/Vercel/Fly.io"),
+            ]),
+            ("text_area", "2.2 High-Level Component Diagram (describe services: Web, API, DB, Cache, Storage, Integrations)."),
+        ],
+        [
+            ("section", "3. Multi-Tenancy & Data Isolation"),
+            ("text_area", "Explain org → school → class hierarchy, tenant resolution "
+                          "(domain/subdomain/claims), and isolation rules by org_id / school_id."),
+        ],
+        [
+            ("section", "4. Entity-Relationship Model (ERD)"),
+            ("text_area", "List core entities (Organisation, School, Class, User, RoleAssignment, Course, Section, Lesson, "
+                          "Enrollment, Quiz, Submission, Certificate, Order, Payment, Payout, Coupon, AuditLog). "
+                          "Attach diagram or maintain link to draw.io/Lucidchart."),
+        ],
+        [
+            ("section", "5. Row-Level Security Strategy"),
+            ("text_area", "Describe how PostgreSQL RLS is applied (e.g. policies on course, enrollment, etc.) "
+                          "based on current_org_id, roles, and tenant context from JWT."),
+        ],
+        [
+            ("section", "6. API Design Overview"),
+            ("text_area", "Summarise main endpoints (auth, orgs, schools, courses, enrolments, quizzes, reports), "
+                          "use of pagination, filtering, and versioning (/api/v1)."),
+        ],
+        [
+            ("section", "7. Non-Functional Requirements Mapping"),
+            ("text_area", "Explain how the chosen architecture meets performance, scalability, observability, "
+                          "security, and availability targets."),
+        ],
+        [
+            ("section", "8. Integrations"),
+            ("text_area", "List integrations: SSO (OAuth/SAML), payment gateways, email provider, analytics, video hosting."),
+        ],
+        [
+            ("section", "9. Security & Data Governance Alignment"),
+            ("text_area", "Reference Data Governance Framework; show how RBAC, RLS, encryption, audit logs "
+                          "and retention are enforced technically."),
+        ],
+        [
+            ("section", "10. Open Questions & Design Decisions"),
+            ("text_area", "Track pending decisions (e.g. final video provider, final hosting choice, etc.)."),
+        ],
+    ],
+}
+
 # ---------- DOCUMENT CREATION ----------
 
-doc = Document()
-style = doc.styles["Normal"]
-style.font.name = "Calibri"
-style._element.rPr.rFonts.set(qn("w:eastAsia"), "Calibri")
-style.font.size = Pt(10)
-
-set_header_footer(doc.sections[0])
-
-add_title(doc, "System Architecture & ERD")
-add_subtitle(doc, "Unique Entrepreneur Literacy Hub — Phase 3 Design Baseline")
-doc.add_paragraph()
-
-# 1. Overview
-add_section_heading(doc, "1. Overview")
-add_text_area(doc, "Briefly describe the platform purpose, tenants (co-ops, SMEs, schools), "
-                   "and target regions (UK & Nigeria).")
-
-# 2. Architecture Summary
-add_section_heading(doc, "2. Architecture Summary")
-add_kv_table(doc, "2.1 Technology Stack", [
-    ("Frontend", "Next.js (App Router), React, TypeScript, Tailwind, shadcn/ui"),
-    ("Backend", "Django, Django REST Framework, JWT auth"),
-    ("Database", "PostgreSQL with Row-Level Security"),
-    ("Cache & Queue", "Redis + Celery"),
-    ("Storage/CDN", "AWS S3 + CloudFront"),
-    ("Video", "S3 + transcoding or Vimeo/Wistia"),
-    ("Infra", "Docker, CI/CD (GitHub Actions), AWS/Render/Vercel/Fly.io"),
-])
-
-add_text_area(doc, "2.2 High-Level Component Diagram (describe services: Web, API, DB, Cache, Storage, Integrations).")
-
-# 3. Multi-Tenancy & Isolation
-add_section_heading(doc, "3. Multi-Tenancy & Data Isolation")
-add_text_area(doc, "Explain org → school → class hierarchy, tenant resolution "
-                   "(domain/subdomain/claims), and isolation rules by org_id / school_id.")
-
-# 4. ERD (Entities & Relations)
-add_section_heading(doc, "4. Entity-Relationship Model (ERD)")
-add_text_area(doc, "List core entities (Organisation, School, Class, User, RoleAssignment, Course, Section, Lesson, "
-                   "Enrollment, Quiz, Submission, Certificate, Order, Payment, Payout, Coupon, AuditLog). "
-                   "Attach diagram or maintain link to draw.io/Lucidchart.")
-
-# 5. Row-Level Security (RLS)
-add_section_heading(doc, "5. Row-Level Security Strategy")
-add_text_area(doc, "Describe how PostgreSQL RLS is applied (e.g. policies on course, enrollment, etc.) "
-                   "based on current_org_id, roles, and tenant context from JWT.")
-
-# 6. API Design (Alignment with OpenAPI)
-add_section_heading(doc, "6. API Design Overview")
-add_text_area(doc, "Summarise main endpoints (auth, orgs, schools, courses, enrolments, quizzes, reports), "
-                   "use of pagination, filtering, and versioning (/api/v1).")
-
-# 7. Non-Functional Requirements Mapping
-add_section_heading(doc, "7. Non-Functional Requirements Mapping")
-add_text_area(doc, "Explain how the chosen architecture meets performance, scalability, observability, "
-                   "security, and availability targets.")
-
-# 8. Integration Points
-add_section_heading(doc, "8. Integrations")
-add_text_area(doc, "List integrations: SSO (OAuth/SAML), payment gateways, email provider, analytics, video hosting.")
-
-# 9. Security, Privacy & Data Governance Link
-add_section_heading(doc, "9. Security & Data Governance Alignment")
-add_text_area(doc, "Reference Data Governance Framework; show how RBAC, RLS, encryption, audit logs "
-                   "and retention are enforced technically.")
-
-# 10. Open Questions & Decisions Log
-add_section_heading(doc, "10. Open Questions & Design Decisions")
-add_text_area(doc, "Track pending decisions (e.g. final video provider, final hosting choice, etc.).")
-
-doc.save(OUTPUT_PATH)
-print(f"✅ Architecture & ERD design template created at:\n{OUTPUT_PATH}")
+def new_document():
+    """Blank document on the shared base template, with the header / footer."""
+    doc = docx_base.new_document()
+
+    set_header_footer(doc.sections[0])
+    return doc
+
+
+def build_architecture_doc(cache=None, **variables):
+    """Build the document (its SPEC has no variables)."""
+    return render_spec(new_document(), SPEC, HELPERS, variables, cache)
+
+
+def section_cache():
+    """SectionCache for this document, salted with its section helpers."""
+    salt = style_salt(
+        [shade_cell, add_section_heading, add_text_area, add_kv_table],
+        [BLUE_GREY, LIGHT_GREY],
+    )
+    return SectionCache(os.path.join(CACHE_DIR, "architecture"), salt)
+
+
+def main():
+    os.makedirs(BASE_DIR, exist_ok=True)
+    cache = section_cache()
+    doc = build_architecture_doc(cache)
+    cache.prune()
+    save_package(doc, OUTPUT_PATH)
+    print(f"✅ Architecture & ERD design template created at:\n{OUTPUT_PATH}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,18 @@
+import argparse
+import csv
+import json
 import os
+from contextlib import contextmanager
 from openpyxl import Workbook
 from openpyxl.styles import Font, PatternFill, Alignment
-from docx import Document
 from docx.shared import Pt, RGBColor
 from docx.enum.text import WD_ALIGN_PARAGRAPH
-from docx.oxml.ns import qn
-from docx.oxml import OxmlElement
+
+import docx_base
+from docx_table_builder import add_bulk_table, run_props
+from package_writer import save_package
+from sink_fanout import print_sink_report, run_sinks
+from streaming_docx import StreamingDocxWriter
 
 # ---------- CONFIG ----------
 ORG_NAME = "UNIQUE ENTREPRENEUR SOLUTIONS LIMITED"
@@ -14,12 +21,14 @@ FOOTER_TEXT = ("Omole Victoria Oluwatosin — Business Analyst | Data Analyst |
 
 BLUE_GREY = RGBColor(30, 55, 90)
 LIGHT_GREY = "F0F0F0"
+HEADER_RPR = run_props(bold=True, color=BLUE_GREY)
 
 BASE_DIR = r"C:\Users\victo\kickoff_project\02_Phase2_Requirements_and_Governance"
-os.makedirs(BASE_DIR, exist_ok=True)
 
 WORD_PATH = os.path.join(BASE_DIR, "UniqueEntrepreneur_UserStories_and_Epics.docx")
 EXCEL_PATH = os.path.join(BASE_DIR, "UniqueEntrepreneur_UserStories_and_Epics.xlsx")
+CSV_PATH = os.path.join(BASE_DIR, "UniqueEntrepreneur_UserStories_and_Epics_Import.csv")
+JSON_PATH = os.path.join(BASE_DIR, "UniqueEntrepreneur_UserStories_and_Epics.json")
 
 # ---------- DATA ----------
 
@@ -36,199 +45,400 @@ stories = [
     ("US-01", "Platform Admin",
      "create organisations so each has its own environment",
      "separate data and branding per organisation",
-     "Org created with unique org_id, branding options, and default admin.", "High"),
+     "Org created with unique org_id, branding options, and default admin.", "High", "E-01"),
     ("US-02", "Org Admin",
      "create schools and assign school admins",
      "delegate management within my organisation",
-     "Schools linked to org_id; admins receive invitation email.", "High"),
+     "Schools linked to org_id; admins receive invitation email.", "High", "E-01"),
     ("US-03", "Org Admin",
      "bulk-import teachers and students via CSV",
      "onboard faster without manual entry",
-     "CSV validated; errors reported; valid rows created as users.", "Medium"),
+     "CSV validated; errors reported; valid rows created as users.", "Medium", "E-01"),
     ("US-05", "Instructor",
      "upload videos, PDFs, and quizzes",
      "build engaging online courses",
-     "Supports common formats; file size limits enforced; items previewable.", "High"),
+     "Supports common formats; file size limits enforced; items previewable.", "High", "E-02"),
     ("US-08", "Student",
      "enrol in a course and resume where I left off",
      "continue learning smoothly",
-     "System stores last completed lesson and video position per course.", "High"),
+     "System stores last completed lesson and video position per course.", "High", "E-03"),
     ("US-09", "Student",
      "take quizzes and see my results",
      "understand my performance",
-     "Auto-graded quizzes; scores visible in course progress.", "High"),
+     "Auto-graded quizzes; scores visible in course progress.", "High", "E-03"),
     ("US-11", "Org Admin",
      "view a dashboard of learner activity",
      "monitor adoption and completion",
-     "Shows active users, enrolments, completion %, top courses.", "High"),
+     "Shows active users, enrolments, completion %, top courses.", "High", "E-04"),
     ("US-14", "DMP",
      "view audit logs of key actions",
      "ensure compliance and traceability",
-     "Logs include who, what, when, before/after where relevant.", "High"),
+     "Logs include who, what, when, before/after where relevant.", "High", "E-05"),
     ("US-17", "Instructor",
      "set course prices and coupons",
      "monetise my content",
-     "Price and discounts applied; integrated with payment gateway.", "High"),
+     "Price and discounts applied; integrated with payment gateway.", "High", "E-06"),
 ]
 
-# ---------- HELPER (WORD) ----------
+STORY_COLUMNS = ("Story ID", "Role", "Action", "Goal", "Acceptance Criteria", "Priority")
+EPIC_COLUMNS = ("Epic ID", "Epic Title", "Description")
+
+# ---------- BACKLOG INGESTION ----------
+
+class Backlog:
+    """Epics, their stories and an Epic ID index, parsed once for all emitters."""
+
+    def __init__(self, epics, stories):
+        self.epics = epics                                  # [(id, title, description)]
+        self.stories = stories                              # [(*STORY_COLUMNS, epic id)]
+        self.epic_index = {e[0]: e for e in epics}
+
+
+def iter_backlog_rows(path, key="stories"):
+    """Yield rows of a .csv, .jsonl or .json backlog file as dicts, one at a time.
+
+    A .json file may be a list of rows or an object holding `key`.
+    """
+    lower = path.lower()
+    if lower.endswith(".jsonl"):
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+    elif lower.endswith(".json"):
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        yield from data[key] if isinstance(data, dict) else data
+    else:
+        with open(path, newline="", encoding="utf-8-sig") as f:
+            yield from csv.DictReader(f)
+
+
+def _field(row, *names):
+    for name in names:
+        value = row.get(name)
+        if value not in (None, ""):
+            return str(value).strip()
+    return ""
+
+
+def load_epics(path):
+    return [tuple(_field(row, c) for c in EPIC_COLUMNS) for row in iter_backlog_rows(path, "epics")]
+
+
+def ingest_stories(rows, epic_index, source="backlog"):
+    """Turn story rows into tuples keyed to an epic through `epic_index`.
+
+    Rows are consumed as they stream in; the Epic ID ("Epic ID" or the
+    workbook's "Epic" column) is resolved with one dict lookup per story.
+    """
+    seen = set()
+    for n, row in enumerate(rows, start=1):
+        story_id = _field(row, "Story ID")
+        if not story_id:
+            raise ValueError(f"Story #{n} in {source} has no Story ID")
+        if story_id in seen:
+            raise ValueError(f"Duplicate Story ID {story_id} in {source}")
+        seen.add(story_id)
+        epic_id = _field(row, "Epic ID", "Epic")
+        if epic_id not in epic_index:
+            raise ValueError(f"Story {story_id} in {source} references unknown epic {epic_id!r}")
+        yield tuple(_field(row, c) for c in STORY_COLUMNS) + (epic_id,)
+
+
+def load_backlog(stories_path=None, epics_path=None, stream=False):
+    """Parse the backlog once; default to the in-source epics and stories.
+
+    With `stream=True` the stories are left as a generator, for a single
+    pass that feeds every emitter at once (see `emit_backlog`). Whichever
+    of the two is overridden, every story's Epic ID is checked against the
+    epics in use.
+    """
+    backlog = Backlog(load_epics(epics_path) if epics_path else epics, stories)
+    if stories_path or epics_path:
+        if stories_path:
+            rows, source = iter_backlog_rows(stories_path), stories_path
+        else:
+            columns = STORY_COLUMNS + ("Epic ID",)
+            rows, source = (dict(zip(columns, s)) for s in stories), "in-source stories"
+        backlog.stories = ingest_stories(rows, backlog.epic_index, source)
+        if not stream:
+            backlog.stories = list(backlog.stories)
+    return backlog
 
-def shade_cell(cell, fill_hex=LIGHT_GREY):
-    tcPr = cell._tc.get_or_add_tcPr()
-    shd = OxmlElement("w:shd")
-    shd.set(qn("w:val"), "clear")
-    shd.set(qn("w:color"), "auto")
-    shd.set(qn("w:fill"), fill_hex)
-    tcPr.append(shd)
 
 # ---------- WORD DOCUMENT GENERATION ----------
 
-doc = Document()
-style = doc.styles["Normal"]
-style.font.name = "Calibri"
-style._element.rPr.rFonts.set(qn("w:eastAsia"), "Calibri")
-style.font.size = Pt(10)
-
-section = doc.sections[0]
-
-# Header
-header = section.header
-if not header.paragraphs:
-    header.add_paragraph()
-hp = header.paragraphs[0]
-hp.text = ""
-hr = hp.add_run(ORG_NAME)
-hp.alignment = WD_ALIGN_PARAGRAPH.CENTER
-hr.font.size = Pt(11)
-hr.font.bold = True
-hr.font.color.rgb = BLUE_GREY
-
-# Footer
-footer = section.footer
-if not footer.paragraphs:
-    footer.add_paragraph()
-fp = footer.paragraphs[0]
-fp.text = ""
-fr = fp.add_run(FOOTER_TEXT)
-fp.alignment = WD_ALIGN_PARAGRAPH.CENTER
-fr.font.size = Pt(9)
-fr.font.color.rgb = BLUE_GREY
-
-# Title
-p = doc.add_paragraph()
-r = p.add_run("Phase 2.2 — User Stories & Epics")
-r.font.size = Pt(16)
-r.font.bold = True
-r.font.color.rgb = BLUE_GREY
-doc.add_paragraph("This appendix defines epics and user stories for the Unique Entrepreneur Literacy Hub MVP.").alignment = WD_ALIGN_PARAGRAPH.LEFT
-doc.add_paragraph()
-
-# Epics table
-title_para = doc.add_paragraph()
-tr = title_para.add_run("Epics Overview")
-tr.font.bold = True
-tr.font.size = Pt(12)
-tr.font.color.rgb = BLUE_GREY
-
-epic_table = doc.add_table(rows=1, cols=3)
-headers = ["Epic ID", "Epic Title", "Description"]
-for idx, h in enumerate(headers):
-    cell = epic_table.rows[0].cells[idx]
-    run = cell.paragraphs[0].add_run(h)
-    run.font.bold = True
-    run.font.color.rgb = BLUE_GREY
-
-for epic in epics:
-    row_cells = epic_table.add_row().cells
-    for i, v in enumerate(epic):
-        para = row_cells[i].paragraphs[0]
-        para.add_run(v)
-        shade_cell(row_cells[i])
-
-doc.add_paragraph()
-
-# User Stories table
-us_title = doc.add_paragraph()
-usr = us_title.add_run("User Stories")
-usr.font.bold = True
-usr.font.size = Pt(12)
-usr.font.color.rgb = BLUE_GREY
-
-us_table = doc.add_table(rows=1, cols=6)
-us_headers = ["Story ID", "Role", "Action", "Goal", "Acceptance Criteria", "Priority"]
-for idx, h in enumerate(us_headers):
-    cell = us_table.rows[0].cells[idx]
-    run = cell.paragraphs[0].add_run(h)
-    run.font.bold = True
-    run.font.color.rgb = BLUE_GREY
-
-for s in stories:
-    row = us_table.add_row().cells
-    for i, v in enumerate(s):
-        para = row[i].paragraphs[0]
-        para.add_run(v)
-        shade_cell(row[i])
-
-doc.save(WORD_PATH)
-print(f"✅ Word document created at:\n{WORD_PATH}")
+def _userstories_shell(epics):
+    """Styles, header / footer, title and epics table: everything before the stories."""
+    doc = docx_base.new_document()
+
+    section = doc.sections[0]
+
+    # Header
+    header = section.header
+    if not header.paragraphs:
+        header.add_paragraph()
+    hp = header.paragraphs[0]
+    hp.text = ""
+    hr = hp.add_run(ORG_NAME)
+    hp.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    hr.font.size = Pt(11)
+    hr.font.bold = True
+    hr.font.color.rgb = BLUE_GREY
+
+    # Footer
+    footer = section.footer
+    if not footer.paragraphs:
+        footer.add_paragraph()
+    fp = footer.paragraphs[0]
+    fp.text = ""
+    fr = fp.add_run(FOOTER_TEXT)
+    fp.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    fr.font.size = Pt(9)
+    fr.font.color.rgb = BLUE_GREY
+
+    # Title
+    p = doc.add_paragraph()
+    r = p.add_run("Phase 2.2 — User Stories & Epics")
+    r.font.size = Pt(16)
+    r.font.bold = True
+    r.font.color.rgb = BLUE_GREY
+    doc.add_paragraph("This appendix defines epics and user stories for the Unique Entrepreneur Literacy Hub MVP.").alignment = WD_ALIGN_PARAGRAPH.LEFT
+    doc.add_paragraph()
+
+    # Epics table
+    title_para = doc.add_paragraph()
+    tr = title_para.add_run("Epics Overview")
+    tr.font.bold = True
+    tr.font.size = Pt(12)
+    tr.font.color.rgb = BLUE_GREY
+
+    add_bulk_table(
+        doc,
+        list(EPIC_COLUMNS),
+        epics,
+        header_rpr=HEADER_RPR,
+        body_fill=LIGHT_GREY,
+    )
+
+    doc.add_paragraph()
+
+    # User Stories title
+    us_title = doc.add_paragraph()
+    usr = us_title.add_run("User Stories")
+    usr.font.bold = True
+    usr.font.size = Pt(12)
+    usr.font.color.rgb = BLUE_GREY
+
+    return doc
+
+
+def build_userstories_docx(backlog):
+    doc = _userstories_shell(backlog.epics)
+    add_bulk_table(
+        doc,
+        list(STORY_COLUMNS),
+        (s[:len(STORY_COLUMNS)] for s in backlog.stories),
+        header_rpr=HEADER_RPR,
+        body_fill=LIGHT_GREY,
+    )
+
+    return doc
+
+
+def write_userstories_docx(backlog, path):
+    """Same document as build_userstories_docx, with the stories table streamed
+    to `path` row by row (flat memory for any backlog size).
+    """
+    with StreamingDocxWriter(_userstories_shell(backlog.epics), path) as out:
+        out.table(
+            list(STORY_COLUMNS),
+            (s[:len(STORY_COLUMNS)] for s in backlog.stories),
+            header_rpr=HEADER_RPR,
+            body_fill=LIGHT_GREY,
+        )
+    return path
+
 
 # ---------- EXCEL GENERATION ----------
 
-wb = Workbook()
-ws = wb.active
-ws.title = "UserStories"
-
-excel_headers = [
-    "Epic",
-    "Story ID",
-    "Role",
-    "Action",
-    "Goal",
-    "Acceptance Criteria",
-    "Priority",
-    "Story Points",
-    "Sprint",
-    "Status"
-]
+def build_userstories_xlsx(backlog):
+    wb = Workbook()
+    ws = wb.active
+    ws.title = "UserStories"
 
-header_font = Font(bold=True, color="FFFFFF")
-header_fill = PatternFill(start_color="1E375A", end_color="1E375A", fill_type="solid")
-header_align = Alignment(horizontal="center", vertical="center", wrap_text=True)
-
-# Header row
-for col, h in enumerate(excel_headers, start=1):
-    c = ws.cell(row=1, column=col, value=h)
-    c.font = header_font
-    c.fill = header_fill
-    c.alignment = header_align
-
-# Map stories to epics (simple round-robin just for template)
-for i, s in enumerate(stories, start=2):
-    epic_id = epics[(i - 2) % len(epics)][0]  # cycle epics
-    row_values = [
-        epic_id,
-        s[0],
-        s[1],
-        s[2],
-        s[3],
-        s[4],
-        s[5],
-        "",   # Story Points (fillable)
-        "",   # Sprint (fillable)
-        ""    # Status (fillable)
+    excel_headers = [
+        "Epic",
+        "Story ID",
+        "Role",
+        "Action",
+        "Goal",
+        "Acceptance Criteria",
+        "Priority",
+        "Story Points",
+        "Sprint",
+        "Status"
     ]
-    for col, v in enumerate(row_values, start=1):
-        cell = ws.cell(row=i, column=col, value=v)
-        cell.alignment = Alignment(wrap_text=True, vertical="top")
-
-# Auto-width
-for col in ws.columns:
-    max_len = 0
-    col_letter = col[0].column_letter
-    for cell in col:
-        if cell.value:
-            max_len = max(max_len, len(str(cell.value)))
-    ws.column_dimensions[col_letter].width = min(max_len + 2, 35)
-
-wb.save(EXCEL_PATH)
-print(f"✅ Excel workbook created at:\n{EXCEL_PATH}")
+
+    header_font = Font(bold=True, color="FFFFFF")
+    header_fill = PatternFill(start_color="1E375A", end_color="1E375A", fill_type="solid")
+    header_align = Alignment(horizontal="center", vertical="center", wrap_text=True)
+    body_align = Alignment(wrap_text=True, vertical="top")
+
+    # Header row
+    for col, h in enumerate(excel_headers, start=1):
+        c = ws.cell(row=1, column=col, value=h)
+        c.font = header_font
+        c.fill = header_fill
+        c.alignment = header_align
+
+    for i, s in enumerate(backlog.stories, start=2):
+        row_values = [
+            s[6],
+            s[0],
+            s[1],
+            s[2],
+            s[3],
+            s[4],
+            s[5],
+            "",   # Story Points (fillable)
+            "",   # Sprint (fillable)
+            ""    # Status (fillable)
+        ]
+        for col, v in enumerate(row_values, start=1):
+            cell = ws.cell(row=i, column=col, value=v)
+            cell.alignment = body_align
+
+    # Auto-width
+    for col in ws.columns:
+        max_len = 0
+        col_letter = col[0].column_letter
+        for cell in col:
+            if cell.value:
+                max_len = max(max_len, len(str(cell.value)))
+        ws.column_dimensions[col_letter].width = min(max_len + 2, 35)
+
+    return wb
+
+
+# ---------- JIRA / AZURE IMPORT FILES ----------
+
+IMPORT_COLUMNS = [
+    "Issue Type", "Issue ID", "Parent ID", "Summary", "Description",
+    "Acceptance Criteria", "Priority",
+]
+
+
+@contextmanager
+def _open_output(path, **kwargs):
+    """Text file written next to `path` and moved over it only on success, so
+    a bad story row leaves the previous file in place rather than truncated.
+    """
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "w", **kwargs) as f:
+            yield f
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    os.replace(tmp_path, path)
+
+
+def write_import_csv(backlog, path):
+    """CSV for Jira / Azure DevOps import: epics first, then stories parented to them."""
+    with _open_output(path, newline="", encoding="utf-8-sig") as f:
+        writer = csv.writer(f)
+        writer.writerow(IMPORT_COLUMNS)
+        for epic_id, title, description in backlog.epics:
+            writer.writerow(["Epic", epic_id, "", title, description, "", ""])
+        for story_id, role, action, goal, criteria, priority, epic_id in backlog.stories:
+            writer.writerow([
+                "Story", story_id, epic_id, action[:1].upper() + action[1:],
+                f"As a {role}, I want to {action}, so that I can {goal}.",
+                criteria, priority,
+            ])
+
+
+def write_backlog_json(backlog, path):
+    """Backlog as {"epics": [...], "stories": [...]}, written one story at a time.
+
+    Uses the ingestion column names, so the file can be fed back in with
+    --stories / --epics.
+    """
+    with _open_output(path, encoding="utf-8") as f:
+        f.write('{"epics": [')
+        f.write(", ".join(json.dumps(dict(zip(EPIC_COLUMNS, e))) for e in backlog.epics))
+        f.write('],\n "stories": [')
+        for n, story in enumerate(backlog.stories):
+            record = dict(zip(STORY_COLUMNS, story))
+            record["Epic ID"] = story[len(STORY_COLUMNS)]
+            f.write((",\n  " if n else "\n  ") + json.dumps(record, ensure_ascii=False))
+        f.write("\n]}\n")
+
+
+# ---------- MULTI-SINK EMITTER ----------
+
+def docx_sink(stories, epics, path):
+    return write_userstories_docx(Backlog(epics, stories), path)
+
+
+def xlsx_sink(stories, epics, path):
+    save_package(build_userstories_xlsx(Backlog(epics, stories)), path)
+    return path
+
+
+def csv_sink(stories, epics, path):
+    write_import_csv(Backlog(epics, stories), path)
+    return path
+
+
+def json_sink(stories, epics, path):
+    write_backlog_json(Backlog(epics, stories), path)
+    return path
+
+
+SINKS = {
+    "docx": (docx_sink, WORD_PATH),
+    "xlsx": (xlsx_sink, EXCEL_PATH),
+    "csv": (csv_sink, CSV_PATH),
+    "json": (json_sink, JSON_PATH),
+}
+
+
+def emit_backlog(backlog, formats=tuple(SINKS), paths=None):
+    """Stream the backlog once into every requested format concurrently."""
+    paths = paths or {}
+    sinks = {
+        name: (SINKS[name][0], (backlog.epics, paths.get(name, SINKS[name][1])))
+        for name in formats
+    }
+    return run_sinks(backlog.stories, sinks)
+
+
+# ---------- MAIN ----------
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate the user stories Word, Excel and import files.")
+    parser.add_argument("--stories", help="backlog .csv/.jsonl/.json (default: in-source stories)")
+    parser.add_argument("--epics", help="epics .csv/.jsonl/.json (default: in-source epics)")
+    parser.add_argument("--formats", nargs="+", choices=list(SINKS), default=list(SINKS))
+    args = parser.parse_args(argv)
+
+    backlog = load_backlog(args.stories, args.epics, stream=True)
+    os.makedirs(BASE_DIR, exist_ok=True)
+
+    report = emit_backlog(backlog, args.formats)
+    print_sink_report(report, noun="row")
+    failed = [name for name, stats in report["sinks"].items() if stats["error"]]
+    for name in failed:
+        print(f"✖ {name} sink failed:\n{report['sinks'][name]['error']}")
+    for name, stats in sorted(report["sinks"].items()):
+        if not stats["error"]:
+            print(f"✅ {name} created at:\n{stats['output']}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,230 @@
+"""Compact HTML and plain-text editions of the spec-based deliverables.
+
+Learners and rural sites on poor connections (INT-003, INT-006 in the
+interview log) should not have to fetch a whole .docx to read a template.
+This renders a generator's SPEC (see render_plan) straight to minimal
+semantic HTML and to plain text, with no python-docx build:
+
+    title / subtitle  -> <h1> / <p class="sub">
+    section           -> <section><h2>
+    text_area         -> <p><strong>label</strong></p><p class="fill">
+    field / meta      -> <dl> of label / value pairs
+    matrix / kv_table -> <h3> and a <table> (matrix headers in <thead>)
+    spacer            -> nothing
+
+Each edition is also written gzip-compressed (.gz, level 9, mtime 0, no
+file name), so web servers can serve the precompressed variant as-is and
+unchanged inputs give byte-identical files. Output goes to
+BASE_DIR/Compact.
+
+    python html_export.py                       # all documents
+    python html_export.py brd --set org_name="Acme Co-op"
+"""
+import argparse
+import gzip
+import html
+import importlib
+import os
+import textwrap
+
+from render_plan import PLAN_SOURCES, spec_variables, substitute
+
+# ---------- CONFIG ----------
+BASE_DIR = r"C:\Users\victo\kickoff_project"
+OUT_DIR = os.path.join(BASE_DIR, "Compact")
+
+PLACEHOLDER = "Click to type"
+TEXT_WIDTH = 78
+GZIP_LEVEL = 9
+
+STYLE = (
+    "body{font:15px/1.45 Calibri,Arial,sans-serif;max-width:46em;margin:auto;padding:0 1em;"
+    "color:#222}h1,h2,h3,strong,dt,th,header{color:#1e375a}.sub{color:#1e375a}"
+    ".fill,dd{background:#f0f0f0;color:#787878;padding:.3em .5em}"
+    "table{border-collapse:collapse;width:100%}th,td{border:1px solid #ccc;padding:.3em;"
+    "text-align:left;vertical-align:top}header,footer{text-align:center;font-size:.85em}"
+)
+
+
+# ---------- HTML ----------
+
+def _e(text):
+    return html.escape(str(text), quote=False)
+
+
+def _table_html(headers, rows):
+    out = ["<table>"]
+    if headers:
+        out.append("<thead><tr>" + "".join(f"<th>{_e(h)}</th>" for h in headers) + "</tr></thead>")
+    out.append("<tbody>")
+    for row in rows:
+        out.append("<tr>" + "".join(f"<td>{_e(c)}</td>" for c in row) + "</tr>")
+    out.append("</tbody></table>")
+    return "".join(out)
+
+
+def _pairs_html(pairs):
+    return "<dl>" + "".join(f"<dt>{_e(k)}</dt><dd>{_e(v)}</dd>" for k, v in pairs) + "</dl>"
+
+
+def block_html(kind, *args):
+    """HTML for one SPEC block."""
+    if kind == "title":
+        return f"<h1>{_e(args[0])}</h1>"
+    if kind == "subtitle":
+        return f'<p class="sub">{_e(args[0])}</p>'
+    if kind == "spacer":
+        return ""
+    if kind == "section":
+        return f"<h2>{_e(args[0])}</h2>"
+    if kind == "text_area":
+        return f'<p><strong>{_e(args[0])}</strong></p><p class="fill">{PLACEHOLDER}</p>'
+    if kind == "field":
+        label, value = (args + (PLACEHOLDER,))[:2]
+        return _pairs_html([(label, value)])
+    if kind == "meta":
+        return _pairs_html(args[0])
+    if kind == "matrix":
+        title, headers, rows = args
+        return f"<h3>{_e(title)}</h3>" + _table_html(headers, rows)
+    if kind == "kv_table":
+        title, rows = args
+        return f"<h3>{_e(title)}</h3>" + _table_html(None, rows)
+    raise ValueError(f"No HTML for block kind {kind!r}")
+
+
+def render_html(module, variables=None):
+    """The module's SPEC as a standalone HTML page (str)."""
+    spec = module.SPEC
+    variables = spec_variables(spec, variables)
+    preamble = [substitute(block, variables) for block in spec.get("preamble", ())]
+    title = next((b[1] for b in preamble if b[0] == "title"), module.__name__)
+    out = [
+        "<!doctype html>",
+        '<html lang="en-GB"><head><meta charset="utf-8">',
+        '<meta name="viewport" content="width=device-width,initial-scale=1">',
+        f"<title>{_e(title)}</title><style>{STYLE}</style></head><body>",
+        f"<header>{_e(module.ORG_NAME)}</header><main>",
+    ]
+    out.extend(filter(None, (block_html(*b) for b in preamble)))
+    for blocks in spec["sections"]:
+        body = "".join(block_html(*substitute(b, variables)) for b in blocks)
+        out.append(f"<section>{body}</section>")
+    out.append(f"</main><footer>{_e(module.FOOTER_TEXT)}</footer></body></html>")
+    return "\n".join(out) + "\n"
+
+
+# ---------- TEXT ----------
+
+def _wrap(text, indent=""):
+    return textwrap.fill(str(text), TEXT_WIDTH, initial_indent=indent, subsequent_indent=indent)
+
+
+def _table_text(headers, rows):
+    lines = []
+    for row in rows:
+        cells = list(zip(headers, row)) if headers else [tuple(row)]
+        first, *rest = cells
+        lines.append(_wrap(": ".join(map(str, first)), "- "))
+        lines.extend(_wrap(": ".join(map(str, c)), "    ") for c in rest)
+    return "\n".join(lines)
+
+
+def block_text(kind, *args):
+    """Plain text for one SPEC block."""
+    if kind in ("title", "section"):
+        underline = "=" if kind == "title" else "-"
+        return f"{args[0]}\n{underline * len(args[0])}"
+    if kind == "subtitle":
+        return _wrap(args[0])
+    if kind == "spacer":
+        return ""
+    if kind == "text_area":
+        return f"{_wrap(args[0])}\n    [{PLACEHOLDER}]"
+    if kind == "field":
+        label, value = (args + (PLACEHOLDER,))[:2]
+        return f"{label} {value}"
+    if kind == "meta":
+        return "\n".join(f"{label} {value}" for label, value in args[0])
+    if kind == "matrix":
+        title, headers, rows = args
+        return f"{title}\n\n{_table_text(headers, rows)}"
+    if kind == "kv_table":
+        title, rows = args
+        return f"{title}\n\n{_table_text(None, rows)}"
+    raise ValueError(f"No text for block kind {kind!r}")
+
+
+def render_text(module, variables=None):
+    """The module's SPEC as plain text (str)."""
+    spec = module.SPEC
+    variables = spec_variables(spec, variables)
+    blocks = list(spec.get("preamble", ()))
+    for section in spec["sections"]:
+        blocks.extend(section)
+    parts = [module.ORG_NAME]
+    parts.extend(filter(None, (block_text(*substitute(b, variables)) for b in blocks)))
+    parts.append(_wrap(module.FOOTER_TEXT))
+    return "\n\n".join(parts) + "\n"
+
+
+# ---------- OUTPUT ----------
+
+def gzip_bytes(data):
+    """Deterministic gzip of `data`: fixed level, mtime 0, no file name."""
+    return gzip.compress(data, compresslevel=GZIP_LEVEL, mtime=0)
+
+
+def _write(path, data):
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def export_document(name, out_dir=OUT_DIR, variables=None):
+    """Write <name>.html, .txt and their .gz variants; return {path: size}."""
+    module = importlib.import_module(PLAN_SOURCES.get(name, name))
+    os.makedirs(out_dir, exist_ok=True)
+    sizes = {}
+    for ext, render in (("html", render_html), ("txt", render_text)):
+        data = render(module, variables).encode("utf-8")
+        path = os.path.join(out_dir, f"{name}.{ext}")
+        for out_path, payload in ((path, data), (f"{path}.gz", gzip_bytes(data))):
+            _write(out_path, payload)
+            sizes[out_path] = len(payload)
+    return sizes
+
+
+# ---------- MAIN ----------
+
+def _assignment(text):
+    key, sep, value = text.partition("=")
+    if not sep:
+        raise argparse.ArgumentTypeError(f"expected name=value, got {text!r}")
+    return key, value
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export compact HTML / text editions.")
+    parser.add_argument("docs", nargs="*", metavar="DOC", help=", ".join(PLAN_SOURCES))
+    parser.add_argument("--set", dest="variables", type=_assignment, action="append",
+                        default=[], metavar="NAME=VALUE")
+    parser.add_argument("--out-dir", default=OUT_DIR)
+    args = parser.parse_args(argv)
+
+    variables = dict(args.variables)
+    for name in args.docs or list(PLAN_SOURCES):
+        if name not in PLAN_SOURCES:
+            raise SystemExit(f"Unknown document: {name} (choose from {', '.join(PLAN_SOURCES)})")
+        spec_vars = importlib.import_module(PLAN_SOURCES[name]).SPEC.get("variables", {})
+        doc_vars = {k: v for k, v in variables.items() if k in spec_vars}
+        sizes = export_document(name, args.out_dir, doc_vars)
+        print(f"{name:<26} " + "  ".join(
+            f"{os.path.basename(p).split('.', 1)[1]}={n / 1024:.1f} KB" for p, n in sizes.items()
+        ))
+    print(f"✅ Compact editions written to:\n{args.out_dir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,223 @@
+"""Read completed interview forms back into Discovery_Interview_Log.xlsx.
+
+Usage:
+    python ingest_interview_forms.py [--forms-dir DIR] [--log PATH] [--workers N]
+
+Each *.docx in the notes folder is a filled copy of the discovery template.
+Workers parse `word/document.xml` directly (lxml, no python-docx load) and
+walk the body in order, tracking the current "Section X – ..." page:
+
+- "Interview Details" rows fill the log columns they were prefilled from
+  (discovery_template_cache.FIELD_COLUMNS), first filled value wins;
+- each answer cell under a "- question" paragraph becomes a response row
+  (Interview ID, Section, Question No., Question, Response);
+- filled "Summary & Key Insights" cells become response rows too.
+
+Placeholders ("Click to type", "Click here to type response") count as
+empty. Interviews are upserted by Interview ID: filled values overwrite
+the log row, blanks never do, and the responses of a re-ingested interview
+replace its earlier ones. Forms without an Interview ID are reported and
+skipped.
+"""
+import argparse
+import os
+import re
+import sys
+import zipfile
+
+from lxml import etree
+from openpyxl import load_workbook
+
+from batch_render import print_report, run_batch
+from create_discovery_interview_log import (
+    FILE_PATH, RESPONSES_SHEET_TITLE, write_interview_log,
+)
+from discovery_template_cache import FIELD_COLUMNS, iter_log_records
+
+# ---------- CONFIG ----------
+BASE_DIR = r"C:\Users\victo\kickoff_project"
+FORMS_DIR = os.path.join(
+    BASE_DIR, "01_Phase1_Discovery_and_Scoping", "Stakeholder_Interview_Notes"
+)
+LINKED_FILE_DIR = "Stakeholder_Interview_Notes"
+
+DOCUMENT_PART = "word/document.xml"
+PLACEHOLDERS = {"", "Click to type", "Click here to type response"}
+
+W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+SECTION_RE = re.compile(r"^Section ([A-Z])\b")
+QUESTION_PREFIX = "- "
+SUMMARY_HEADING = "Summary & Key Insights"
+
+
+# ---------- EXTRACTION ----------
+
+def _text(elem):
+    """Text of a paragraph or cell; paragraphs joined with newlines."""
+    paras = elem.iter(W + "p") if elem.tag != W + "p" else [elem]
+    lines = ("".join(p.itertext(W + "t")) for p in paras)
+    return "\n".join(line for line in lines if line.strip()).strip()
+
+
+def _answer(elem):
+    text = _text(elem)
+    return "" if text in PLACEHOLDERS else text
+
+
+def _cells(tr):
+    return tr.findall(W + "tc")
+
+
+def extract_form(path):
+    """Parse one completed form; return {file, fields, responses} or {file, error}."""
+    name = os.path.basename(path)
+    try:
+        with zipfile.ZipFile(path) as zf:
+            body = etree.fromstring(zf.read(DOCUMENT_PART)).find(W + "body")
+    except (zipfile.BadZipFile, KeyError, etree.XMLSyntaxError) as exc:
+        return {"file": name, "error": str(exc)}
+
+    fields = {}
+    responses = []
+    section = ""
+    question = None
+    numbers = {}
+    in_summary = False
+
+    for child in body:
+        if child.tag == W + "p":
+            text = _text(child)
+            match = SECTION_RE.match(text)
+            if match:
+                section, question = match.group(1), None
+            elif text.startswith(QUESTION_PREFIX):
+                question = text[len(QUESTION_PREFIX):].strip()
+            elif text:
+                question = None
+            if text:
+                in_summary = text == SUMMARY_HEADING
+            continue
+        if child.tag != W + "tbl":
+            continue
+
+        rows = child.findall(W + "tr")
+        widths = {len(_cells(tr)) for tr in rows}
+        if widths == {1} and question is not None:
+            # Answer area of the question above.
+            numbers[section] = numbers.get(section, 0) + 1
+            answer = _answer(rows[0])
+            if answer:
+                responses.append([section, numbers[section], question, answer])
+            question = None
+        elif widths == {2}:
+            for tr in rows:
+                label, value = (_text(tc) for tc in _cells(tr))
+                column = FIELD_COLUMNS.get(label)
+                if column and value not in PLACEHOLDERS:
+                    fields.setdefault(column, value)
+        elif in_summary and rows:
+            # Theme | Key Insights / Quotes | Opportunities / Actions
+            headers = [_text(tc) for tc in _cells(rows[0])]
+            for tr in rows[1:]:
+                tcs = _cells(tr)
+                theme = _text(tcs[0])
+                for heading, tc in zip(headers[1:], tcs[1:]):
+                    answer = _answer(tc)
+                    if answer:
+                        responses.append([section, None, f"Summary – {theme}: {heading}", answer])
+            in_summary = False
+
+    return {"file": name, "fields": fields, "responses": responses}
+
+
+# ---------- LOG UPSERT ----------
+
+def read_responses(log_path):
+    """Existing Interview Responses rows of the log (empty if it has none)."""
+    wb = load_workbook(log_path, read_only=True)
+    try:
+        if RESPONSES_SHEET_TITLE not in wb.sheetnames:
+            return []
+        rows = wb[RESPONSES_SHEET_TITLE].iter_rows(min_row=2, values_only=True)
+        return [list(r) for r in rows if any(v not in (None, "") for v in r)]
+    finally:
+        wb.close()
+
+
+def upsert_interview_log(log_path, forms):
+    """Merge extracted forms into the log by Interview ID; return counts."""
+    exists = os.path.exists(log_path)
+    records = {}
+    for record in (iter_log_records(log_path) if exists else ()):
+        key = str(record.get("Interview ID") or "").strip()
+        records[key or f"__row{len(records)}"] = dict(record)
+    responses = read_responses(log_path) if exists else []
+
+    counts = {"added": 0, "updated": 0, "responses": 0}
+    ingested = {}
+    for form in forms:
+        interview_id = form["fields"]["Interview ID"]
+        ingested[interview_id] = form
+        record = records.get(interview_id)
+        if record is None:
+            record = records[interview_id] = {"Interview ID": interview_id}
+            counts["added"] += 1
+        else:
+            counts["updated"] += 1
+        record.update((k, v) for k, v in form["fields"].items() if v)
+        if not record.get("Linked File"):
+            record["Linked File"] = f"{LINKED_FILE_DIR}\\{form['file']}"
+
+    merged = [r for r in responses if str(r[0] or "").strip() not in ingested]
+    for interview_id, form in ingested.items():
+        merged.extend([interview_id, *r] for r in form["responses"])
+        counts["responses"] += len(form["responses"])
+
+    os.makedirs(os.path.dirname(log_path) or ".", exist_ok=True)
+    write_interview_log(log_path, records.values(), responses=merged)
+    return counts
+
+
+# ---------- MAIN ----------
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Ingest completed interview forms into the interview log.")
+    parser.add_argument("--forms-dir", default=FORMS_DIR)
+    parser.add_argument("--log", default=FILE_PATH)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    paths = sorted(
+        os.path.join(args.forms_dir, n) for n in os.listdir(args.forms_dir)
+        if n.lower().endswith(".docx") and not n.startswith("~$")
+    )
+    report = run_batch(extract_form, paths, workers=args.workers)
+    print_report(report, noun="form")
+
+    forms = {}
+    failed = skipped = 0
+    for form in report["outputs"]:
+        if "error" in form:
+            print(f"✖ {form['file']}: {form['error']}", file=sys.stderr)
+            failed += 1
+        elif not form["fields"].get("Interview ID"):
+            print(f"– {form['file']}: no Interview ID, skipped", file=sys.stderr)
+            skipped += 1
+        else:
+            interview_id = form["fields"]["Interview ID"]
+            if interview_id in forms:
+                print(f"– {form['file']}: Interview ID {interview_id} also in "
+                      f"{forms[interview_id]['file']}, later file wins", file=sys.stderr)
+            forms[interview_id] = form
+
+    counts = upsert_interview_log(args.log, forms.values())
+    print(
+        f"✅ {len(forms)} form(s) ingested into {args.log}: "
+        f"{counts['added']} added, {counts['updated']} updated, "
+        f"{counts['responses']} response(s); {skipped} skipped, {failed} failed"
+    )
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
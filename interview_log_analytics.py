@@ -0,0 +1,320 @@
+"""Group-by analytics over Discovery_Interview_Log.xlsx.
+
+Usage:
+    python interview_log_analytics.py [--log PATH] [--by COLUMN ...]
+                                      [--where COLUMN=VALUE ...] [--no-cache]
+
+With no --by, prints the two standing reports: mean satisfaction by
+stakeholder type and country, and High-priority interviews by sector.
+
+The sheet is streamed once with openpyxl's read-only reader into typed
+arrays: each categorical column becomes a list of distinct values plus an
+array of small integer codes, and "Satisfaction (1-5)" an int8 array
+(0 = not scored). A group-by is then one Counter over zipped code arrays,
+which runs at C speed, so queries over millions of interviews take well
+under a second. The arrays are cached next to the log (LOG.columns) and
+reused while the workbook's size and mtime are unchanged.
+"""
+import argparse
+import json
+import os
+import sys
+from array import array
+from collections import Counter
+
+from openpyxl import load_workbook
+
+from create_discovery_interview_log import FILE_PATH, SHEET_TITLE
+
+# ---------- CONFIG ----------
+CATEGORICAL_COLUMNS = ("Stakeholder Type", "Country", "Sector", "Priority Level")
+SCORE_COLUMN = "Satisfaction (1-5)"
+CACHE_SUFFIX = ".columns"
+CACHE_VERSION = 1
+
+# Narrowest unsigned typecode that holds a code for each level count.
+CODE_TYPES = ((1 << 8, "B"), (1 << 16, "H"), (1 << 32, "I"))
+# memoryview formats for packed group keys, by record width in bytes.
+RECORD_FORMATS = {1: "B", 2: "H", 4: "I", 8: "Q"}
+
+DEFAULT_REPORTS = (
+    ("Mean satisfaction by stakeholder type and country", ("Stakeholder Type", "Country"), {}),
+    ("High-priority interviews by sector", ("Sector",), {"Priority Level": "High"}),
+)
+
+
+# ---------- COLUMN STORE ----------
+
+def _code_type(levels):
+    for limit, typecode in CODE_TYPES:
+        if levels <= limit:
+            return typecode
+    raise ValueError(f"Too many distinct values ({levels})")
+
+
+def _tally(columns):
+    """Counter of the distinct row tuples across equal-length `columns` arrays.
+
+    When the row fits in 8 bytes the arrays are interleaved into one buffer
+    of fixed-width records (strided slice assignment, in C) and counted as
+    plain integers, which is markedly faster than counting zipped tuples.
+    """
+    offsets, width = [], 0
+    for column in columns:
+        offsets.append(width)
+        width += column.itemsize
+    size = next((w for w in sorted(RECORD_FORMATS) if w >= width), None)
+    if size is None:
+        return Counter(zip(*columns))
+
+    n = len(columns[0])
+    buf = bytearray(n * size)
+    for column, offset in zip(columns, offsets):
+        for byte in range(column.itemsize):
+            buf[offset + byte::size] = column.tobytes()[byte::column.itemsize]
+    packed = Counter(memoryview(buf).cast(RECORD_FORMATS[size]))
+
+    tally = {}
+    for key, count in packed.items():
+        record = key.to_bytes(size, sys.byteorder)
+        tally[tuple(
+            int.from_bytes(record[offset:offset + column.itemsize], sys.byteorder,
+                           signed=column.typecode.islower())
+            for column, offset in zip(columns, offsets)
+        )] = count
+    return tally
+
+
+def _score(value):
+    try:
+        score = int(value)
+    except (TypeError, ValueError):
+        return 0
+    return score if 1 <= score <= 5 else 0
+
+
+class InterviewColumns:
+    """Dictionary-encoded categorical columns and an int8 score column."""
+
+    def __init__(self, levels, codes, scores):
+        self.levels = levels        # {column: [value, ...]}
+        self.codes = codes          # {column: array of indexes into levels[column]}
+        self.scores = scores        # array("b"), 0 = not scored
+
+    def __len__(self):
+        return len(self.scores)
+
+    @classmethod
+    def from_rows(cls, header, rows):
+        """Encode data rows (sequences in `header` order) in a single pass."""
+        header = [str(h).strip() if h is not None else "" for h in header]
+        missing = [c for c in CATEGORICAL_COLUMNS + (SCORE_COLUMN,) if c not in header]
+        if missing:
+            raise ValueError(f"Interview log has no column(s): {', '.join(missing)}")
+        positions = [header.index(c) for c in CATEGORICAL_COLUMNS]
+        score_at = header.index(SCORE_COLUMN)
+
+        indexes = [{} for _ in CATEGORICAL_COLUMNS]
+        codes = [array("B") for _ in CATEGORICAL_COLUMNS]
+        scores = array("b")
+        for row in rows:
+            if not any(row):
+                continue
+            for i, at in enumerate(positions):
+                value = row[at] if at < len(row) else None
+                value = "" if value is None else str(value).strip()
+                index = indexes[i]
+                code = index.get(value)
+                if code is None:
+                    code = index[value] = len(index)
+                    if code >= (1 << (8 * codes[i].itemsize)):
+                        codes[i] = array(_code_type(code + 1), codes[i])
+                codes[i].append(code)
+            scores.append(_score(row[score_at] if score_at < len(row) else None))
+
+        return cls(
+            {c: list(index) for c, index in zip(CATEGORICAL_COLUMNS, indexes)},
+            dict(zip(CATEGORICAL_COLUMNS, codes)),
+            scores,
+        )
+
+    # ---------- QUERIES ----------
+
+    def code_of(self, column, value):
+        try:
+            return self.levels[column].index(value)
+        except ValueError:
+            return None
+
+    def aggregate(self, by, where=None):
+        """Group rows by the `by` columns, optionally filtered on `where` equalities.
+
+        Returns {(value, ...): (interviews, scored, mean satisfaction or None)}.
+        """
+        where = dict(where or {})
+        unknown = [c for c in (*by, *where) if c not in self.codes]
+        if unknown:
+            raise ValueError(
+                f"Not a categorical column: {', '.join(unknown)} "
+                f"(choose from {', '.join(CATEGORICAL_COLUMNS)})"
+            )
+        wanted = tuple(self.code_of(c, v) for c, v in where.items())
+        if None in wanted:
+            return {}
+
+        # One C-level pass: count every (group codes, filter codes, score) combination,
+        # then fold the few distinct keys into counts and sums.
+        keys = [self.codes[c] for c in by] + [self.codes[c] for c in where] + [self.scores]
+        tally = _tally(keys)
+
+        n_by = len(by)
+        groups = {}
+        for key, count in tally.items():
+            if key[n_by:-1] != wanted:
+                continue
+            score = key[-1]
+            rows, scored, total = groups.get(key[:n_by], (0, 0, 0))
+            if score:
+                scored += count
+                total += score * count
+            groups[key[:n_by]] = (rows + count, scored, total)
+
+        return {
+            tuple(self.levels[c][code] for c, code in zip(by, codes)):
+                (rows, scored, total / scored if scored else None)
+            for codes, (rows, scored, total) in groups.items()
+        }
+
+    # ---------- CACHE ----------
+
+    def save(self, path, source_stat):
+        header = {
+            "version": CACHE_VERSION,
+            "source_size": source_stat.st_size,
+            "source_mtime_ns": source_stat.st_mtime_ns,
+            "rows": len(self),
+            "columns": [
+                {"name": c, "typecode": self.codes[c].typecode, "levels": self.levels[c]}
+                for c in CATEGORICAL_COLUMNS
+            ],
+        }
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(json.dumps(header, ensure_ascii=False).encode("utf-8") + b"\n")
+            for c in CATEGORICAL_COLUMNS:
+                self.codes[c].tofile(f)
+            self.scores.tofile(f)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path, source_stat):
+        """Read a cache written by save(); None if absent or stale."""
+        try:
+            f = open(path, "rb")
+        except FileNotFoundError:
+            return None
+        with f:
+            header = json.loads(f.readline())
+            if (header.get("version") != CACHE_VERSION
+                    or header["source_size"] != source_stat.st_size
+                    or header["source_mtime_ns"] != source_stat.st_mtime_ns):
+                return None
+            n = header["rows"]
+            levels, codes = {}, {}
+            for column in header["columns"]:
+                codes[column["name"]] = values = array(column["typecode"])
+                values.fromfile(f, n)
+                levels[column["name"]] = column["levels"]
+            scores = array("b")
+            scores.fromfile(f, n)
+        return cls(levels, codes, scores)
+
+
+# ---------- LOADING ----------
+
+def read_interview_log(path=FILE_PATH, sheet=SHEET_TITLE):
+    """Stream the workbook with openpyxl's read-only reader into InterviewColumns."""
+    wb = load_workbook(path, read_only=True, data_only=True)
+    try:
+        ws = wb[sheet] if sheet in wb.sheetnames else wb.worksheets[0]
+        rows = ws.iter_rows(values_only=True)
+        header = next(rows, None)
+        if header is None:
+            raise ValueError(f"{path} is empty")
+        return InterviewColumns.from_rows(header, rows)
+    finally:
+        wb.close()
+
+
+def load_interview_columns(path=FILE_PATH, cache=True):
+    """InterviewColumns for `path`, from the column cache when it is current."""
+    stat = os.stat(path)
+    cache_path = path + CACHE_SUFFIX
+    if cache:
+        columns = InterviewColumns.load(cache_path, stat)
+        if columns is not None:
+            return columns
+    columns = read_interview_log(path)
+    if cache:
+        columns.save(cache_path, stat)
+    return columns
+
+
+# ---------- REPORTING ----------
+
+def print_aggregate(title, by, result):
+    print(f"\n{title}")
+    widths = [max([len(c)] + [len(k[i]) for k in result]) for i, c in enumerate(by)]
+    print("  ".join(c.ljust(w) for c, w in zip(by, widths)) + f"  {'Interviews':>10}  {'Mean sat.':>9}")
+    for key, (rows, _, mean) in sorted(result.items(), key=lambda item: (-item[1][0], item[0])):
+        mean_text = f"{mean:.2f}" if mean is not None else "-"
+        print("  ".join(v.ljust(w) for v, w in zip(key, widths)) + f"  {rows:>10}  {mean_text:>9}")
+
+
+def _parse_where(items):
+    where = {}
+    for item in items:
+        column, sep, value = item.partition("=")
+        if not sep:
+            raise ValueError(f"--where expects COLUMN=VALUE, got {item!r}")
+        where[column.strip()] = value.strip()
+    return where
+
+
+# ---------- MAIN ----------
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Aggregate the Discovery Interview Log.")
+    parser.add_argument("--log", default=FILE_PATH)
+    parser.add_argument("--by", nargs="+", choices=CATEGORICAL_COLUMNS, metavar="COLUMN",
+                        help=f"group-by columns: {', '.join(CATEGORICAL_COLUMNS)}")
+    parser.add_argument("--where", nargs="+", default=[], metavar="COLUMN=VALUE")
+    parser.add_argument("--no-cache", action="store_true", help="ignore and do not write LOG.columns")
+    args = parser.parse_args(argv)
+
+    columns = load_interview_columns(args.log, cache=not args.no_cache)
+    print(f"{len(columns)} interviews in {args.log}")
+
+    if args.by:
+        try:
+            where = _parse_where(args.where)
+        except ValueError as exc:
+            parser.error(str(exc))
+        title = "By " + ", ".join(args.by)
+        if where:
+            title += " where " + ", ".join(f"{c} = {v}" for c, v in where.items())
+        reports = [(title, tuple(args.by), where)]
+    else:
+        reports = DEFAULT_REPORTS
+
+    for title, by, where in reports:
+        try:
+            result = columns.aggregate(by, where)
+        except ValueError as exc:
+            parser.error(str(exc))
+        print_aggregate(title, by, result)
+    return 0
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,267 @@
+"""Period / region shards of the Discovery Interview Log.
+
+Usage:
+    python interview_log_shards.py split [--input LOG]      # .xlsx/.csv/.jsonl
+    python interview_log_shards.py append RECORDS           # .csv/.jsonl/.xlsx
+    python interview_log_shards.py get INTERVIEW_ID ...
+    python interview_log_shards.py export --output PATH [--period YYYY-MM] [--region R]
+    python interview_log_shards.py stats
+
+Each shard is an ordinary interview log (same columns, written by
+create_discovery_interview_log.write_interview_log) holding the interviews
+of one month and one country, e.g. Discovery_Interview_Log_2025-11_UK.xlsx.
+manifest.json in the shard folder lists the shards and maps every
+Interview ID to its shard, so:
+
+- `append` upserts by Interview ID (filled values overwrite, blanks keep
+  the stored ones) and rewrites only the shards it touches, plus the old
+  shard of an interview whose date or country moved it;
+- `get` opens only the shards holding the requested IDs;
+- `export` concatenates the shards (optionally one period / region) back
+  into a single workbook for tools that expect one file.
+
+Shards carry the interview rows only; the Interview Responses sheet stays
+in the main log.
+"""
+import argparse
+import json
+import os
+import re
+import sys
+from datetime import date, datetime
+
+from create_discovery_interview_log import FILE_PATH, TARGET_DIR, columns, write_interview_log
+from discovery_template_cache import iter_log_records
+
+# ---------- CONFIG ----------
+SHARD_DIR = os.path.join(TARGET_DIR, "Discovery_Interview_Log_Shards")
+MANIFEST_NAME = "manifest.json"
+MANIFEST_VERSION = 1
+SHARD_PREFIX = "Discovery_Interview_Log"
+
+DATE_FORMATS = ("%d-%b-%Y", "%Y-%m-%d", "%d/%m/%Y", "%d %B %Y", "%d %b %Y")
+UNDATED = "undated"
+NO_REGION = "unknown"
+
+
+# ---------- PARTITIONING ----------
+
+def record_period(record):
+    """YYYY-MM of the interview Date, or 'undated'."""
+    value = record.get("Date")
+    if isinstance(value, (datetime, date)):
+        return f"{value.year:04d}-{value.month:02d}"
+    text = str(value or "").strip()
+    for fmt in DATE_FORMATS:
+        try:
+            parsed = datetime.strptime(text, fmt)
+        except ValueError:
+            continue
+        return f"{parsed.year:04d}-{parsed.month:02d}"
+    return UNDATED
+
+
+def record_region(record):
+    """Country as a filename-safe token, or 'unknown'."""
+    country = str(record.get("Country") or "").strip()
+    return re.sub(r"[^A-Za-z0-9]+", "-", country).strip("-") or NO_REGION
+
+
+def shard_name(period, region):
+    return f"{SHARD_PREFIX}_{period}_{region}.xlsx"
+
+
+def _interview_id(record):
+    return str(record.get("Interview ID") or "").strip()
+
+
+# ---------- SHARD SET ----------
+
+class ShardedLog:
+    """The shard folder and its manifest (shards + Interview ID index)."""
+
+    def __init__(self, shard_dir=SHARD_DIR):
+        self.shard_dir = shard_dir
+        self.manifest_path = os.path.join(shard_dir, MANIFEST_NAME)
+        self.shards = {}        # shard file -> {period, region, rows}
+        self.index = {}         # Interview ID -> shard file
+        if os.path.exists(self.manifest_path):
+            with open(self.manifest_path, encoding="utf-8") as f:
+                manifest = json.load(f)
+            if manifest.get("version") != MANIFEST_VERSION:
+                raise ValueError(f"Unsupported manifest version in {self.manifest_path}")
+            if manifest.get("columns") != columns:
+                raise ValueError(f"{self.manifest_path} was written for different log columns")
+            self.shards = manifest["shards"]
+            self.index = manifest["index"]
+
+    def save(self):
+        os.makedirs(self.shard_dir, exist_ok=True)
+        tmp_path = self.manifest_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({
+                "version": MANIFEST_VERSION,
+                "columns": columns,
+                "shards": dict(sorted(self.shards.items())),
+                "index": self.index,
+            }, f, ensure_ascii=False, indent=1)
+        os.replace(tmp_path, self.manifest_path)
+
+    def shard_path(self, name):
+        return os.path.join(self.shard_dir, name)
+
+    def read_shard(self, name):
+        """{Interview ID: record} of one shard, in file order."""
+        path = self.shard_path(name)
+        if not os.path.exists(path):
+            return {}
+        return {_interview_id(r): r for r in iter_log_records(path)}
+
+    def _write_shard(self, name, records):
+        if not records:
+            path = self.shard_path(name)
+            if os.path.exists(path):
+                os.remove(path)
+            self.shards.pop(name, None)
+            return
+        period, region = name[len(SHARD_PREFIX) + 1:-len(".xlsx")].split("_", 1)
+        write_interview_log(self.shard_path(name), records.values())
+        self.shards[name] = {"period": period, "region": region, "rows": len(records)}
+
+    def upsert(self, records):
+        """Upsert records by Interview ID; rewrite only the shards involved.
+
+        Returns {"added", "updated", "shards": [rewritten shard files]}.
+        """
+        incoming = {}
+        for n, record in enumerate(records, start=1):
+            record = dict(record)
+            interview_id = _interview_id(record)
+            if not interview_id:
+                raise ValueError(f"Record #{n} has no Interview ID")
+            incoming[interview_id] = record
+
+        touched = {}
+        counts = {"added": 0, "updated": 0}
+
+        def shard(name):
+            if name not in touched:
+                touched[name] = self.read_shard(name)
+            return touched[name]
+
+        for interview_id, record in incoming.items():
+            current = self.index.get(interview_id)
+            if current is not None:
+                # Filled values overwrite, blanks keep the stored ones. The row is
+                # re-filed, so a changed date or country moves it between shards.
+                stored = shard(current).pop(interview_id, None) or {}
+                record = dict(stored, **{k: v for k, v in record.items() if v not in (None, "")})
+            counts["updated" if current is not None else "added"] += 1
+            target = shard_name(record_period(record), record_region(record))
+            shard(target)[interview_id] = record
+            self.index[interview_id] = target
+
+        os.makedirs(self.shard_dir, exist_ok=True)
+        for name in sorted(touched):
+            self._write_shard(name, touched[name])
+        self.save()
+        counts["shards"] = sorted(touched)
+        return counts
+
+    def split(self, records):
+        """Replace every shard with a fresh partition of `records`."""
+        # Read the whole input first: a failed read must not wipe the shards.
+        records = list(records)
+        for name in list(self.shards):
+            self._write_shard(name, {})
+        self.index = {}
+        return self.upsert(records)
+
+    def get(self, interview_ids):
+        """{Interview ID: record} for the IDs found, opening only their shards."""
+        wanted = {}
+        for interview_id in interview_ids:
+            name = self.index.get(interview_id)
+            if name is not None:
+                wanted.setdefault(name, []).append(interview_id)
+        found = {}
+        for name, ids in wanted.items():
+            rows = self.read_shard(name)
+            found.update((i, rows[i]) for i in ids if i in rows)
+        return found
+
+    def select(self, period=None, region=None):
+        """Shard files matching `period` / `region` (None matches all)."""
+        return [
+            name for name, meta in sorted(self.shards.items())
+            if (period is None or meta["period"] == period)
+            and (region is None or meta["region"] == region)
+        ]
+
+    def iter_records(self, period=None, region=None):
+        for name in self.select(period, region):
+            yield from iter_log_records(self.shard_path(name))
+
+
+# ---------- MAIN ----------
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Period / region shards of the interview log.")
+    parser.add_argument("--shard-dir", default=SHARD_DIR)
+    sub = parser.add_subparsers(dest="command", required=True)
+    split_p = sub.add_parser("split", help="partition a whole log into shards")
+    split_p.add_argument("--input", default=FILE_PATH)
+    append_p = sub.add_parser("append", help="upsert records into their shards")
+    append_p.add_argument("records", help=".csv/.jsonl/.xlsx interview records")
+    get_p = sub.add_parser("get", help="print interviews by ID")
+    get_p.add_argument("ids", nargs="+")
+    export_p = sub.add_parser("export", help="write shards back into one workbook")
+    export_p.add_argument("--output", required=True,
+                          help="workbook to write (not the main log: it also holds responses)")
+    export_p.add_argument("--period")
+    export_p.add_argument("--region")
+    sub.add_parser("stats", help="list shards")
+    args = parser.parse_args(argv)
+
+    log = ShardedLog(args.shard_dir)
+
+    if args.command in ("split", "append"):
+        source = args.input if args.command == "split" else args.records
+        records = iter_log_records(source)
+        counts = log.split(records) if args.command == "split" else log.upsert(records)
+        print(f"✅ {counts['added']} added, {counts['updated']} updated; "
+              f"rewrote {len(counts['shards'])} shard(s) in {args.shard_dir}")
+        for name in counts["shards"]:
+            rows = log.shards.get(name, {}).get("rows", 0)
+            print(f"  {name}: {rows} interview(s)")
+        return 0
+
+    if args.command == "get":
+        found = log.get(args.ids)
+        for interview_id in args.ids:
+            record = found.get(interview_id)
+            if record is None:
+                print(f"{interview_id}: not found", file=sys.stderr)
+                continue
+            print(f"{interview_id}  ({log.index[interview_id]})")
+            for column in columns[1:]:
+                if record.get(column) not in (None, ""):
+                    print(f"  {column}: {record[column]}")
+        return 0 if len(found) == len(set(args.ids)) else 1
+
+    if args.command == "export":
+        os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+        count = write_interview_log(args.output, log.iter_records(args.period, args.region))
+        print(f"✅ Exported {count} interview(s) to:\n{args.output}")
+        return 0
+
+    total = 0
+    for name, meta in sorted(log.shards.items()):
+        print(f"{meta['period']:<8} {meta['region']:<12} {meta['rows']:>8}  {name}")
+        total += meta["rows"]
+    print(f"{len(log.shards)} shard(s), {total} interview(s), {len(log.index)} indexed ID(s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,332 @@
+"""Full-text index over Stakeholder_Interview_Notes.
+
+Usage:
+    python interview_notes_index.py update [--notes-dir DIR] [--template PATH]
+    python interview_notes_index.py search QUERY [--limit N]
+    python interview_notes_index.py stats
+
+`update` stream-parses `word/document.xml` of every *.docx in the notes
+folder (lxml iterparse filtered to w:p / w:t; no python-docx load) into a
+positional inverted index saved as NOTES_DIR/.notes_index.json. Only files
+whose size and mtime changed are read again, and only those whose SHA-256
+also changed are re-tokenised (across a process pool when there are many).
+"Click to type" placeholders and paragraphs copied verbatim from the
+discovery template are skipped, so a hit means the word was written into
+the notes rather than printed on every form.
+
+`search` takes bare words and "quoted phrases" and ranks matching notes by
+BM25 over phrase / term frequencies. Every word and phrase must occur.
+"""
+import argparse
+import hashlib
+import json
+import math
+import os
+import re
+import sys
+import time
+import zipfile
+
+from lxml import etree
+
+from batch_render import run_batch
+
+# ---------- CONFIG ----------
+BASE_DIR = r"C:\Users\victo\kickoff_project"
+NOTES_DIR = os.path.join(
+    BASE_DIR, "01_Phase1_Discovery_and_Scoping", "Stakeholder_Interview_Notes"
+)
+TEMPLATE_PATH = os.path.join(BASE_DIR, "UniqueEntrepreneur_Discovery_Interview_Template.docx")
+INDEX_NAME = ".notes_index.json"
+INDEX_VERSION = 1
+
+DOCUMENT_PART = "word/document.xml"
+PLACEHOLDERS = {"Click to type"}
+# Below this many changed notes, extract in-process rather than start a pool.
+POOL_THRESHOLD = 64
+
+W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+TEXT_TAGS = (W + "p", W + "t", W + "tab", W + "br")
+TOKEN_RE = re.compile(r"\w+")
+PHRASE_RE = re.compile(r'"([^"]+)"|(\S+)')
+
+# BM25 parameters
+K1 = 1.2
+B = 0.75
+
+
+# ---------- EXTRACTION ----------
+
+def iter_paragraphs(path):
+    """Yield the text of each paragraph of a .docx, streaming document.xml."""
+    with zipfile.ZipFile(path) as zf, zf.open(DOCUMENT_PART) as f:
+        parts = []
+        for _, elem in etree.iterparse(f, events=("end",), tag=TEXT_TAGS):
+            tag = elem.tag
+            if tag == W + "t":
+                if elem.text and elem.text not in PLACEHOLDERS:
+                    parts.append(elem.text)
+            elif tag == W + "p":
+                text = "".join(parts).strip()
+                parts = []
+                if text:
+                    yield text
+                elem.clear(keep_tail=True)
+            else:
+                parts.append(" ")
+
+
+def tokenize(text):
+    return TOKEN_RE.findall(text.lower())
+
+
+def extract_postings(path, boilerplate=frozenset()):
+    """Return ({term: [positions]}, token count) for one note.
+
+    Positions skip one slot between paragraphs, so phrases never match across them.
+    """
+    postings = {}
+    position = 0
+    for text in iter_paragraphs(path):
+        if text in boilerplate:
+            continue
+        for token in tokenize(text):
+            postings.setdefault(token, []).append(position)
+            position += 1
+        position += 1
+    return postings, position
+
+
+_boilerplate = frozenset()
+
+
+def _init_worker(boilerplate):
+    global _boilerplate
+    _boilerplate = boilerplate
+
+
+def _extract_job(job):
+    name, path = job
+    try:
+        return name, extract_postings(path, _boilerplate), None
+    except (zipfile.BadZipFile, KeyError, etree.XMLSyntaxError) as exc:
+        return name, None, str(exc)
+
+
+def template_boilerplate(template_path):
+    """(fingerprint, paragraph set) of the blank template; empty when there is none."""
+    if not template_path or not os.path.exists(template_path):
+        return None, frozenset()
+    return file_sha256(template_path), frozenset(iter_paragraphs(template_path))
+
+
+def file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+# ---------- INDEX ----------
+
+class NotesIndex:
+    """Positional inverted index: term -> {note name: [positions]}."""
+
+    def __init__(self, notes_dir=NOTES_DIR):
+        self.notes_dir = notes_dir
+        self.path = os.path.join(notes_dir, INDEX_NAME)
+        self.template = None
+        self.docs = {}          # name -> {size, mtime_ns, sha256, length, terms}
+        self.postings = {}      # term -> {name: [positions]}
+
+    @classmethod
+    def load(cls, notes_dir=NOTES_DIR):
+        index = cls(notes_dir)
+        try:
+            with open(index.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return index
+        if data.get("version") == INDEX_VERSION:
+            index.template = data["template"]
+            index.docs = data["docs"]
+            index.postings = data["postings"]
+        return index
+
+    def save(self):
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({
+                "version": INDEX_VERSION,
+                "template": self.template,
+                "docs": self.docs,
+                "postings": self.postings,
+            }, f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp_path, self.path)
+
+    def _remove(self, name):
+        for term in self.docs.pop(name)["terms"]:
+            docs = self.postings.get(term)
+            if docs is not None:
+                docs.pop(name, None)
+                if not docs:
+                    del self.postings[term]
+
+    def _add(self, name, meta, postings, length):
+        meta.update(length=length, terms=sorted(postings))
+        self.docs[name] = meta
+        for term, positions in postings.items():
+            self.postings.setdefault(term, {})[name] = positions
+
+    def update(self, template_path=TEMPLATE_PATH, workers=None):
+        """Bring the index in line with the notes folder; return change counts."""
+        fingerprint, boilerplate = template_boilerplate(template_path)
+        if fingerprint != self.template:
+            # Different boilerplate changes every note's tokens.
+            self.docs, self.postings, self.template = {}, {}, fingerprint
+
+        names = sorted(
+            n for n in os.listdir(self.notes_dir)
+            if n.lower().endswith(".docx") and not n.startswith("~$")
+        )
+        counts = {"indexed": 0, "touched": 0, "unchanged": 0, "removed": 0, "failed": 0}
+
+        for name in set(self.docs) - set(names):
+            self._remove(name)
+            counts["removed"] += 1
+
+        changed = {}
+        for name in names:
+            path = os.path.join(self.notes_dir, name)
+            st = os.stat(path)
+            old = self.docs.get(name)
+            if old and old["size"] == st.st_size and old["mtime_ns"] == st.st_mtime_ns:
+                counts["unchanged"] += 1
+                continue
+            sha = file_sha256(path)
+            if old and old["sha256"] == sha:
+                old.update(size=st.st_size, mtime_ns=st.st_mtime_ns)
+                counts["touched"] += 1
+                continue
+            changed[name] = (path, {"size": st.st_size, "mtime_ns": st.st_mtime_ns, "sha256": sha})
+
+        jobs = [(name, path) for name, (path, _) in changed.items()]
+        if len(jobs) >= POOL_THRESHOLD:
+            results = run_batch(_extract_job, jobs, workers=workers,
+                                initializer=_init_worker, initargs=(boilerplate,))["outputs"]
+        else:
+            _init_worker(boilerplate)
+            results = map(_extract_job, jobs)
+
+        for name, extracted, error in results:
+            if error is not None:
+                print(f"✖ {name}: {error}", file=sys.stderr)
+                counts["failed"] += 1
+                if name in self.docs:
+                    self._remove(name)
+                continue
+            if name in self.docs:
+                self._remove(name)
+            postings, length = extracted
+            self._add(name, changed[name][1], postings, length)
+            counts["indexed"] += 1
+        return counts
+
+    # ---------- SEARCH ----------
+
+    def _matches(self, tokens):
+        """{name: occurrences} of a term or phrase, by positional intersection."""
+        lists = [self.postings.get(t) for t in tokens]
+        if not all(lists):
+            return {}
+        if len(tokens) == 1:
+            return {name: len(positions) for name, positions in lists[0].items()}
+
+        names = set(lists[0]).intersection(*lists[1:])
+        hits = {}
+        for name in names:
+            starts = set(lists[0][name])
+            for offset, docs in enumerate(lists[1:], start=1):
+                starts &= {p - offset for p in docs[name]}
+                if not starts:
+                    break
+            if starts:
+                hits[name] = len(starts)
+        return hits
+
+    def search(self, query, limit=20):
+        """Rank notes containing every word / "phrase" of `query`; return [(score, name, hits)]."""
+        units = [tokenize(phrase or word) for phrase, word in PHRASE_RE.findall(query)]
+        units = [u for u in units if u]
+        if not units or not self.docs:
+            return []
+
+        n_docs = len(self.docs)
+        avg_length = sum(d["length"] for d in self.docs.values()) / n_docs or 1.0
+        scores = None
+        hits = {}
+        for unit in units:
+            matches = self._matches(unit)
+            idf = math.log(1 + (n_docs - len(matches) + 0.5) / (len(matches) + 0.5))
+            unit_scores = {}
+            for name, tf in matches.items():
+                norm = K1 * (1 - B + B * self.docs[name]["length"] / avg_length)
+                unit_scores[name] = idf * tf * (K1 + 1) / (tf + norm)
+                hits.setdefault(name, []).append(tf)
+            if scores is None:
+                scores = unit_scores
+            else:
+                scores = {n: s + unit_scores[n] for n, s in scores.items() if n in unit_scores}
+            if not scores:
+                return []
+
+        ranked = sorted(((s, n) for n, s in scores.items()), key=lambda x: (-x[0], x[1]))
+        return [(score, name, hits[name]) for score, name in ranked[:limit]]
+
+
+# ---------- MAIN ----------
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Index and search stakeholder interview notes.")
+    parser.add_argument("--notes-dir", default=NOTES_DIR)
+    sub = parser.add_subparsers(dest="command", required=True)
+    update_p = sub.add_parser("update", help="re-index new and changed notes")
+    update_p.add_argument("--template", default=TEMPLATE_PATH,
+                          help="blank template whose paragraphs are not indexed ('' to index all)")
+    update_p.add_argument("--workers", type=int, default=None)
+    search_p = sub.add_parser("search", help='rank notes matching words and "phrases"')
+    search_p.add_argument("query", nargs="+")
+    search_p.add_argument("--limit", type=int, default=20)
+    sub.add_parser("stats", help="index size")
+    args = parser.parse_args(argv)
+
+    if not os.path.isdir(args.notes_dir):
+        parser.error(f"Notes folder not found: {args.notes_dir}")
+    index = NotesIndex.load(args.notes_dir)
+
+    if args.command == "update":
+        start = time.perf_counter()
+        counts = index.update(args.template, args.workers)
+        index.save()
+        summary = ", ".join(f"{n} {k}" for k, n in counts.items())
+        print(f"Updated {index.path} in {time.perf_counter() - start:.2f}s ({summary})")
+        return 1 if counts["failed"] else 0
+
+    if args.command == "stats":
+        positions = sum(len(p) for docs in index.postings.values() for p in docs.values())
+        print(f"{len(index.docs)} notes, {len(index.postings)} terms, {positions} positions")
+        return 0
+
+    query = " ".join(args.query)
+    start = time.perf_counter()
+    results = index.search(query, args.limit)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    for score, name, hits in results:
+        print(f"{score:7.3f}  {name}  (hits: {', '.join(map(str, hits))})")
+    print(f"{len(results)} note(s) for {query!r} in {elapsed_ms:.1f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,368 @@
+"""Render the deliverables in several locales from one translation catalog.
+
+Usage:
+    python localisation.py extract                  # Locales/messages.json
+    python localisation.py pseudo [--locale en-XA]  # pseudo-locale for layout checks
+    python localisation.py compile                  # Locales/*.json -> catalog.bin
+    python localisation.py render --locales fr-FR yo-NG [--docs brd ...] [--workers N]
+
+The generators write UK English (SOURCE_LOCALE). `extract` renders every
+deliverable once in English and lists the distinct run texts (headings,
+labels, questions, "Click to type") as the source catalog. Translators
+add Locales/<locale>.json files mapping source text to translation; no
+translations ship with the repo, only the generated pseudo-locale, which
+accents and pads every string so untranslated or clipped text stands out.
+
+`compile` packs all locale files into one binary catalog: an open-addressed
+hash table of 64-bit BLAKE2 key hashes over a string blob. `render` opens it
+with mmap in each worker, so the pages are shared through the OS cache
+rather than copied per process, and a lookup is one hash plus (usually)
+one slot read. Each (deliverable, locale) job translates the w:t runs of
+the English package's body, headers and footers, sets the document
+language, and writes a deterministic package to Localised/<locale>/.
+Text missing from the catalog stays in English. Interview packs are still
+prefilled from the English template: discovery_template_cache finds the
+Interview Details cells by their English labels.
+"""
+import argparse
+import glob
+import hashlib
+import json
+import mmap
+import os
+import re
+import struct
+import sys
+import zipfile
+
+from lxml import etree
+
+from batch_render import print_report, run_batch
+from package_writer import save_package, write_parts
+
+# ---------- CONFIG ----------
+BASE_DIR = r"C:\Users\victo\kickoff_project"
+LOCALES_DIR = os.path.join(BASE_DIR, "Locales")
+OUT_DIR = os.path.join(BASE_DIR, "Localised")
+
+SOURCE_LOCALE = "en-GB"
+PSEUDO_LOCALE = "en-XA"
+MESSAGES_NAME = "messages.json"
+CATALOG_NAME = "catalog.bin"
+
+# Deliverable -> English output file name
+DELIVERABLES = {
+    "brd": "UniqueEntrepreneur_BRD_Template.docx",
+    "governance_framework": "UniqueEntrepreneur_Data_Governance_Framework.docx",
+    "governance_implementation": "UniqueEntrepreneur_Phase3_Data_Governance_Implementation.docx",
+    "architecture": "UniqueEntrepreneur_phase3_Architecture_and_ERD.docx",
+    "discovery_template": "UniqueEntrepreneur_Discovery_Interview_Template.docx",
+}
+
+W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+XML_SPACE = "{http://www.w3.org/XML/1998/namespace}space"
+TEXT_PART_RE = re.compile(r"^word/(document|header\d*|footer\d*)\.xml$")
+STYLE_PARTS = ("word/styles.xml", "word/stylesWithEffects.xml")
+# Document default language (w:docDefaults run properties)
+DEFAULT_LANG_RE = re.compile(rb'(<w:docDefaults>.*?<w:lang\b[^>]*?\bw:val=")[^"]*(")', re.S)
+LETTER_RE = re.compile(r"[^\W\d_]")
+
+CATALOG_MAGIC = b"UECATLG1"
+HEADER = struct.Struct("<8sIIII")   # magic, keys, slots, locales, locale list bytes
+EMPTY = 0xFFFFFFFF
+
+PSEUDO_CHARS = str.maketrans("aceinousyACEINOUSY", "áçéíñóúšýÁÇÉÍÑÓÚŠÝ")
+PSEUDO_PAD = 0.3  # pseudo strings grow ~30%, like most translations from English
+
+
+# ---------- CATALOG ----------
+
+def key_hash(key):
+    return int.from_bytes(hashlib.blake2b(key, digest_size=8).digest(), "little")
+
+
+def _slot_struct(n_locales):
+    # key hash, key offset, key length, then (offset, length) per locale
+    return struct.Struct("<QII" + "II" * n_locales)
+
+
+def write_catalog(path, translations):
+    """Pack {locale: {source: translation}} into a binary catalog at `path`."""
+    locales = sorted(translations)
+    keys = sorted({k for table in translations.values() for k, v in table.items() if v})
+    n_slots = 8
+    while n_slots < 2 * len(keys):
+        n_slots *= 2
+    slot = _slot_struct(len(locales))
+    locale_bytes = json.dumps(locales).encode("utf-8")
+    table_at = HEADER.size + len(locale_bytes)
+    table_at += -table_at % 8
+    blob_at = table_at + n_slots * slot.size
+
+    blob = bytearray()
+
+    def put(text):
+        data = text.encode("utf-8")
+        offset = blob_at + len(blob)
+        blob.extend(data)
+        return offset, len(data)
+
+    table = [None] * n_slots
+    for key in keys:
+        key_bytes = key.encode("utf-8")
+        h = key_hash(key_bytes)
+        i = h & (n_slots - 1)
+        while table[i] is not None:
+            i = (i + 1) & (n_slots - 1)
+        values = []
+        for locale in locales:
+            value = translations[locale].get(key)
+            values.extend(put(value) if value else (EMPTY, 0))
+        table[i] = (h, *put(key), *values)
+
+    empty = (0, EMPTY, 0) + (EMPTY, 0) * len(locales)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(HEADER.pack(CATALOG_MAGIC, len(keys), n_slots, len(locales), len(locale_bytes)))
+        f.write(locale_bytes)
+        f.write(b"\0" * (table_at - HEADER.size - len(locale_bytes)))
+        for entry in table:
+            f.write(slot.pack(*(entry or empty)))
+        f.write(blob)
+    os.replace(tmp_path, path)
+    return len(keys)
+
+
+class Catalog:
+    """Read-only, memory-mapped view of a catalog written by write_catalog."""
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.keys, self._n_slots, n_locales, locale_len = HEADER.unpack_from(self._mm, 0)
+        if magic != CATALOG_MAGIC:
+            raise ValueError(f"{path} is not a translation catalog")
+        self.locales = json.loads(self._mm[HEADER.size:HEADER.size + locale_len])
+        self._locale_index = {locale: i for i, locale in enumerate(self.locales)}
+        self._slot = _slot_struct(n_locales)
+        table_at = HEADER.size + locale_len
+        self._table_at = table_at + (-table_at % 8)
+
+    def close(self):
+        self._mm.close()
+
+    def lookup(self, text, locale):
+        """Translation of `text` in `locale`, or None."""
+        index = self._locale_index.get(locale)
+        if index is None:
+            return None
+        key = text.encode("utf-8")
+        h = key_hash(key)
+        mask = self._n_slots - 1
+        i = h & mask
+        mm, slot = self._mm, self._slot
+        while True:
+            entry = slot.unpack_from(mm, self._table_at + i * slot.size)
+            if entry[1] == EMPTY:
+                return None
+            if entry[0] == h and mm[entry[1]:entry[1] + entry[2]] == key:
+                offset, length = entry[3 + 2 * index], entry[4 + 2 * index]
+                return None if offset == EMPTY else mm[offset:offset + length].decode("utf-8")
+            i = (i + 1) & mask
+
+    def translate(self, text, locale):
+        found = self.lookup(text, locale)
+        return text if found is None else found
+
+
+def read_locale_files(locales_dir=LOCALES_DIR):
+    """{locale: {source: translation}} from every Locales/<locale>.json."""
+    translations = {}
+    for path in sorted(glob.glob(os.path.join(locales_dir, "*.json"))):
+        name = os.path.basename(path)
+        if name == MESSAGES_NAME:
+            continue
+        with open(path, encoding="utf-8") as f:
+            translations[name[:-len(".json")]] = json.load(f)
+    return translations
+
+
+def ensure_catalog(locales_dir=LOCALES_DIR):
+    """Path of the compiled catalog, recompiled when a locale file is newer."""
+    path = os.path.join(locales_dir, CATALOG_NAME)
+    sources = [p for p in glob.glob(os.path.join(locales_dir, "*.json"))
+               if os.path.basename(p) != MESSAGES_NAME]
+    if not os.path.exists(path) or any(
+            os.path.getmtime(p) > os.path.getmtime(path) for p in sources):
+        write_catalog(path, read_locale_files(locales_dir))
+    return path
+
+
+def pseudo_localise(text):
+    """Accented, padded and bracketed `text`; visibly 'translated' but readable."""
+    pad = "·" * max(1, round(len(text) * PSEUDO_PAD))
+    return f"[{text.translate(PSEUDO_CHARS)}{pad}]"
+
+
+# ---------- SOURCES ----------
+
+def render_sources(names, out_dir=None):
+    """Write the English deliverables to OUT_DIR/en-GB; return {name: path}."""
+    from generate_discovery_template import build_discovery_template
+    from render_plan import load_render_plan
+
+    out_dir = out_dir or os.path.join(OUT_DIR, SOURCE_LOCALE)
+    os.makedirs(out_dir, exist_ok=True)
+    paths = {}
+    for name in names:
+        path = os.path.join(out_dir, DELIVERABLES[name])
+        if name == "discovery_template":
+            save_package(build_discovery_template(), path)
+        else:
+            load_render_plan(name).write(path)
+        paths[name] = path
+    return paths
+
+
+def read_parts(path):
+    with zipfile.ZipFile(path) as zf:
+        return {name: zf.read(name) for name in zf.namelist()}
+
+
+def iter_run_texts(parts):
+    """Yield the text of every w:t in the body, headers and footers."""
+    for name, data in parts.items():
+        if TEXT_PART_RE.match(name):
+            for t in etree.fromstring(data).iter(W + "t"):
+                if t.text:
+                    yield t.text
+
+
+def extract_messages(paths):
+    """Sorted distinct run texts (with at least one letter) of the given packages."""
+    messages = set()
+    for path in paths:
+        messages.update(t for t in iter_run_texts(read_parts(path)) if LETTER_RE.search(t))
+    return sorted(messages)
+
+
+# ---------- LOCALISING ----------
+
+def localise_parts(parts, catalog, locale):
+    """Translate run texts and set the default language; return new parts."""
+    out = dict(parts)
+    for name, data in parts.items():
+        if TEXT_PART_RE.match(name):
+            root = etree.fromstring(data)
+            changed = False
+            for t in root.iter(W + "t"):
+                found = catalog.lookup(t.text, locale) if t.text else None
+                if found is not None:
+                    t.text = found
+                    if found != found.strip():
+                        t.set(XML_SPACE, "preserve")
+                    changed = True
+            if changed:
+                out[name] = etree.tostring(root, xml_declaration=True, encoding="UTF-8", standalone=True)
+        elif name in STYLE_PARTS:
+            out[name] = DEFAULT_LANG_RE.sub(
+                lambda m: m.group(1) + locale.encode("ascii") + m.group(2), data, count=1
+            )
+    return out
+
+
+_catalog = None
+_sources = {}
+
+
+def _init_worker(catalog_path):
+    global _catalog
+    _catalog = Catalog(catalog_path)
+
+
+def render_localised(job):
+    source_path, locale, dest = job
+    if source_path not in _sources:
+        _sources[source_path] = read_parts(source_path)
+    parts = localise_parts(_sources[source_path], _catalog, locale)
+    os.makedirs(os.path.dirname(dest), exist_ok=True)
+    tmp_path = f"{dest}.{os.getpid()}.tmp"
+    write_parts(tmp_path, parts)
+    os.replace(tmp_path, dest)
+    return dest
+
+
+# ---------- MAIN ----------
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render the deliverables in several locales.")
+    parser.add_argument("--locales-dir", default=LOCALES_DIR)
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("extract", help="write the English source strings to messages.json")
+    pseudo_p = sub.add_parser("pseudo", help="write a pseudo-locale catalog from messages.json")
+    pseudo_p.add_argument("--locale", default=PSEUDO_LOCALE)
+    sub.add_parser("compile", help="pack the locale files into catalog.bin")
+    render_p = sub.add_parser("render", help="render deliverables in each locale")
+    render_p.add_argument("--locales", nargs="+", required=True)
+    render_p.add_argument("--docs", nargs="+", choices=list(DELIVERABLES), default=list(DELIVERABLES))
+    render_p.add_argument("--out-dir", default=OUT_DIR)
+    render_p.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    os.makedirs(args.locales_dir, exist_ok=True)
+    messages_path = os.path.join(args.locales_dir, MESSAGES_NAME)
+
+    if args.command == "extract":
+        messages = extract_messages(render_sources(DELIVERABLES).values())
+        with open(messages_path, "w", encoding="utf-8") as f:
+            json.dump(messages, f, ensure_ascii=False, indent=1)
+        print(f"✅ {len(messages)} source strings written to:\n{messages_path}")
+        return 0
+
+    if args.command == "pseudo":
+        if not os.path.exists(messages_path):
+            parser.error(f"{messages_path} not found; run 'extract' first")
+        with open(messages_path, encoding="utf-8") as f:
+            messages = json.load(f)
+        path = os.path.join(args.locales_dir, f"{args.locale}.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({m: pseudo_localise(m) for m in messages}, f, ensure_ascii=False, indent=1)
+        print(f"✅ Pseudo-locale {args.locale} ({len(messages)} strings) written to:\n{path}")
+        return 0
+
+    if args.command == "compile":
+        translations = read_locale_files(args.locales_dir)
+        path = os.path.join(args.locales_dir, CATALOG_NAME)
+        keys = write_catalog(path, translations)
+        total = None
+        if os.path.exists(messages_path):
+            with open(messages_path, encoding="utf-8") as f:
+                total = set(json.load(f))
+        for locale, table in sorted(translations.items()):
+            done = sum(1 for k, v in table.items() if v and (total is None or k in total))
+            print(f"  {locale}: {done}" + (f" / {len(total)} source strings" if total else " strings"))
+        print(f"✅ {keys} keys in {len(translations)} locale(s) compiled to:\n{path}")
+        return 0
+
+    catalog_path = ensure_catalog(args.locales_dir)
+    catalog = Catalog(catalog_path)
+    missing = [loc for loc in args.locales if loc != SOURCE_LOCALE and loc not in catalog.locales]
+    catalog.close()
+    if missing:
+        parser.error(f"No catalog entries for {', '.join(missing)} in {args.locales_dir}")
+
+    sources = render_sources(args.docs, os.path.join(args.out_dir, SOURCE_LOCALE))
+    jobs = [
+        (sources[name], locale, os.path.join(args.out_dir, locale, DELIVERABLES[name]))
+        for locale in args.locales if locale != SOURCE_LOCALE
+        for name in args.docs
+    ]
+    report = run_batch(render_localised, jobs, workers=args.workers,
+                       initializer=_init_worker, initargs=(catalog_path,))
+    print_report(report, noun="doc")
+    print(f"✅ {len(args.docs)} deliverable(s) in {len(args.locales)} locale(s) written to:\n{args.out_dir}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,152 @@
+"""Deterministic save layer for .docx / .xlsx / .pptx packages.
+
+python-docx, openpyxl and python-pptx all write zip entries stamped with
+the current time, at their own fixed deflate level, and openpyxl also puts
+the save time into docProps/core.xml. `save_package` saves through the
+library, then rewrites the package entry by entry with:
+
+- fixed entry timestamps and attributes, and [Content_Types].xml first with
+  the remaining parts sorted by name;
+- dcterms:created / dcterms:modified pinned to the same fixed instant;
+- a selectable compression level: stored, fast, default or max.
+
+Unchanged inputs therefore give byte-identical outputs. The fixed instant
+is SOURCE_DATE_EPOCH when set, else 1980-01-01 (the earliest zip time).
+The compression level comes from the `compression` argument, else the
+UE_PACKAGE_COMPRESSION environment variable, else "default".
+"""
+import os
+import re
+import shutil
+import tempfile
+import time
+import zipfile
+
+COMPRESSION_LEVELS = {
+    "stored": (zipfile.ZIP_STORED, None),
+    "fast": (zipfile.ZIP_DEFLATED, 1),
+    "default": (zipfile.ZIP_DEFLATED, 6),
+    "max": (zipfile.ZIP_DEFLATED, 9),
+}
+COMPRESSION_ENV = "UE_PACKAGE_COMPRESSION"
+
+CONTENT_TYPES = "[Content_Types].xml"
+CORE_PROPS = "docProps/core.xml"
+HEAD_BYTES = 64 * 1024
+CHUNK_BYTES = 1024 * 1024
+ZIP_EPOCH = 315532800  # 1980-01-01T00:00:00Z
+
+# os.umask can only be read by setting it; do that once, at import.
+_UMASK = os.umask(0o022)
+os.umask(_UMASK)
+
+
+def _fixed_time():
+    epoch = int(os.environ.get("SOURCE_DATE_EPOCH") or ZIP_EPOCH)
+    return time.gmtime(max(epoch, ZIP_EPOCH))[:6]
+
+
+def compression_setting(compression=None):
+    """Resolve a compression name to (zip method, level)."""
+    name = (compression or os.environ.get(COMPRESSION_ENV) or "default").lower()
+    if name not in COMPRESSION_LEVELS:
+        raise ValueError(
+            f"Unknown compression {name!r}; choose from {', '.join(COMPRESSION_LEVELS)}"
+        )
+    return COMPRESSION_LEVELS[name]
+
+
+def pin_core_times(head):
+    """Set dcterms:created / dcterms:modified in core.xml bytes to the fixed instant."""
+    stamp = time.strftime("%Y-%m-%dT%H:%M:%SZ", _fixed_time() + (0, 0, 0)).encode()
+    return re.sub(
+        rb"(<dcterms:(?:created|modified)\b[^>]*>)[^<]*(</dcterms:)",
+        lambda m: m.group(1) + stamp + m.group(2),
+        head,
+    )
+
+
+def entry_order(names):
+    """[Content_Types].xml first, then the remaining part names sorted."""
+    rest = sorted(n for n in names if n != CONTENT_TYPES)
+    return ([CONTENT_TYPES] if CONTENT_TYPES in names else []) + rest
+
+
+def package_entry(name, compression=None):
+    """ZipInfo for part `name` with the fixed timestamp, attributes and level."""
+    method, level = compression_setting(compression)
+    info = zipfile.ZipInfo(name, date_time=_fixed_time())
+    info.compress_type = method
+    # ZipFile.open() takes the level from the entry, not the archive.
+    info._compresslevel = level
+    info.create_system = 0
+    info.external_attr = 0
+    return info
+
+
+def replace_output(tmp_path, path):
+    """Move a finished temp file over `path` with the mode a plain open()
+    would give a new file under the umask (mkstemp files are 0600).
+    """
+    os.chmod(tmp_path, 0o666 & ~_UMASK)
+    os.replace(tmp_path, path)
+
+
+def write_parts(dest, parts, compression=None):
+    """Write {part name: bytes} to `dest` (path or binary file) as a package
+    with the same entry order, headers and levels as normalise_package.
+    """
+    method, level = compression_setting(compression)
+    with zipfile.ZipFile(dest, "w", compression=method, compresslevel=level) as zf:
+        for name in entry_order(list(parts)):
+            with zf.open(package_entry(name, compression), "w", force_zip64=True) as f:
+                f.write(parts[name])
+
+
+def normalise_package(src, dest, compression=None, patch_head=None):
+    """Rewrite zip package `src` deterministically into `dest`.
+
+    `patch_head` optionally maps a part name to a function applied to the
+    first 64 KiB of that part (e.g. to splice an element into a sheet's
+    preamble); the rest of the part is streamed through unchanged, so
+    memory stays flat for parts of any size.
+    """
+    method, level = compression_setting(compression)
+    patch_head = dict(patch_head or {})
+
+    with zipfile.ZipFile(src) as zin, \
+            zipfile.ZipFile(dest, "w", compression=method, compresslevel=level) as zout:
+        for name in entry_order(zin.namelist()):
+            info = package_entry(name, compression)
+            with zin.open(name) as fin, zout.open(info, "w", force_zip64=True) as fout:
+                patch = patch_head.get(name)
+                if patch is not None or name == CORE_PROPS:
+                    head = fin.read(HEAD_BYTES)
+                    if name == CORE_PROPS:
+                        head = pin_core_times(head)
+                    if patch is not None:
+                        head = patch(head)
+                    fout.write(head)
+                shutil.copyfileobj(fin, fout, CHUNK_BYTES)
+
+
+def save_package(obj, path, compression=None, patch_head=None):
+    """Save a python-docx Document, openpyxl Workbook or python-pptx
+    Presentation to `path` deterministically.
+    """
+    directory = os.path.dirname(path) or "."
+    fd, tmp_path = tempfile.mkstemp(suffix=os.path.splitext(path)[1], dir=directory)
+    os.close(fd)
+    try:
+        obj.save(tmp_path)
+        out_fd, out_tmp = tempfile.mkstemp(suffix=".tmp", dir=directory)
+        os.close(out_fd)
+        try:
+            normalise_package(tmp_path, out_tmp, compression, patch_head)
+            replace_output(out_tmp, path)
+        except BaseException:
+            os.remove(out_tmp)
+            raise
+    finally:
+        os.remove(tmp_path)
+    return path
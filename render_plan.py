@@ -0,0 +1,238 @@
+"""Declarative document specs and the render plans compiled from them.
+
+The BRD, governance framework, governance implementation and architecture
+generators describe their content as data, a SPEC of blocks:
+
+    SPEC = {
+        "variables": {"org_name": ORG_NAME, "version": "1.0"},
+        "preamble": [("title", "Business Requirements Document (BRD)"),
+                     ("field", "Organisation:", "{org_name}")],
+        "sections": [
+            [("section", "1. Purpose & Background"),
+             ("text_area", "Explain the business context ...")],
+        ],
+    }
+
+Block kinds ("title", "subtitle", "spacer", "field", "meta", "section",
+"text_area", "matrix", "kv_table") map to the generator's HELPERS;
+"{name}" in any text is replaced by the tenant variable `name`. Sections
+render through section_cache.render_sections, so a SectionCache applies.
+
+`compile_plan` renders a spec once, with every variable as a marker, and
+keeps the resulting package as a RenderPlan: the finished parts plus
+word/document.xml split into literal segments around the variables.
+`RenderPlan.write` then produces a tenant's document by copying the other
+parts, compressed once per plan, and appending document.xml joined from
+the segments and escaped values -- no python-docx build and no block
+dispatch. Every part has the bytes save_package gives for the full build;
+only document.xml moves to the end of the zip. Plans are pickled
+under BASE_DIR/.render_plans, keyed on the source of the generator and
+of the modules that draw it.
+
+Variable values are written as plain run text: newlines and tabs are not
+turned into breaks, and leading / trailing spaces are not preserved.
+"""
+import importlib
+import io
+import os
+import pickle
+import re
+import sys
+import tempfile
+import time
+import zipfile
+from xml.sax.saxutils import escape
+
+import docx_base
+import docx_table_builder
+import package_writer
+from package_writer import compression_setting, package_entry, replace_output, write_parts
+from section_cache import render_sections, style_salt
+
+# ---------- CONFIG ----------
+BASE_DIR = r"C:\Users\victo\kickoff_project"
+CACHE_DIR = os.path.join(BASE_DIR, ".render_plans")
+PLAN_VERSION = 1
+
+DOCUMENT_PART = "word/document.xml"
+VARIABLE_RE = re.compile(r"\{(\w+)\}")
+
+# Documents with a SPEC, HELPERS and new_document().
+PLAN_SOURCES = {
+    "brd": "generate_brd_template",
+    "governance_framework": "generate_data_governance_framework",
+    "governance_implementation": "generate_phase3_data_governance_doc",
+    "architecture": "generate_phase3_architecture_design_doc",
+}
+
+# Private-use code point; never produced by the generators.
+_SLOT = "\ue000"
+
+
+# ---------- SPECS ----------
+
+def add_spacer(doc):
+    doc.add_paragraph()
+
+
+def substitute(value, variables):
+    """`value` with "{name}" replaced for every name in `variables`, recursively."""
+    if isinstance(value, str):
+        return VARIABLE_RE.sub(lambda m: variables.get(m.group(1), m.group(0)), value)
+    if isinstance(value, (list, tuple)):
+        return type(value)(substitute(v, variables) for v in value)
+    return value
+
+
+def spec_calls(blocks, helpers, variables):
+    """Turn (kind, *args) blocks into (helper, *args) calls."""
+    calls = []
+    for kind, *args in blocks:
+        helper = add_spacer if kind == "spacer" else helpers.get(kind)
+        if helper is None:
+            raise ValueError(f"No helper for block kind {kind!r}")
+        calls.append((helper, *substitute(args, variables)))
+    return calls
+
+
+def spec_variables(spec, variables=None):
+    """The spec's default variables overridden by the non-empty `variables`."""
+    merged = dict(spec.get("variables", {}))
+    unknown = set(variables or {}) - set(merged)
+    if unknown:
+        raise ValueError(f"Unknown variable(s): {', '.join(sorted(unknown))}")
+    merged.update((k, v) for k, v in (variables or {}).items() if v not in (None, ""))
+    return merged
+
+
+def render_spec(doc, spec, helpers, variables=None, cache=None):
+    """Append the spec's preamble and sections to `doc`; return `doc`."""
+    variables = spec_variables(spec, variables)
+    for helper, *args in spec_calls(spec.get("preamble", ()), helpers, variables):
+        helper(doc, *args)
+    sections = [spec_calls(blocks, helpers, variables) for blocks in spec["sections"]]
+    render_sections(doc, sections, cache)
+    return doc
+
+
+# ---------- RENDER PLANS ----------
+
+class RenderPlan:
+    def __init__(self, parts, segments, slots, defaults):
+        self.parts = parts            # {part name: bytes}, document.xml excluded
+        self.segments = segments      # literal document.xml around the slots
+        self.slots = slots            # variable name of each slot
+        self.defaults = defaults      # {variable: default value}
+        self._bases = {}              # (method, level) -> zip bytes of `parts`
+
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        state["_bases"] = {}
+        return state
+
+    def base_package(self, compression=None):
+        """Every part except document.xml, already compressed at `compression`."""
+        setting = compression_setting(compression)
+        if setting not in self._bases:
+            buf = io.BytesIO()
+            write_parts(buf, self.parts, compression)
+            self._bases[setting] = buf.getvalue()
+        return self._bases[setting]
+
+    def render_document(self, variables=None):
+        """Return `word/document.xml` bytes with `variables` filled in."""
+        values = {k: escape(str(v)) for k, v in self.defaults.items()}
+        values.update(
+            (k, escape(str(v))) for k, v in (variables or {}).items() if v not in (None, "")
+        )
+        out = [self.segments[0]]
+        for name, segment in zip(self.slots, self.segments[1:]):
+            out.append(values[name])
+            out.append(segment)
+        return "".join(out).encode("utf-8")
+
+    def write(self, path, variables=None, compression=None):
+        """Write the document for `variables` to `path`."""
+        unknown = set(variables or {}) - set(self.defaults)
+        if unknown:
+            raise ValueError(f"Unknown variable(s): {', '.join(sorted(unknown))}")
+        document = self.render_document(variables)
+        base = self.base_package(compression)
+        directory = os.path.dirname(path) or "."
+        fd, tmp_path = tempfile.mkstemp(suffix=".tmp", dir=directory)
+        try:
+            with os.fdopen(fd, "w+b") as fh:
+                fh.write(base)
+                fh.seek(0)
+                with zipfile.ZipFile(fh, "a") as zf:
+                    info = package_entry(DOCUMENT_PART, compression)
+                    with zf.open(info, "w", force_zip64=True) as f:
+                        f.write(document)
+            replace_output(tmp_path, path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+        return path
+
+
+def compile_plan(module):
+    """Render `module`'s SPEC once with variable markers into a RenderPlan."""
+    defaults = dict(module.SPEC.get("variables", {}))
+    names = list(defaults)
+    markers = {name: f"{_SLOT}{i}{_SLOT}" for i, name in enumerate(names)}
+    doc = render_spec(module.new_document(), module.SPEC, module.HELPERS, markers)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = package_writer.save_package(doc, os.path.join(tmp_dir, "plan.docx"), "stored")
+        with zipfile.ZipFile(path) as zf:
+            parts = {name: zf.read(name) for name in zf.namelist()}
+
+    pieces = parts.pop(DOCUMENT_PART).decode("utf-8").split(_SLOT)
+    return RenderPlan(parts, pieces[0::2], [names[int(i)] for i in pieces[1::2]], defaults)
+
+
+def plan_key(module):
+    """Hash of the generator's source and of the modules that draw it."""
+    return style_salt([module, docx_base, docx_table_builder, package_writer, sys.modules[__name__]])
+
+
+def load_render_plan(name, cache_dir=None):
+    """Return the plan for a PLAN_SOURCES name, compiling and caching it on first use."""
+    module = importlib.import_module(PLAN_SOURCES.get(name, name))
+    cache_dir = cache_dir or CACHE_DIR
+    cache_path = os.path.join(
+        cache_dir, f"{module.__name__}_{plan_key(module)[:16]}_v{PLAN_VERSION}.pickle"
+    )
+    if os.path.exists(cache_path):
+        with open(cache_path, "rb") as f:
+            return pickle.load(f)
+
+    plan = compile_plan(module)
+    os.makedirs(cache_dir, exist_ok=True)
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        pickle.dump(plan, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, cache_path)
+    return plan
+
+
+# ---------- MAIN ----------
+
+def main(argv=None):
+    names = (argv if argv is not None else sys.argv[1:]) or list(PLAN_SOURCES)
+    for name in names:
+        if name not in PLAN_SOURCES:
+            raise SystemExit(f"Unknown document: {name} (choose from {', '.join(PLAN_SOURCES)})")
+        start = time.perf_counter()
+        plan = load_render_plan(name)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        variables = ", ".join(plan.defaults) or "none"
+        print(f"{name:<26} {len(plan.slots):>2} slot(s) ({variables}) in {elapsed_ms:.0f} ms")
+    print(f"✅ Render plans cached in:\n{CACHE_DIR}")
+
+
+if __name__ == "__main__":
+    # Run the imported module so cached plans pickle as render_plan.RenderPlan,
+    # not __main__.RenderPlan, and load from every other entry point.
+    import render_plan
+    render_plan.main()
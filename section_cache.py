@@ -0,0 +1,158 @@
+"""Content-hash cache of rendered document sections.
+
+The governance and architecture generators describe each numbered section
+as a list of helper calls, e.g.
+
+    [(add_section_heading, "5. Row-Level Security Strategy"),
+     (add_text_area, "Describe how PostgreSQL RLS is applied ...")]
+
+`render_sections` runs the calls against the document. With a
+`SectionCache`, the body XML a section produced is stored under the SHA-256
+of its calls (helper names and arguments) plus a salt covering the helpers'
+source, the style constants and the python-docx version. On the next build
+an unchanged section is spliced back from that XML instead of being
+rebuilt through python-docx, so editing one section's wording re-renders
+only that section.
+
+Fragments are plain body XML, so section helpers must not add package
+parts or relationships (images, hyperlinks, comments).
+
+Each document keeps its fragments in its own folder under
+BASE_DIR/.section_cache, next to the other build caches and outside the
+deliverables. After a full build, `prune` deletes the fragments that build
+did not use, so edited sections don't leave stale entries behind.
+"""
+import copy
+import hashlib
+import inspect
+import json
+import os
+
+import docx
+from docx.oxml import parse_xml
+from lxml import etree
+
+import docx_base
+
+# ---------- CONFIG ----------
+BASE_DIR = r"C:\Users\victo\kickoff_project"
+CACHE_DIR = os.path.join(BASE_DIR, ".section_cache")
+CACHE_VERSION = 1
+
+
+def style_salt(helpers, constants=()):
+    """Hash of the helpers' source (functions or modules) and style constants.
+
+    Any edit to how a section is drawn changes the salt, and with it every key.
+    The base template is always included: fragments carry its styles.
+    """
+    digest = hashlib.sha256(f"v{CACHE_VERSION} python-docx {docx.__version__}".encode())
+    digest.update(inspect.getsource(docx_base).encode("utf-8"))
+    for helper in helpers:
+        digest.update(inspect.getsource(helper).encode("utf-8"))
+    digest.update(repr(tuple(constants)).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _call_name(helper):
+    return getattr(helper, "__qualname__", repr(helper))
+
+
+def section_key(calls, salt):
+    payload = json.dumps(
+        [[_call_name(helper), *args] for helper, *args in calls],
+        ensure_ascii=False, default=repr,
+    )
+    return hashlib.sha256(f"{salt}\n{payload}".encode("utf-8")).hexdigest()
+
+
+class SectionCache:
+    """Rendered section fragments on disk (and in memory for this process)."""
+
+    def __init__(self, cache_dir, salt):
+        self.cache_dir = cache_dir
+        self.salt = salt
+        self._memory = {}
+        self._used = set()
+        self.hits = 0
+        self.misses = 0
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.xml")
+
+    def get(self, key):
+        self._used.add(key)
+        xml = self._memory.get(key)
+        if xml is None:
+            try:
+                with open(self._path(key), "rb") as f:
+                    xml = f.read()
+            except FileNotFoundError:
+                return None
+            self._memory[key] = xml
+        return xml
+
+    def put(self, key, xml):
+        self._used.add(key)
+        self._memory[key] = xml
+        os.makedirs(self.cache_dir, exist_ok=True)
+        tmp_path = f"{self._path(key)}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(xml)
+        os.replace(tmp_path, self._path(key))
+
+    def prune(self):
+        """Delete stored fragments this cache has not used; return how many.
+
+        Only call after a build that rendered every section of the document.
+        """
+        try:
+            names = os.listdir(self.cache_dir)
+        except FileNotFoundError:
+            return 0
+        removed = 0
+        for name in names:
+            key, ext = os.path.splitext(name)
+            if ext == ".xml" and key not in self._used:
+                try:
+                    os.remove(os.path.join(self.cache_dir, name))
+                    removed += 1
+                except FileNotFoundError:
+                    pass
+        return removed
+
+
+def _run_calls(doc, calls):
+    for helper, *args in calls:
+        helper(doc, *args)
+
+
+def render_sections(doc, sections, cache=None):
+    """Append each section (a list of (helper, *args) calls) to `doc`.
+
+    Without a cache the calls simply run. With one, cached sections are
+    spliced in from their stored XML and the rest are rendered and stored.
+    """
+    body = doc.element.body
+    sect_pr = body.sectPr
+    for calls in sections:
+        if cache is None:
+            _run_calls(doc, calls)
+            continue
+
+        key = section_key(calls, cache.salt)
+        xml = cache.get(key)
+        if xml is not None:
+            cache.hits += 1
+            for child in parse_xml(xml):
+                sect_pr.addprevious(child)
+            continue
+
+        cache.misses += 1
+        before = len(body)
+        _run_calls(doc, calls)
+        # New block content sits between the previous content and w:sectPr.
+        # Copies under one w:body declare the document's namespaces once.
+        fragment = etree.Element(body.tag, nsmap=body.nsmap)
+        fragment.extend(copy.deepcopy(el) for el in body[before - 1:len(body) - 1])
+        cache.put(key, etree.tostring(fragment))
@@ -0,0 +1,153 @@
+"""Fan one pass over a stream of records out to several sinks at once.
+
+Each sink runs in its own process and reads batches from a bounded queue,
+so a slow sink applies back-pressure instead of letting the producer
+buffer the whole stream, and total wall time tracks the slowest sink
+rather than the sum of all of them.
+"""
+import multiprocessing
+import os
+import queue
+import time
+import traceback
+
+BATCH_SIZE = 500
+QUEUE_BATCHES = 8
+PUT_TIMEOUT = 1.0
+ABORT_TIMEOUT = 10.0
+_ABORT = "abort"
+
+
+class StreamAborted(Exception):
+    """Raised inside a sink when the producer's record stream failed."""
+
+
+def _iter_batches(q):
+    while True:
+        batch = q.get()
+        if batch is None:
+            return
+        if batch == _ABORT:
+            raise StreamAborted("the record stream failed")
+        yield from batch
+
+
+def _sink_main(name, sink, args, q, results):
+    """Worker entry point: run `sink(records, *args)` over the queued batches."""
+    start = time.perf_counter()
+    try:
+        output = sink(_iter_batches(q), *args)
+    except BaseException:
+        results.put((name, os.getpid(), time.perf_counter() - start, None, traceback.format_exc()))
+        return
+    results.put((name, os.getpid(), time.perf_counter() - start, output, None))
+
+
+def _put(q, item, proc):
+    """Block on a full queue only while its consumer is still alive."""
+    while True:
+        try:
+            q.put(item, timeout=PUT_TIMEOUT)
+            return True
+        except queue.Full:
+            if not proc.is_alive():
+                return False
+
+
+def _collect_results(results, workers, start):
+    """Wait for each sink's result; a sink whose process died without
+    reporting (killed, out of memory) is recorded as failed, not waited on.
+    """
+    sinks = {}
+    pending = dict(workers)
+    while pending:
+        try:
+            name, pid, seconds, output, error = results.get(timeout=PUT_TIMEOUT)
+        except queue.Empty:
+            dead = [name for name, (proc, _) in pending.items() if not proc.is_alive()]
+            if not dead:
+                continue
+            # A sink may report just before exiting; give its result a last chance.
+            try:
+                name, pid, seconds, output, error = results.get(timeout=PUT_TIMEOUT)
+            except queue.Empty:
+                for name in dead:
+                    proc = pending.pop(name)[0]
+                    sinks[name] = {
+                        "pid": proc.pid, "seconds": time.perf_counter() - start, "output": None,
+                        "error": f"sink process exited with code {proc.exitcode} without reporting",
+                    }
+                continue
+        pending.pop(name, None)
+        sinks[name] = {"pid": pid, "seconds": seconds, "output": output, "error": error}
+    return sinks
+
+
+def run_sinks(records, sinks, batch_size=BATCH_SIZE, queue_batches=QUEUE_BATCHES):
+    """Feed `records` once to every sink in `sinks`; return a timing report.
+
+    `sinks` maps a name to (sink, args). `sink` must be a module-level
+    function taking an iterator of records followed by `args`; whatever it
+    returns (typically the path it wrote) is reported as its output. A sink
+    that fails stops receiving records; the others run to completion.
+    """
+    ctx = multiprocessing.get_context()
+    results = ctx.Queue()
+    workers = {}
+    for name, (sink, args) in sinks.items():
+        q = ctx.Queue(maxsize=queue_batches)
+        proc = ctx.Process(target=_sink_main, args=(name, sink, tuple(args), q, results))
+        proc.start()
+        workers[name] = (proc, q)
+
+    start = time.perf_counter()
+    live = dict(workers)
+    count = 0
+    batch = []
+
+    def flush(item):
+        for name, (proc, q) in list(live.items()):
+            if not _put(q, item, proc):
+                # Nobody will drain this queue; don't wait on it at exit.
+                q.cancel_join_thread()
+                del live[name]
+
+    try:
+        for record in records:
+            batch.append(record)
+            count += 1
+            if len(batch) >= batch_size:
+                flush(batch)
+                batch = []
+        if batch:
+            flush(batch)
+    except BaseException:
+        # The stream itself failed (e.g. a bad input row): stop every sink,
+        # letting each one discard its partial output before it exits.
+        for proc, q in live.values():
+            _put(q, _ABORT, proc)
+        for proc, q in workers.values():
+            q.cancel_join_thread()
+            proc.join(ABORT_TIMEOUT)
+            if proc.is_alive():
+                proc.terminate()
+                proc.join()
+        raise
+    flush(None)
+
+    report = {"records": count, "sinks": _collect_results(results, workers, start)}
+    for proc, _ in workers.values():
+        proc.join()
+    report["wall"] = time.perf_counter() - start
+    return report
+
+
+def print_sink_report(report, noun="record"):
+    busiest = max((s["seconds"] for s in report["sinks"].values()), default=0.0)
+    print(
+        f"Streamed {report['records']} {noun}s to {len(report['sinks'])} sink(s) "
+        f"in {report['wall']:.2f}s (slowest sink {busiest:.2f}s)"
+    )
+    for name, stats in sorted(report["sinks"].items()):
+        status = "failed" if stats["error"] else stats["output"]
+        print(f"  {name:<6} {stats['seconds']:>7.2f}s  {status}")
@@ -0,0 +1,144 @@
+"""Stream body XML of a .docx straight into the zip entry.
+
+python-docx keeps the whole of word/document.xml as an lxml tree until
+save, so a 100k-row table costs memory in proportion to its rows (several
+times over, once the tree is serialised). `StreamingDocxWriter` takes a
+small python-docx "shell" document that already carries the styles,
+header / footer and any opening content, and writes the rest of the body
+through a deflate stream as it is produced:
+
+    doc = build_shell()                      # python-docx, as usual
+    with StreamingDocxWriter(doc, path) as out:
+        out.paragraph("User Stories", HEADING_RPR)
+        out.table(headers, rows)             # rows may be a generator
+
+Peak memory is the shell plus one write buffer, whatever the row count.
+The package is written with the same fixed timestamps, entry order and
+compression levels as package_writer.save_package, to a temp file that
+replaces `path` only on a clean close.
+"""
+import io
+import os
+import tempfile
+import zipfile
+
+from docx.shared import Emu
+
+from docx_table_builder import LIGHT_GREY, iter_table_xml, paragraph_xml
+from package_writer import (
+    CORE_PROPS, compression_setting, entry_order, package_entry, pin_core_times,
+    replace_output,
+)
+
+DOCUMENT_PART = "word/document.xml"
+BUFFER_CHARS = 256 * 1024
+
+
+def _split_document(xml):
+    """Split document.xml bytes into (everything up to the body's sectPr, the rest)."""
+    cut = xml.rfind(b"<w:sectPr")
+    if cut == -1:
+        cut = xml.rfind(b"</w:body>")
+    if cut == -1:
+        raise ValueError(f"{DOCUMENT_PART} has no w:body")
+    return xml[:cut], xml[cut:]
+
+
+class StreamingDocxWriter:
+    """Append paragraphs and tables to a python-docx shell without building them in memory."""
+
+    def __init__(self, doc, path, compression=None):
+        self.path = path
+        self.compression = compression
+        self._block_width = doc._block_width
+
+        shell = io.BytesIO()
+        doc.save(shell)
+        self._shell = zipfile.ZipFile(shell)
+        names = entry_order(self._shell.namelist())
+        at = names.index(DOCUMENT_PART)
+        self._before, self._after = names[:at], names[at + 1:]
+        head, self._tail = _split_document(self._shell.read(DOCUMENT_PART))
+
+        directory = os.path.dirname(path) or "."
+        fd, self._tmp_path = tempfile.mkstemp(suffix=".tmp", dir=directory)
+        os.close(fd)
+        method, level = compression_setting(compression)
+        self._zip = zipfile.ZipFile(self._tmp_path, "w", compression=method, compresslevel=level)
+        for name in self._before:
+            self._copy_part(name)
+        self._body = self._zip.open(package_entry(DOCUMENT_PART, compression), "w", force_zip64=True)
+        self._body.write(head)
+        self._buffer = []
+        self._buffered = 0
+
+    def _copy_part(self, name):
+        data = self._shell.read(name)
+        if name == CORE_PROPS:
+            data = pin_core_times(data)
+        # Same entry headers as normalise_package, so output is byte-identical.
+        with self._zip.open(package_entry(name, self.compression), "w", force_zip64=True) as f:
+            f.write(data)
+
+    # ---------- BODY ----------
+
+    def write(self, xml):
+        """Append a raw body XML fragment (a `w:p`, `w:tbl`, ...)."""
+        self._buffer.append(xml)
+        self._buffered += len(xml)
+        if self._buffered >= BUFFER_CHARS:
+            self.flush()
+
+    def flush(self):
+        if self._buffer:
+            self._body.write("".join(self._buffer).encode("utf-8"))
+            self._buffer = []
+            self._buffered = 0
+
+    def paragraph(self, text="", rpr="", align=None):
+        self.write(paragraph_xml(text, rpr, align))
+
+    def table(self, headers, rows, header_rpr="", body_rprs=("",), body_fill=LIGHT_GREY):
+        """Stream a header + body table; same XML and column widths as add_bulk_table."""
+        col_width = Emu(self._block_width // len(headers)).twips
+        for xml in iter_table_xml(headers, rows, col_width, header_rpr, body_rprs, body_fill,
+                                  standalone=False):
+            self.write(xml)
+
+    # ---------- FINISH ----------
+
+    def close(self):
+        """Finish the body and the remaining parts, then move the file into place."""
+        try:
+            self.flush()
+            self._body.write(self._tail)
+            self._body.close()
+            for name in self._after:
+                self._copy_part(name)
+            self._zip.close()
+            self._shell.close()
+            replace_output(self._tmp_path, self.path)
+        except BaseException:
+            self.abort()
+            raise
+        return self.path
+
+    def abort(self):
+        """Drop the partial package; `path` is left untouched."""
+        for stream in (self._body, self._zip, self._shell):
+            try:
+                stream.close()
+            except Exception:
+                pass
+        if os.path.exists(self._tmp_path):
+            os.remove(self._tmp_path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+        return False
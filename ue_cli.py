@@ -0,0 +1,81 @@
+"""Single entry point for the generator scripts.
+
+Usage:
+    python ue_cli.py list
+    python ue_cli.py build [TARGET ...] [build.py options]
+    python ue_cli.py TARGET [script options]
+
+`build` is build.py (incremental, parallel, subprocess per target). Naming a
+target runs that generator's main() in this process. Generators are only
+imported when they run, so `list` and `build --dry-run` never pay for
+python-docx, openpyxl or python-pptx; benchmark_suite.py measures that
+cold start against COLD_START_BUDGET_S.
+"""
+import importlib
+import sys
+
+import build
+
+# ---------- REGISTRY ----------
+
+# Script-backed commands that are not build targets.
+EXTRA_COMMANDS = {
+    "tenant_brds": "generate_brd_batch",
+    "kickoff": "generate_kickoff",
+    "kickoff_decks": "generate_kickoff_batch",
+    "store": "artifact_store",
+    "interview_analytics": "interview_log_analytics",
+    "notes_index": "interview_notes_index",
+    "ingest_forms": "ingest_interview_forms",
+    "log_shards": "interview_log_shards",
+    "render_plans": "render_plan",
+    "localise": "localisation",
+    "compact": "html_export",
+    "docgen": "docgen_service",
+    "benchmark": "benchmark_suite",
+}
+
+COMMANDS = {name: target["script"][:-3] for name, target in build.TARGETS.items()}
+COMMANDS.update(EXTRA_COMMANDS)
+
+COLD_START_BUDGET_S = 0.5
+
+
+def run_command(name, args):
+    """Import the module behind `name` and run its main() with `args`."""
+    module = importlib.import_module(COMMANDS[name])
+    sys.argv = [module.__file__, *args]
+    result = module.main()
+    return result if isinstance(result, int) else 0
+
+
+def print_commands():
+    for name, module in COMMANDS.items():
+        deps = ", ".join(build.TARGETS.get(name, {}).get("deps", [])) or "-"
+        print(f"{name:<28} {module + '.py':<45} deps: {deps}")
+
+
+# ---------- MAIN ----------
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else list(argv)
+    if not argv or argv[0] in ("-h", "--help"):
+        print(__doc__.strip())
+        print()
+        print_commands()
+        return 0
+
+    command, args = argv[0], argv[1:]
+    if command == "list":
+        print_commands()
+        return 0
+    if command == "build":
+        return build.main(args)
+    if command not in COMMANDS:
+        print(f"Unknown command: {command} (see 'python ue_cli.py list')", file=sys.stderr)
+        return 2
+    return run_command(command, args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())